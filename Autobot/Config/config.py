@@ -1,12 +1,41 @@
 import os
+from typing import Optional
 from dataclasses import dataclass
-from config.secrets import OPENAI_API_KEY, GEMINI_API_KEY, DEEPSEEK_API_KEY
+
+def load_secret(name: str) -> str:
+    """
+    Returns a secret from the environment, or else from config/secrets.py.
+    
+    The secrets module is imported here, on first use, so commands that never call an LLM
+    work without it.
+    """
+    value = os.getenv(name)
+    if value:
+        return value
+    try:
+        from config import secrets
+    except ImportError:
+        return ""
+    return getattr(secrets, name, "") or ""
 
 @dataclass
 class ModelConfig:
     name: str
     api_url: str
-    api_key: str
+    api_key: Optional[str] = None
+    # Client-side rate limit (requests per second, None for unlimited) and the burst it allows.
+    requests_per_second: Optional[float] = None
+    burst: int = 1
+    # Name of the secret holding the API key, loaded when api_key is not set.
+    api_key_secret: Optional[str] = None
+    
+    def resolve_api_key(self) -> str:
+        """
+        Returns the API key, loading it from the secrets on first use.
+        """
+        if self.api_key is None:
+            self.api_key = load_secret(self.api_key_secret) if self.api_key_secret else ""
+        return self.api_key
 
 class ModelType:
     CHATGPT = 'chatgpt'
@@ -18,17 +47,17 @@ MODEL_CONFIGS = {
     ModelType.CHATGPT: ModelConfig(
         name="ChatGPT",
         api_url="https://api.openai.com/v1/...",  # Replace with the actual endpoint if needed
-        api_key= OPENAI_API_KEY
+        api_key_secret="OPENAI_API_KEY"
     ),
     ModelType.GEMINI: ModelConfig(
         name="Gemini",
         api_url="https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key=GEMINI_API_KEY",  # Example endpoint; update as required
-        api_key= GEMINI_API_KEY
+        api_key_secret="GEMINI_API_KEY"
     ),
     ModelType.DEEPSEEK: ModelConfig(
         name="Deepseek",
         api_url="https://api.deepseek.ai/...",  # Placeholder endpoint; update as required
-        api_key= DEEPSEEK_API_KEY
+        api_key_secret="DEEPSEEK_API_KEY"
     ),
 }
 
@@ -42,19 +71,27 @@ def get_model_config(model_type: str = None) -> ModelConfig:
     """
     Retrieve the configuration for the chosen model.
     
-    If model_type is None, prompt the user to choose a model.
+    If model_type is None, the AUTOBOT_MODEL environment variable or else DEFAULT_MODEL is used;
+    unknown model types also fall back to DEFAULT_MODEL. Never prompts, so it can be scripted.
     Returns a ModelConfig object.
     """
-    if model_type is None:
-        print("Select a model:")
-        for i, key in enumerate(MODEL_CONFIGS.keys(), start=1):
-            print(f"{i}. {MODEL_CONFIGS[key].name}")
-        choice = input("Enter the number corresponding to your choice: ").strip()
-        try:
-            index = int(choice) - 1
-            model_type = list(MODEL_CONFIGS.keys())[index]
-        except (ValueError, IndexError):
-            print("Invalid selection. Using default model.")
-            model_type = DEFAULT_MODEL
-
+    model_type = model_type or os.getenv('AUTOBOT_MODEL') or DEFAULT_MODEL
     return MODEL_CONFIGS.get(model_type, MODEL_CONFIGS[DEFAULT_MODEL])
+
+def choose_model_config() -> ModelConfig:
+    """
+    Prompts the user to choose a model and returns its configuration.
+    """
+    print("Select a model:")
+    for i, key in enumerate(MODEL_CONFIGS.keys(), start=1):
+        print(f"{i}. {MODEL_CONFIGS[key].name}")
+    choice = input("Enter the number corresponding to your choice: ").strip()
+    try:
+        index = int(choice) - 1
+        if index < 0:
+            raise IndexError(index)
+        model_type = list(MODEL_CONFIGS.keys())[index]
+    except (ValueError, IndexError):
+        print("Invalid selection. Using default model.")
+        model_type = DEFAULT_MODEL
+    return MODEL_CONFIGS[model_type]
@@ -0,0 +1,107 @@
+"""
+Module: corpus.py
+Purpose: Synthetic inputs for the benchmarks: resumes as text and PDF, job pages as HTML, and job
+         criteria text, each at several sizes.
+
+Everything is generated from a seeded random.Random, so a given seed and size always produce the
+same corpus and results can be compared across runs and against stored baselines.
+"""
+
+import random
+from typing import Dict, List
+
+FILLER_WORDS = (
+    "designed built shipped scalable services team lead python java cloud data pipeline "
+    "stakeholders improved latency reduced costs mentored engineers migrated platform"
+).split()
+
+WORDS = ("python backend services team design build scalable cloud data platform kubernetes "
+         "experience customers product engineering remote benefits salary growth").split()
+
+# Parameters of each corpus size: resume filler lines, resume PDF pages and job page sections.
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {"resume_lines": 40, "pdf_pages": 1, "page_sections": 3},
+    "medium": {"resume_lines": 160, "pdf_pages": 4, "page_sections": 12},
+    "large": {"resume_lines": 640, "pdf_pages": 16, "page_sections": 48},
+}
+
+def build_pdf(pages: List[List[str]]) -> bytes:
+    """
+    Builds a minimal PDF with one text line per entry of each page's list of lines.
+    """
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        escaped = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in lines]
+        stream = "BT /F1 11 Tf 14 TL 72 720 Td " + " ".join(f"({line}) Tj T*" for line in escaped) + " ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out.encode("latin-1")))
+        out += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(out.encode("latin-1"))
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return out.encode("latin-1")
+
+def synthetic_resume(rng: random.Random, lines: int = 60) -> str:
+    """
+    Builds a resume-like text with labelled fields scattered among filler lines.
+    """
+    body = [" ".join(rng.choices(FILLER_WORDS, k=12)) for _ in range(lines)]
+    labelled = [
+        f"Name: Candidate {rng.randint(1, 10**6)}",
+        f"Email: candidate{rng.randint(1, 10**6)}@example.com",
+        f"Phone: +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        "Location: Berlin, Germany",
+        "Skills: Python, SQL, Docker, Kubernetes",
+        "Master of Science in Data Science",
+        f"Experience: Jan {rng.randint(2010, 2020)} - Mar {rng.randint(2021, 2024)}",
+        "Portfolio: https://example.dev/candidate",
+    ]
+    for line in labelled:
+        body.insert(rng.randint(0, len(body)), line)
+    return "\n".join(body)
+
+def synthetic_resume_pdf(rng: random.Random, pages: int = 1, lines_per_page: int = 40) -> bytes:
+    """
+    Builds a resume PDF of the given number of pages. The labelled fields are on the first page,
+    like the contact details of a real resume, and the other pages hold filler lines.
+    """
+    first_page = synthetic_resume(rng, lines=lines_per_page - 8).split("\n")
+    filler = [" ".join(rng.choices(FILLER_WORDS, k=12)) for _ in range((pages - 1) * lines_per_page)]
+    return build_pdf([first_page] + [filler[start:start + lines_per_page] for start in range(0, len(filler), lines_per_page)])
+
+def synthetic_page(rng: random.Random, sections: int = 6) -> str:
+    """
+    Builds a job page with head scripts, navigation, a posting body, related jobs and a footer.
+    """
+    def sentence(words: int = 14) -> str:
+        return " ".join(rng.choices(WORDS, k=words)).capitalize() + "."
+    scripts = "".join(f"<script>window.d{i} = {{a: 1 < 2, b: '{sentence()}'}};</script>" for i in range(8))
+    styles = "<style>" + " ".join(f".c{i} {{ margin: {i}px; }}" for i in range(200)) + "</style>"
+    nav = "".join(f'<li><a href="/c/{i}">{sentence(3)}</a></li>' for i in range(40))
+    body = "".join(f"<h3>{sentence(3)}</h3><ul>" + "".join(f"<li>{sentence()}</li>" for _ in range(8)) + "</ul>"
+                   f"<p>{sentence(40)} &amp; {sentence(20)}</p>" for _ in range(sections))
+    related = "".join(f'<div class="card"><a href="/j/{i}">{sentence(4)}</a><span>{sentence(6)}</span></div>' for i in range(30))
+    return (f"<!DOCTYPE html><html><head><title>{sentence(4)}</title>{styles}{scripts}</head><body>"
+            f"<nav><ul>{nav}</ul></nav><noscript><p>Enable JavaScript</p></noscript>"
+            f"<main><h1>{sentence(3)}</h1>{body}</main><aside>{related}</aside>"
+            f"<footer><p>{sentence(30)}</p></footer></body></html>")
+
+def synthetic_criteria(rng: random.Random, sections: int = 6) -> str:
+    """
+    Builds qualifying criteria text such as an LLM extracts from a job page.
+    """
+    lines = []
+    for _ in range(sections):
+        lines.append(" ".join(rng.choices(WORDS + FILLER_WORDS, k=10)).capitalize() + ".")
+        lines.append("Experience with " + ", ".join(rng.sample(FILLER_WORDS, 4)) + ".")
+    return "\n".join(lines)
@@ -0,0 +1,168 @@
+"""
+Module: harness.py
+Purpose: Runs benchmark cases, summarizes their latency, throughput and memory, and compares the
+         results with stored baselines.
+
+Every input is timed separately with perf_counter(). The timings give latency percentiles, while
+throughput is based on the total time. Peak memory is measured in a separate, untimed pass under
+tracemalloc, which slows Python code down considerably. It is the largest amount allocated
+during any single call, above what was allocated before that call.
+
+Baselines are JSON files mapping "name[size]" to a result. A case regresses when its median
+latency or peak memory exceeds the baseline by more than the tolerance. Small absolute
+differences are ignored, because timer and allocator noise dominates there.
+"""
+
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Sequence
+
+# Differences below these never count as regressions.
+MIN_LATENCY_DELTA_MS = 0.05
+MIN_MEMORY_DELTA_KB = 64.0
+
+@dataclass
+class BenchResult:
+    """
+    The summary of one benchmark case at one corpus size.
+
+    Attributes:
+        name (str): Case name.
+        size (str): Corpus size.
+        calls (int): Timed calls (inputs times repeats).
+        input_mb (float): Total size of one pass over the inputs, in MB.
+        p50_ms, p95_ms, p99_ms (float): Latency percentiles of one call.
+        calls_per_s (float): Throughput in calls per second.
+        mb_per_s (float): Throughput in MB of input per second.
+        peak_kb (float): Peak memory allocated by one call.
+    """
+    name: str
+    size: str
+    calls: int
+    input_mb: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    calls_per_s: float
+    mb_per_s: float
+    peak_kb: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+def percentile(ordered: Sequence[float], p: float) -> float:
+    """
+    Returns the p-th percentile (0-100) of sorted values by the nearest-rank method, or 0.0 without data.
+    """
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+def peak_memory_kb(function: Callable[[object], object], inputs: Sequence[object]) -> float:
+    """
+    Returns the largest memory allocation peak of a single call over the inputs, in KB.
+    """
+    tracemalloc.start()
+    try:
+        peak = 0
+        for item in inputs:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            function(item)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+def run_case(name: str, size: str, function: Callable[[object], object], inputs: Sequence[object],
+             input_bytes: int, repeats: int = 3, warmup: int = 1) -> BenchResult:
+    """
+    Times a function on every input and measures its peak memory.
+
+    Args:
+        name (str): Case name.
+        size (str): Corpus size.
+        function (Callable): Called once per input.
+        inputs (Sequence): The corpus.
+        input_bytes (int): Total size of the inputs, for MB/s.
+        repeats (int): Timed passes over the inputs.
+        warmup (int): Untimed calls before timing, to fill caches and import lazily loaded code.
+
+    Returns:
+        BenchResult: The summary.
+    """
+    for item in list(inputs)[:warmup]:
+        function(item)
+    latencies = []
+    for _ in range(repeats):
+        for item in inputs:
+            start = time.perf_counter()
+            function(item)
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    total = sum(latencies) or float("inf")
+    input_mb = input_bytes / 1e6
+    return BenchResult(
+        name=name,
+        size=size,
+        calls=len(latencies),
+        input_mb=round(input_mb, 4),
+        p50_ms=round(percentile(latencies, 50) * 1000, 4),
+        p95_ms=round(percentile(latencies, 95) * 1000, 4),
+        p99_ms=round(percentile(latencies, 99) * 1000, 4),
+        calls_per_s=round(len(latencies) / total, 2),
+        mb_per_s=round(input_mb * repeats / total, 3),
+        peak_kb=round(peak_memory_kb(function, inputs), 1),
+    )
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    """
+    Reads a baseline file; a missing file is an empty baseline.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(path: str, results: List[BenchResult], baseline: Dict[str, dict] = None) -> None:
+    """
+    Writes results to a baseline file, keeping entries of cases that were not run.
+    """
+    merged = dict(baseline or {})
+    merged.update({result.key: asdict(result) for result in results})
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(dict(sorted(merged.items())), file, indent=2)
+        file.write("\n")
+
+def compare(results: List[BenchResult], baseline: Dict[str, dict], tolerance: float = 0.25,
+            memory_tolerance: float = 0.25) -> List[str]:
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (List[BenchResult]): The new results.
+        baseline (Dict[str, dict]): Baseline results by key.
+        tolerance (float): Allowed relative increase of the median latency.
+        memory_tolerance (float): Allowed relative increase of the peak memory.
+
+    Returns:
+        List[str]: One message per regression; empty if there is none.
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.key)
+        if base is None:
+            continue
+        limit = base["p50_ms"] * (1 + tolerance)
+        if result.p50_ms > limit and result.p50_ms - base["p50_ms"] > MIN_LATENCY_DELTA_MS:
+            regressions.append(f"{result.key}: median latency {result.p50_ms:.3f} ms > "
+                               f"{base['p50_ms']:.3f} ms baseline (+{tolerance:.0%} allowed)")
+        limit = base["peak_kb"] * (1 + memory_tolerance)
+        if result.peak_kb > limit and result.peak_kb - base["peak_kb"] > MIN_MEMORY_DELTA_KB:
+            regressions.append(f"{result.key}: peak memory {result.peak_kb:.0f} KB > "
+                               f"{base['peak_kb']:.0f} KB baseline (+{memory_tolerance:.0%} allowed)")
+    return regressions
@@ -0,0 +1,252 @@
+"""
+Module: suite.py
+Purpose: The Autobot benchmark suite: micro-benchmarks of the hot paths and an end-to-end run with
+         a stubbed LLM, checked against stored baselines.
+
+Cases:
+    ats_evaluate            ATSEvaluator.evaluate() on a resume and job criteria text.
+    resume_extract_text     ResumeParser.extract_text() on a PDF.
+    resume_parse_text       ResumeParser.parse_text() on a PDF (streams pages until the fields are found).
+    jd_extract_text         JobDescriptionExtractor.extract_text() with the streaming backend.
+    jd_extract_text_bs4     The same with the BeautifulSoup backend.
+    end_to_end              Parse a resume PDF, fetch a job page from a local server, extract its main
+                            content, get the job details from a stub LLM endpoint and score the resume.
+
+Each case runs on a synthetic corpus at every requested size (see benchmarks.corpus.SIZES). The
+suite exits with status 1 and prints every regression when a result is worse than the baseline.
+Every timed pass goes over the same inputs, so the cases score resumes with an unmemoized
+TextNormalizer; otherwise all calls after the warmup would only measure cache hits.
+
+Usage (from the Autobot directory):
+    python -m benchmarks.suite                                  # small and medium, compared with the baseline
+    python -m benchmarks.suite --sizes large --cases ats_evaluate,jd_extract_text
+    python -m benchmarks.suite --update-baseline                # record the current results as the baseline
+"""
+
+import os
+import sys
+import json
+import random
+import logging
+import argparse
+import tempfile
+import threading
+from contextlib import ExitStack
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Sequence, Tuple
+from benchmarks.corpus import SIZES, synthetic_criteria, synthetic_page, synthetic_resume, synthetic_resume_pdf
+from benchmarks.harness import BenchResult, compare, load_baseline, run_case, save_baseline
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = ("small", "medium")
+STUB_MODEL = "bench-stub"
+
+# A case turns (rng, size parameters, corpus count, scratch directory, exit stack for its cleanup)
+# into the function to time, its inputs and their total size in bytes.
+Case = Callable[[random.Random, Dict[str, int], int, str, ExitStack],
+                Tuple[Callable[[object], object], List[object], int]]
+
+class StubSite:
+    """
+    A local HTTP server with job pages under /job/<n> and an LLM completion endpoint at /complete.
+    """
+
+    def __init__(self, pages: Sequence[str], completion: str):
+        body = json.dumps({"choices": [{"text": completion}]}).encode("utf-8")
+        encoded = [page.encode("utf-8") for page in pages]
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send each response in one write, without Nagle delays, so the stub adds no latency of its own.
+            wbufsize = 64 * 1024
+            disable_nagle_algorithm = True
+
+            def _reply(self, status: int, content_type: str, data: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                try:
+                    self._reply(200, "text/html; charset=utf-8", encoded[int(self.path.rsplit("/", 1)[1])])
+                except (ValueError, IndexError):
+                    self._reply(404, "text/plain", b"not found")
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self._reply(200, "application/json", body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+def write_pdfs(rng: random.Random, params: Dict[str, int], count: int, directory: str) -> Tuple[List[str], int]:
+    paths, total = [], 0
+    for index in range(count):
+        data = synthetic_resume_pdf(rng, pages=params["pdf_pages"])
+        path = os.path.join(directory, f"resume_{params['pdf_pages']}p_{index}.pdf")
+        with open(path, "wb") as file:
+            file.write(data)
+        paths.append(path)
+        total += len(data)
+    return paths, total
+
+def uncached_normalizer():
+    """
+    Returns a TextNormalizer like the default one but without its memo cache.
+    """
+    from src.text_pipeline import TextNormalizer
+    return TextNormalizer(cache_size=0)
+
+def ats_evaluate_case(rng, params, count, directory, stack):
+    from src.ats_evaluator import ATSEvaluator
+    pairs = [(synthetic_resume(rng, params["resume_lines"]), synthetic_criteria(rng, params["page_sections"]))
+             for _ in range(count)]
+    normalizer = uncached_normalizer()
+    return (lambda pair: ATSEvaluator(*pair, normalizer=normalizer).evaluate()), pairs, \
+        sum(len(a) + len(b) for a, b in pairs)
+
+def resume_extract_text_case(rng, params, count, directory, stack):
+    from src.resume_parser import ResumeParser
+    paths, total = write_pdfs(rng, params, count, directory)
+    return (lambda path: ResumeParser(path).extract_text()), paths, total
+
+def resume_parse_text_case(rng, params, count, directory, stack):
+    from src.resume_parser import ResumeParser
+    paths, total = write_pdfs(rng, params, count, directory)
+    return (lambda path: ResumeParser(path).parse_text()), paths, total
+
+def jd_extract_text_case(backend: str) -> Case:
+    def case(rng, params, count, directory, stack):
+        from src.job_description_extractor import JobDescriptionExtractor
+        pages = [synthetic_page(rng, params["page_sections"]) for _ in range(count)]
+        def extract(page):
+            extractor = JobDescriptionExtractor("https://example.com/job")
+            extractor.html = page
+            extractor.extract_text(backend)
+            return extractor.text
+        return extract, pages, sum(len(page) for page in pages)
+    return case
+
+def end_to_end_case(rng, params, count, directory, stack):
+    import config.config
+    from config.config import ModelConfig
+    from src.ats_evaluator import ATSEvaluator
+    from src.resume_parser import ResumeParser
+    from src.job_description_extractor import JobDescriptionExtractor
+    paths, total = write_pdfs(rng, params, count, directory)
+    pages = [synthetic_page(rng, params["page_sections"]) for _ in range(count)]
+    completion = json.dumps({"Qualifications": synthetic_criteria(rng, params["page_sections"]).split("\n")})
+    site = StubSite(pages, completion)
+    stack.callback(site.close)
+    config.config.MODEL_CONFIGS[STUB_MODEL] = ModelConfig(name="BenchStub", api_url=f"{site.url}/complete",
+                                                          api_key="bench")
+    stack.callback(config.config.MODEL_CONFIGS.pop, STUB_MODEL, None)
+    normalizer = uncached_normalizer()
+    def pipeline(item):
+        pdf_path, url = item
+        parser = ResumeParser(pdf_path)
+        parser.extract_text()
+        parser.parse_text()
+        extractor = JobDescriptionExtractor(url, model_type=STUB_MODEL)
+        extractor.fetch_webpage()
+        extractor.extract_main_content()
+        details = extractor.extract_key_job_details()
+        return ATSEvaluator(parser.text, json.dumps(details), normalizer=normalizer).evaluate()
+    items = [(path, f"{site.url}/job/{index}") for index, path in enumerate(paths)]
+    return pipeline, items, total + sum(len(page) for page in pages)
+
+CASES: Dict[str, Case] = {
+    "ats_evaluate": ats_evaluate_case,
+    "resume_extract_text": resume_extract_text_case,
+    "resume_parse_text": resume_parse_text_case,
+    "jd_extract_text": jd_extract_text_case("stream"),
+    "jd_extract_text_bs4": jd_extract_text_case("bs4"),
+    "end_to_end": end_to_end_case,
+}
+
+def run_suite(cases: Sequence[str] = tuple(CASES), sizes: Sequence[str] = DEFAULT_SIZES, count: int = 20,
+              repeats: int = 3, seed: int = 7) -> List[BenchResult]:
+    """
+    Runs benchmark cases at the given corpus sizes.
+
+    Args:
+        cases (Sequence[str]): Names from CASES.
+        sizes (Sequence[str]): Names from benchmarks.corpus.SIZES.
+        count (int): Documents in each corpus.
+        repeats (int): Timed passes over each corpus.
+        seed (int): Seed of the corpus generator; a case and size always get the same corpus.
+
+    Returns:
+        List[BenchResult]: One result per case and size.
+    """
+    unknown = [name for name in cases if name not in CASES] + [size for size in sizes if size not in SIZES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases or sizes: {', '.join(unknown)}")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="autobot-bench-") as directory:
+        for name in cases:
+            for size in sizes:
+                rng = random.Random(f"{seed}:{name}:{size}")
+                with ExitStack() as stack:
+                    function, inputs, input_bytes = CASES[name](rng, SIZES[size], count, directory, stack)
+                    results.append(run_case(name, size, function, inputs, input_bytes, repeats=repeats))
+    return results
+
+def format_results(results: List[BenchResult]) -> str:
+    lines = [f"{'case':<30} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'calls/s':>9} {'MB/s':>8} {'peak KB':>9}"]
+    for result in results:
+        lines.append(f"{result.key:<30} {result.p50_ms:>9.3f} {result.p95_ms:>9.3f} {result.p99_ms:>9.3f} "
+                     f"{result.calls_per_s:>9.1f} {result.mb_per_s:>8.2f} {result.peak_kb:>9.0f}")
+    return "\n".join(lines)
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Run the Autobot benchmark suite.")
+    arg_parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated case names.")
+    arg_parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help=f"Comma-separated sizes: {', '.join(SIZES)}.")
+    arg_parser.add_argument("--count", type=int, default=20, help="Documents per corpus.")
+    arg_parser.add_argument("--repeats", type=int, default=3, help="Timed passes over each corpus.")
+    arg_parser.add_argument("--seed", type=int, default=7)
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file.")
+    arg_parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative latency increase.")
+    arg_parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed relative peak memory increase.")
+    arg_parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = arg_parser.parse_args(argv)
+
+    # The pipeline logs every step at INFO level, which would dominate the timings.
+    logging.disable(logging.INFO)
+    results = run_suite(args.cases.split(","), args.sizes.split(","), args.count, args.repeats, args.seed)
+    print(format_results(results))
+    if args.json:
+        save_baseline(args.json, results)
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        save_baseline(args.baseline, results, baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 0
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} PERFORMANCE REGRESSION(S):", file=sys.stderr)
+        for message in regressions:
+            print(f"  REGRESSION {message}", file=sys.stderr)
+        return 1
+    print("\nNo regressions against the baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
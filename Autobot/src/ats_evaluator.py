@@ -1,40 +1,63 @@
 """
 Module: ats_evaluator.py
 Purpose: Evaluate an Applicant Tracking System (ATS) score by comparing resume text against job qualifying criteria.
-         It processes text using basic NLP techniques (removing punctuation, lower-casing, and filtering out stopwords)
-         and returns an ATS score (0-100) along with two keyword lists: matched and missing.
+         It processes text using basic NLP techniques (removing punctuation, lower-casing, and filtering out stopwords,
+         optionally with n-grams and plural reduction via TextNormalizer) and returns an ATS score (0-100) along with two keyword lists: matched and missing.
 """
 
-import re
-import string
 import logging
-from typing import List, Dict
+from dataclasses import dataclass, field
+from typing import List, Dict, Sequence, Set
+from src.text_pipeline import TextNormalizer, BASIC_STOPWORDS, DEFAULT_NORMALIZER
+from src.skill_matcher import SkillMatcher
+from src.corpus_stats import CorpusStats
+from src.telemetry import timed
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# IDF weights are summed as integer multiples of 1 / WEIGHT_SCALE. Integer sums are exact in any
+# order, so evaluate() and the matrix product of evaluate_matrix() give identical scores.
+WEIGHT_SCALE = 1 << 20
+
+def _weight_units(corpus_stats: CorpusStats, keywords: Sequence[str]) -> List[int]:
+    """
+    Returns the IDF weight of each keyword in units of 1 / WEIGHT_SCALE.
+    """
+    return [round(weight * WEIGHT_SCALE) for weight in corpus_stats.weights(keywords)]
+
 class ATSEvaluator:
     """
     A class to evaluate the ATS (Applicant Tracking System) score by comparing keywords extracted 
     from a candidate's resume and the job's qualifying criteria.
     """
     # Expanded set of common stopwords for better filtering.
-    STOPWORDS = {
-        'the', 'and', 'to', 'of', 'a', 'in', 'for', 'on', 'with', 'as', 'by',
-        'at', 'an', 'be', 'this', 'that', 'from', 'is', 'are', 'it', 'or', 'if',
-        'you', 'your', 'i', 'we', 'us', 'our'
-    }
+    STOPWORDS = BASIC_STOPWORDS
     
-    def __init__(self, resume_text: str, job_criteria_text: str):
+    def __init__(self, resume_text: str, job_criteria_text: str, normalizer: TextNormalizer = None,
+                 skill_matcher: SkillMatcher = None, corpus_stats: CorpusStats = None):
         """
         Initializes the evaluator with the resume text and the job qualifying criteria text.
         
         Args:
             resume_text (str): Text extracted from the resume.
             job_criteria_text (str): Qualifying criteria text extracted from the job description.
+            normalizer (TextNormalizer, optional): Keyword extraction pipeline (n-grams, plurals, stopwords).
+                                                   Defaults to the shared single-word normalizer.
+            skill_matcher (SkillMatcher, optional): Skill taxonomy matcher. When given, taxonomy phrases
+                                                    and their synonyms count as one keyword: the skill's
+                                                    canonical id.
+            corpus_stats (CorpusStats, optional): Job description corpus statistics. When given, each
+                                                  criteria keyword is weighted by its IDF instead of
+                                                  counting equally.
         """
-        self.resume_text = resume_text.lower() if resume_text else ""
-        self.job_criteria_text = job_criteria_text.lower() if job_criteria_text else ""
+        # Kept as written: the normalizer lower-cases the words itself, and the skill matcher needs
+        # the original case for its case-sensitive forms.
+        self.resume_text = resume_text or ""
+        self.job_criteria_text = job_criteria_text or ""
+        self.normalizer = normalizer or DEFAULT_NORMALIZER
+        self.skill_matcher = skill_matcher
+        self.corpus_stats = corpus_stats
     
     def _clean_text(self, text: str) -> List[str]:
         """
@@ -46,10 +69,7 @@ class ATSEvaluator:
         Returns:
             List[str]: A list of cleaned words.
         """
-        translator = str.maketrans('', '', string.punctuation)
-        cleaned_text = text.translate(translator)
-        words = cleaned_text.split()
-        return words
+        return self.normalizer.clean(text)
     
     def extract_keywords(self, text: str) -> List[str]:
         """
@@ -61,10 +81,18 @@ class ATSEvaluator:
         Returns:
             List[str]: A list of keywords.
         """
-        words = self._clean_text(text)
-        keywords = set(word for word in words if word not in self.STOPWORDS and len(word) > 2)
-        return list(keywords)
+        keywords = self.normalizer.keywords(text)
+        if self.skill_matcher is None:
+            return list(keywords)
+        # Replace the words of every taxonomy hit by the skill's canonical id, so that synonyms
+        # ("k8s", "Kubernetes") count as the same keyword.
+        hits = self.skill_matcher.find(text)
+        covered = set()
+        for hit in hits:
+            covered.update(self.normalizer.keywords(hit.phrase))
+        return list((keywords - covered) | {hit.skill_id for hit in hits})
     
+    @timed("ats_score")
     def evaluate(self) -> Dict[str, object]:
         """
         Evaluates the ATS score by comparing keywords extracted from the job qualifying criteria 
@@ -72,7 +100,8 @@ class ATSEvaluator:
         
         Returns:
             Dict[str, object]: A dictionary containing:
-                - ats_score: The ATS score (0-100).
+                - ats_score: The ATS score (0-100); the IDF-weighted share of matched keywords
+                             when corpus statistics are set.
                 - keywords_matched: List of keywords present in both resume and job criteria.
                 - keywords_missing: List of keywords from job criteria missing in the resume.
         """
@@ -80,7 +109,23 @@ class ATSEvaluator:
         logger.info(f"Extracted job criteria keywords: {criteria_keywords}")
         
         resume_keywords = set(self.extract_keywords(self.resume_text))
+        return self.score_keywords(criteria_keywords, resume_keywords, self.corpus_stats)
+
+    @staticmethod
+    def score_keywords(criteria_keywords: Sequence[str], resume_keywords: Set[str],
+                       corpus_stats: CorpusStats = None) -> Dict[str, object]:
+        """
+        Scores already extracted keywords, so a resume or job criteria scored many times only
+        needs to be tokenized once.
         
+        Args:
+            criteria_keywords (Sequence[str]): Keywords of the job criteria, as from extract_keywords().
+            resume_keywords (Set[str]): Keywords of the resume.
+            corpus_stats (CorpusStats, optional): IDF statistics, as for __init__.
+        
+        Returns:
+            Dict[str, object]: The evaluate() result.
+        """
         matched = []
         missing = []
         for keyword in criteria_keywords:
@@ -89,15 +134,164 @@ class ATSEvaluator:
             else:
                 missing.append(keyword)
         
-        total_keywords = len(criteria_keywords)
-        ats_score = (len(matched) / total_keywords * 100) if total_keywords > 0 else 0
+        if corpus_stats is not None:
+            weights = dict(zip(criteria_keywords, _weight_units(corpus_stats, criteria_keywords)))
+            total_weight = sum(weights.values())
+            matched_weight = sum(weights[keyword] for keyword in matched)
+            # Rounded like np.round(), which evaluate_matrix() applies to the whole score matrix.
+            ats_score = round(matched_weight / total_weight * 100 * 100) / 100 if total_weight > 0 else 0
+        else:
+            total_keywords = len(criteria_keywords)
+            ats_score = round((len(matched) / total_keywords * 100) if total_keywords > 0 else 0, 2)
         
         return {
-            "ats_score": round(ats_score, 2),
+            "ats_score": ats_score,
             "keywords_matched": matched,
             "keywords_missing": missing
         }
 
+    @classmethod
+    @timed("ats_score_matrix")
+    def evaluate_matrix(cls, resumes: Sequence[str], criteria: Sequence[str],
+                        normalizer: TextNormalizer = None, skill_matcher: SkillMatcher = None,
+                        corpus_stats: CorpusStats = None) -> "ATSMatrixResult":
+        """
+        Scores every resume against every job criteria text in one vectorized pass.
+        
+        Each text is tokenized exactly once. The criteria keywords form a shared vocabulary,
+        every document is encoded as a sparse binary term vector over it, and the match counts
+        for all pairs come out of a single sparse matrix product.
+        
+        Args:
+            resumes (Sequence[str]): Resume texts (N).
+            criteria (Sequence[str]): Job qualifying criteria texts (M).
+            normalizer (TextNormalizer, optional): Keyword extraction pipeline, as for __init__.
+            skill_matcher (SkillMatcher, optional): Skill taxonomy matcher, as for __init__.
+            corpus_stats (CorpusStats, optional): IDF statistics, as for __init__.
+        
+        Returns:
+            ATSMatrixResult: The N x M score matrix plus per-pair matched/missing keywords.
+                             Scores are identical to calling evaluate() on each pair.
+        """
+        # Imported here so single-pair scoring does not pay for NumPy/SciPy start-up.
+        import numpy as np
+
+        tokenizer = cls("", "", normalizer, skill_matcher, corpus_stats)
+        criteria_keywords = [tokenizer.extract_keywords(text or "") for text in criteria]
+
+        vocabulary: Dict[str, int] = {}
+        criteria_index = []
+        for keywords in criteria_keywords:
+            criteria_index.append(np.array(
+                [vocabulary.setdefault(keyword, len(vocabulary)) for keyword in keywords], dtype=np.int64
+            ))
+
+        criteria_weights = None
+        if corpus_stats is not None:
+            criteria_weights = [np.array(_weight_units(corpus_stats, keywords), dtype=np.int64)
+                                for keywords in criteria_keywords]
+        criteria_matrix = _binary_matrix(criteria_index, len(vocabulary), criteria_weights)
+        resume_index = []
+        for text in resumes:
+            keywords = tokenizer.extract_keywords(text or "")
+            resume_index.append(np.array(
+                sorted(vocabulary[keyword] for keyword in keywords if keyword in vocabulary), dtype=np.int64
+            ))
+        resume_matrix = _binary_matrix(resume_index, len(vocabulary))
+
+        product = np.asarray((resume_matrix @ criteria_matrix.T).todense())
+        product = product.reshape(len(resume_index), len(criteria_index))
+        if criteria_weights is None:
+            match_counts = product.astype(np.int64)
+            # Every score for criteria j is k / total_j * 100 for some k in [0, total_j], so a lookup
+            # table rounded with Python's round() reproduces evaluate() bit for bit.
+            totals = [len(keywords) for keywords in criteria_keywords]
+            score_table = np.zeros((len(totals), max(totals, default=0) + 1))
+            for j, total in enumerate(totals):
+                if total > 0:
+                    score_table[j, :total + 1] = [round(k / total * 100, 2) for k in range(total + 1)]
+            scores = score_table[np.arange(len(totals))[None, :], match_counts]
+        else:
+            # product holds the matched IDF weight of every pair.
+            total_weights = np.array([int(weights.sum()) for weights in criteria_weights], dtype=np.int64)
+            safe_totals = np.where(total_weights > 0, total_weights, 1)
+            scores = np.where(total_weights > 0, np.round(product / safe_totals * 100, 2), 0.0)
+            match_counts = np.asarray((resume_matrix @ (criteria_matrix != 0).T).todense(), dtype=np.int64)
+            match_counts = match_counts.reshape(product.shape)
+
+        logger.info(f"Evaluated {len(resume_index)} resumes against {len(criteria_index)} job criteria "
+                    f"over a vocabulary of {len(vocabulary)} keywords.")
+        return ATSMatrixResult(
+            scores=scores,
+            match_counts=match_counts,
+            criteria_keywords=criteria_keywords,
+            resume_matrix=resume_matrix,
+            criteria_index=criteria_index,
+        )
+
+
+def _binary_matrix(rows: List[object], n_columns: int, values: List[object] = None):
+    """
+    Builds a sparse CSR matrix with a 1 at every (row, column) listed in rows.
+    
+    Args:
+        rows (List[np.ndarray]): Column indices for each row.
+        n_columns (int): Width of the matrix.
+        values (List[np.ndarray], optional): Per-entry values to store instead of 1.
+    
+    Returns:
+        scipy.sparse.csr_matrix: The term matrix.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(row) for row in rows])
+    indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    if values is not None:
+        data = np.concatenate(values) if values else np.zeros(0)
+    else:
+        data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), n_columns))
+
+
+@dataclass
+class ATSMatrixResult:
+    """
+    Result of ATSEvaluator.evaluate_matrix for N resumes against M job criteria.
+    
+    Attributes:
+        scores (np.ndarray): N x M matrix of ATS scores (0-100).
+        match_counts (np.ndarray): N x M matrix of matched keyword counts.
+        criteria_keywords (List[List[str]]): Keywords of each job criteria, in evaluate() order.
+    """
+    scores: object
+    match_counts: object
+    criteria_keywords: List[List[str]]
+    resume_matrix: object = field(repr=False)
+    criteria_index: List[object] = field(repr=False)
+
+    def matched_mask(self, criteria_idx: int):
+        """
+        Returns an N x K boolean matrix telling which of the K keywords of one job criteria
+        each resume contains.
+        """
+        columns = self.criteria_index[criteria_idx]
+        return self.resume_matrix[:, columns].toarray().astype(bool)
+
+    def result(self, resume_idx: int, criteria_idx: int) -> Dict[str, object]:
+        """
+        Returns the result for one pair in the same format as ATSEvaluator.evaluate().
+        """
+        keywords = self.criteria_keywords[criteria_idx]
+        columns = self.criteria_index[criteria_idx]
+        hits = self.resume_matrix[resume_idx, columns].toarray().ravel().astype(bool)
+        return {
+            "ats_score": float(self.scores[resume_idx, criteria_idx]),
+            "keywords_matched": [keyword for keyword, hit in zip(keywords, hits) if hit],
+            "keywords_missing": [keyword for keyword, hit in zip(keywords, hits) if not hit]
+        }
+
 # For independent testing of the ATS evaluator.
 if __name__ == "__main__":
     sample_resume = """
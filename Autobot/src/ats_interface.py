@@ -3,22 +3,33 @@ Module: ats_interface.py
 Purpose: Provides an interactive interface to:
          a) Evaluate a single resume against a job description.
          b) Compare two resumes for their ATS score.
+         c) Rank every resume in the data folder against a job description.
          
 The module lists PDF resumes from the fixed 'data/' folder, then lets the user choose one
 or two files via number input. It then extracts text from the chosen PDF(s) using ResumeParser,
 and evaluates the resume(s) against the job description using ATSEvaluator.
+
+The work itself is done by functions that take every input as an argument (evaluate_resume,
+compare_resumes, rank_resumes and the format_* helpers); the interactive menu only gathers the
+inputs. The command-line interface in main.py calls the same functions.
 """
 
 import os
 import logging
+from typing import Dict, List
 from src.resume_parser import ResumeParser
 from src.ats_evaluator import ATSEvaluator
+from src.corpus_stats import CorpusStats
+from src.skill_matcher import SkillMatcher
+from src.resume_cache import default_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Determine the data folder location relative to this file.
 DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+# Persistent BM25 index over the resumes in DATA_FOLDER.
+INDEX_PATH = os.path.join(DATA_FOLDER, '.resume_index.json')
 
 def list_resume_files() -> list:
     """
@@ -70,6 +81,72 @@ def input_job_description() -> str:
     jd_text = input()
     return jd_text
 
+def read_resume_text(resume_path: str, use_cache: bool = True) -> str:
+    """
+    Returns the text of a resume: a PDF is parsed, any other file is read as plain text.
+    
+    Args:
+        resume_path (str): Path to the resume.
+        use_cache (bool): Use the shared resume cache for PDFs.
+    """
+    if not resume_path.lower().endswith('.pdf'):
+        with open(resume_path, 'r', encoding='utf-8') as file:
+            return file.read()
+    parser = ResumeParser(resume_path, cache=default_cache() if use_cache else None)
+    return parser.extract_text()
+
+def evaluate_resume(resume_path: str, jd_text: str, use_cache: bool = True, skill_matcher: SkillMatcher = None,
+                    corpus_stats: CorpusStats = None) -> Dict[str, object]:
+    """
+    Evaluates one resume against a job description.
+    
+    Args:
+        resume_path (str): Path to the resume.
+        jd_text (str): The job description text.
+        use_cache (bool): Use the shared resume cache for PDFs.
+        skill_matcher (SkillMatcher, optional): Skill taxonomy matcher, as for ATSEvaluator.
+        corpus_stats (CorpusStats, optional): IDF statistics, as for ATSEvaluator.
+    
+    Returns:
+        The ATSEvaluator.evaluate() result.
+    """
+    return ATSEvaluator(read_resume_text(resume_path, use_cache), jd_text, skill_matcher=skill_matcher,
+                        corpus_stats=corpus_stats).evaluate()
+
+def compare_resumes(resume_paths: List[str], jd_text: str, use_cache: bool = True, skill_matcher: SkillMatcher = None,
+                    corpus_stats: CorpusStats = None) -> List[Dict[str, object]]:
+    """
+    Evaluates several resumes against the same job description; the arguments are as for evaluate_resume().
+    
+    Returns:
+        One ATSEvaluator.evaluate() result per resume, in the given order.
+    """
+    return [evaluate_resume(path, jd_text, use_cache, skill_matcher, corpus_stats) for path in resume_paths]
+
+def format_result(result: Dict[str, object], title: str = "ATS Evaluation Result") -> str:
+    """
+    Renders an evaluation result for the terminal.
+    """
+    return (f"\n{title}:\n"
+            f"ATS Score: {result['ats_score']}/100\n"
+            f"Keywords Matched: {result['keywords_matched']}\n"
+            f"Keywords Missing: {result['keywords_missing']}")
+
+def format_comparison(results: List[Dict[str, object]]) -> str:
+    """
+    Renders the results of compare_resumes() and names the best match.
+    """
+    lines = [format_result(result, f"ATS Evaluation for Resume {number}") for number, result in enumerate(results, start=1)]
+    scores = [result['ats_score'] for result in results]
+    best = [number for number, score in enumerate(scores, start=1) if score == max(scores)]
+    if len(best) == len(scores):
+        lines.append("\nAll resumes have the same ATS score." if len(scores) > 2 else "\nBoth resumes have the same ATS score.")
+    elif len(best) == 1:
+        lines.append(f"\nResume {best[0]} has a better ATS match.")
+    else:
+        lines.append(f"\nResumes {', '.join(map(str, best))} share the best ATS match.")
+    return "\n".join(lines)
+
 def evaluate_single_resume() -> None:
     """
     Evaluates a single selected resume against a job description.
@@ -78,19 +155,7 @@ def evaluate_single_resume() -> None:
     if not resume_path:
         return
     jd_text = input_job_description()
-    
-    # Use ResumeParser to extract text from the selected resume PDF.
-    parser = ResumeParser(resume_path)
-    resume_text = parser.extract_text()
-    
-    # Evaluate using the ATS evaluator.
-    evaluator = ATSEvaluator(resume_text, jd_text)
-    result = evaluator.evaluate()
-    
-    print("\nATS Evaluation Result:")
-    print(f"ATS Score: {result['ats_score']}/100")
-    print("Keywords Matched:", result['keywords_matched'])
-    print("Keywords Missing:", result['keywords_missing'])
+    print(format_result(evaluate_resume(resume_path, jd_text)))
 
 def compare_two_resumes() -> None:
     """
@@ -105,49 +170,71 @@ def compare_two_resumes() -> None:
     if not resume_path2:
         return
     jd_text = input_job_description()
+    print(format_comparison(compare_resumes([resume_path1, resume_path2], jd_text)))
+
+def rank_resumes(jd_text: str, top_k: int = 10, data_folder: str = DATA_FOLDER, index_path: str = None) -> list:
+    """
+    Returns the top-k resumes in a folder for a job description.
     
-    # Process the first resume.
-    parser1 = ResumeParser(resume_path1)
-    resume_text1 = parser1.extract_text()
-    evaluator1 = ATSEvaluator(resume_text1, jd_text)
-    result1 = evaluator1.evaluate()
-    
-    # Process the second resume.
-    parser2 = ResumeParser(resume_path2)
-    resume_text2 = parser2.extract_text()
-    evaluator2 = ATSEvaluator(resume_text2, jd_text)
-    result2 = evaluator2.evaluate()
-    
-    print("\nATS Evaluation for Resume 1:")
-    print(f"ATS Score: {result1['ats_score']}/100")
-    print("Keywords Matched:", result1['keywords_matched'])
-    print("Keywords Missing:", result1['keywords_missing'])
+    The BM25 index at index_path is brought up to date first, so only PDFs that were added or
+    changed since the last run are parsed.
     
-    print("\nATS Evaluation for Resume 2:")
-    print(f"ATS Score: {result2['ats_score']}/100")
-    print("Keywords Matched:", result2['keywords_matched'])
-    print("Keywords Missing:", result2['keywords_missing'])
+    Args:
+        jd_text (str): The job description text.
+        top_k (int): Number of resumes to return.
+        data_folder (str): Folder holding the PDF resumes. Defaults to the data folder.
+        index_path (str, optional): Index file. Defaults to .resume_index.json in data_folder.
     
-    # Comparison output.
-    if result1['ats_score'] > result2['ats_score']:
-        print("\nResume 1 has a better ATS match.")
-    elif result1['ats_score'] < result2['ats_score']:
-        print("\nResume 2 has a better ATS match.")
-    else:
-        print("\nBoth resumes have the same ATS score.")
+    Returns:
+        List of (file name, score) pairs, best first.
+    """
+    from src.resume_index import ResumeIndex
+    index_path = index_path or os.path.join(data_folder, os.path.basename(INDEX_PATH))
+    index = ResumeIndex.load(index_path)
+    added, removed = index.sync_directory(data_folder, cache=default_cache())
+    if added or removed:
+        index.save(index_path)
+    return index.search(jd_text, top_k)
+
+def format_ranking(results: list) -> str:
+    """
+    Renders the results of rank_resumes().
+    """
+    if not results:
+        return "No matching resumes found in the data folder."
+    lines = ["\nBest matching resumes:"]
+    lines.extend(f"{rank}. {file} (score: {score:.2f})" for rank, (file, score) in enumerate(results, start=1))
+    return "\n".join(lines)
+
+def rank_all_resumes() -> None:
+    """
+    Ranks every resume in the data folder against a job description.
+    """
+    jd_text = input_job_description()
+    top_k = input("How many resumes should be shown? [10]: ").strip()
+    try:
+        top_k = int(top_k) if top_k else 10
+    except ValueError:
+        print("Invalid number. Showing the top 10.")
+        top_k = 10
+    print(format_ranking(rank_resumes(jd_text, top_k)))
 
 def main() -> None:
     """
-    Main interactive function to choose between single resume evaluation or comparing two resumes.
+    Main interactive function to choose between single resume evaluation, comparing two resumes
+    and ranking all resumes.
     """
     print("ATS Evaluation Interface")
     print("1. Evaluate a single resume")
     print("2. Compare two resumes")
-    choice = input("Enter your choice (1 or 2): ").strip()
+    print("3. Rank all resumes")
+    choice = input("Enter your choice (1, 2 or 3): ").strip()
     if choice == '1':
         evaluate_single_resume()
     elif choice == '2':
         compare_two_resumes()
+    elif choice == '3':
+        rank_all_resumes()
     else:
         print("Invalid choice. Exiting.")
 
@@ -0,0 +1,343 @@
+"""
+Module: batch_rank.py
+Purpose: Scores every resume in a directory against every job description of a file or directory and
+         streams one JSONL or CSV row per (resume, job) pair.
+
+The run is a three-stage pipeline:
+    1. The main thread walks the resume directory lazily and submits one task per resume and chunk
+       of jobs to a ProcessPoolExecutor, keeping at most max_pending tasks in flight.
+    2. The worker processes parse the resume (PDFs through ResumeParser, other files as plain text),
+       tokenize it once, score it against the pre-tokenized job keywords of their chunk and format
+       the output rows themselves.
+    3. A writer thread takes the formatted rows from a bounded queue and writes them out.
+
+The job descriptions are tokenized once, up front, and only their keywords are kept. Every other
+buffer is bounded: a slow consumer of the output fills the queue, which stops new submissions,
+so memory stays flat however many pairs are scored and the output can be piped into other tools.
+Rows are written in completion order.
+
+Job descriptions are read from:
+    - a directory: every .txt, .md, .html or .htm file is one job, named by its relative path;
+    - a .jsonl file: one job per line, {"id": ..., "text": ...};
+    - any other file: a single job, named by its file name.
+
+Usage:
+    python -m src.batch_rank data/ jobs/ --workers 8 --format csv --output scores.csv
+    python -m src.batch_rank data/ jobs.jsonl | jq 'select(.ats_score > 80)'
+    python -m src.batch_rank data/ jobs/ --skills --idf data/jd_stats.json.gz
+"""
+
+import io
+import os
+import csv
+import sys
+import json
+import queue
+import logging
+import argparse
+import threading
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+from src.ats_evaluator import ATSEvaluator
+from src.corpus_stats import CorpusStats, load_corpus_stats
+from src.skill_matcher import DEFAULT_TAXONOMY_PATH, SkillMatcher, load_skill_matcher
+from src.telemetry import count
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = ('.pdf', '.txt')
+JOB_EXTENSIONS = ('.txt', '.md', '.html', '.htm')
+FORMATS = ("jsonl", "csv")
+CSV_COLUMNS = ["resume", "job", "ats_score", "keywords_matched", "keywords_missing", "error"]
+# Jobs scored by one task; bounds the rows a task returns at once.
+DEFAULT_JOBS_PER_TASK = 500
+# Formatted chunks the writer may fall behind by.
+DEFAULT_QUEUE_SIZE = 64
+
+def iter_files(folder: str, extensions: Sequence[str], recursive: bool = True) -> Iterator[str]:
+    """
+    Yields the paths of the files with one of the extensions in a folder, in sorted order.
+    """
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(tuple(extensions)):
+                yield os.path.join(root, name)
+        if not recursive:
+            break
+
+def read_job_file(path: str) -> str:
+    """
+    Returns the text of a job description file; HTML is converted to text.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        text = file.read()
+    if path.lower().endswith(('.html', '.htm')):
+        from src.html_text import html_to_text
+        text = html_to_text(text)
+    return text
+
+def iter_jobs(source: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (job id, job description text) for a job directory, .jsonl file or single job file.
+    """
+    if os.path.isdir(source):
+        for path in iter_files(source, JOB_EXTENSIONS):
+            yield os.path.relpath(path, source), read_job_file(path)
+    elif source.lower().endswith('.jsonl'):
+        with open(source, 'r', encoding='utf-8') as file:
+            for number, line in enumerate(file, start=1):
+                if line.strip():
+                    job = json.loads(line)
+                    yield str(job.get("id", number)), job.get("text") or ""
+    else:
+        yield os.path.basename(source), read_job_file(source)
+
+def tokenize_jobs(jobs: Iterable[Tuple[str, str]],
+                  skill_matcher: SkillMatcher = None) -> Tuple[List[str], List[List[str]]]:
+    """
+    Extracts the keywords of every job description once.
+
+    Args:
+        jobs (Iterable[Tuple[str, str]]): (job id, job description text) pairs.
+        skill_matcher (SkillMatcher, optional): Skill taxonomy matcher, as for ATSEvaluator.
+
+    Returns:
+        Tuple[List[str], List[List[str]]]: The job ids and the keywords of each job, in ATSEvaluator order.
+    """
+    tokenizer = ATSEvaluator("", "", skill_matcher=skill_matcher)
+    job_ids, job_keywords = [], []
+    for job_id, text in jobs:
+        job_ids.append(job_id)
+        job_keywords.append(tokenizer.extract_keywords(text))
+    return job_ids, job_keywords
+
+class RowFormatter:
+    """
+    Formats the result of one (resume, job) pair as a JSONL or CSV line.
+    """
+
+    def __init__(self, output_format: str = "jsonl"):
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        self.output_format = output_format
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def header(self) -> str:
+        return self._csv_line(CSV_COLUMNS) if self.output_format == "csv" else ""
+
+    def _csv_line(self, values: list) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return self._buffer.getvalue()
+
+    def row(self, resume: str, job: Optional[str], result: dict = None, error: str = None) -> str:
+        """
+        Returns one output line: the pair's ATSEvaluator result, or the error that kept the resume
+        from being scored (job is then None).
+        """
+        if self.output_format == "jsonl":
+            record = {"resume": resume, "job": job}
+            record.update(result if error is None else {"error": error})
+            return json.dumps(record) + "\n"
+        if error is not None:
+            return self._csv_line([resume, "", "", "", "", error])
+        return self._csv_line([resume, job, result["ats_score"], ";".join(result["keywords_matched"]),
+                               ";".join(result["keywords_missing"]), ""])
+
+_job_ids: List[str] = []
+_job_keywords: List[List[str]] = []
+_formatter: Optional[RowFormatter] = None
+_cache = None
+_tokenizer: Optional[ATSEvaluator] = None
+_corpus_stats: Optional[CorpusStats] = None
+
+def _init_worker(job_ids: List[str], job_keywords: List[List[str]], output_format: str,
+                 cache_path: Optional[str], taxonomy_path: Optional[str] = None,
+                 stats_path: Optional[str] = None) -> None:
+    """
+    Receives the tokenized jobs, and opens the shared resume cache and loads the skill taxonomy
+    and IDF statistics once per worker process.
+    """
+    global _job_ids, _job_keywords, _formatter, _cache, _tokenizer, _corpus_stats
+    _job_ids, _job_keywords = job_ids, job_keywords
+    _formatter = RowFormatter(output_format)
+    _tokenizer = ATSEvaluator("", "", skill_matcher=load_skill_matcher(taxonomy_path) if taxonomy_path else None)
+    _corpus_stats = load_corpus_stats(stats_path) if stats_path else None
+    if cache_path:
+        from src.resume_cache import ResumeCache
+        _cache = ResumeCache(cache_path)
+    else:
+        _cache = None
+
+# A resume is split into one task per chunk of jobs; the worker that gets several of them
+# tokenizes it once.
+@lru_cache(maxsize=8)
+def _resume_keywords(path: str) -> frozenset:
+    if path.lower().endswith('.pdf'):
+        from src.resume_parser import ResumeParser
+        text = ResumeParser(path, cache=_cache).extract_text()
+    else:
+        with open(path, 'r', encoding='utf-8') as file:
+            text = file.read()
+    return frozenset(_tokenizer.extract_keywords(text))
+
+def _score_task(path: str, start: int, stop: int) -> Tuple[str, Optional[str]]:
+    """
+    Worker task: scores one resume against jobs [start, stop).
+
+    Returns:
+        Tuple[str, Optional[str]]: The formatted rows, and the error if the resume could not be read.
+    """
+    try:
+        resume_keywords = _resume_keywords(path)
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        return _formatter.row(path, None, error=error), error
+    rows = [_formatter.row(path, _job_ids[index],
+                           ATSEvaluator.score_keywords(_job_keywords[index], resume_keywords, _corpus_stats))
+            for index in range(start, stop)]
+    return "".join(rows), None
+
+class _Writer(threading.Thread):
+    """
+    Writes formatted chunks from a bounded queue to the output.
+    """
+
+    def __init__(self, output: TextIO, queue_size: int):
+        super().__init__(name="batch-rank-writer", daemon=True)
+        self.output = output
+        self.chunks = queue.Queue(maxsize=queue_size)
+        self.error = None
+
+    def run(self):
+        while True:
+            chunk = self.chunks.get()
+            if chunk is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                self.output.write(chunk)
+                self.output.flush()
+            except Exception as e:
+                # E.g. a closed pipe: remember it and keep draining so the producer never blocks.
+                self.error = e
+
+def rank(resume_paths: Iterable[str], jobs: Iterable[Tuple[str, str]], output: TextIO,
+         output_format: str = "jsonl", workers: int = None, jobs_per_task: int = DEFAULT_JOBS_PER_TASK,
+         max_pending: int = None, queue_size: int = DEFAULT_QUEUE_SIZE, cache_path: str = None,
+         taxonomy_path: str = None, stats_path: str = None) -> Tuple[int, int]:
+    """
+    Scores every resume against every job and streams the rows to output.
+
+    Args:
+        resume_paths (Iterable[str]): Resume files. Consumed lazily.
+        jobs (Iterable[Tuple[str, str]]): (job id, job description text) pairs, e.g. from iter_jobs().
+        output (TextIO): Where the rows are written.
+        output_format (str): "jsonl" or "csv".
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        jobs_per_task (int): Jobs scored by one task.
+        max_pending (int, optional): Maximum number of tasks in flight. Defaults to 4 per worker.
+        queue_size (int): Finished tasks that may wait for the writer.
+        cache_path (str, optional): ResumeCache file shared by the workers.
+        taxonomy_path (str, optional): Skill taxonomy file; skill synonyms then count as one keyword.
+        stats_path (str, optional): CorpusStats file; keywords are then weighted by their IDF.
+
+    Returns:
+        Tuple[int, int]: The number of pairs scored and the number of resumes that failed.
+    """
+    # The paths, not the loaded objects, are sent to the workers, which load each file once.
+    job_ids, job_keywords = tokenize_jobs(jobs, load_skill_matcher(taxonomy_path) if taxonomy_path else None)
+    logger.info(f"Tokenized {len(job_ids)} job descriptions.")
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    jobs_per_task = max(1, jobs_per_task)
+    tasks = ((path, start, min(start + jobs_per_task, len(job_ids)))
+             for path in resume_paths for start in range(0, len(job_ids), jobs_per_task))
+
+    writer = _Writer(output, queue_size)
+    writer.chunks.put(RowFormatter(output_format).header())
+    writer.start()
+    pairs = failed = 0
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(job_ids, job_keywords, output_format, cache_path, taxonomy_path, stats_path))
+    try:
+        # future -> task
+        pending = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                else:
+                    pending[pool.submit(_score_task, *task)] = task
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, start, stop = pending.pop(future)
+                rows, error = future.result()
+                if error is None:
+                    pairs += stop - start
+                elif start == 0:
+                    # Only the first chunk of a resume that cannot be read reports it.
+                    failed += 1
+                    logger.error(f"Failed to score {path}: {error}")
+                else:
+                    continue
+                # Blocks while the writer is queue_size chunks behind.
+                writer.chunks.put(rows)
+            if writer.error is not None:
+                raise writer.error
+    except BrokenProcessPool:
+        logger.error("A worker process crashed; the batch ranking was stopped.")
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        writer.chunks.put(None)
+        writer.join()
+    count("batch_rank_pairs", pairs)
+    logger.info(f"Scored {pairs} resume/job pairs, {failed} resumes failed.")
+    return pairs, failed
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command-line entry point: ranks a resume directory against job descriptions.
+    """
+    arg_parser = argparse.ArgumentParser(description="Score a directory of resumes against job descriptions.")
+    arg_parser.add_argument("resumes", help="Directory with PDF or plain text resumes.")
+    arg_parser.add_argument("jobs", help="Job description file, .jsonl file or directory.")
+    arg_parser.add_argument("--format", choices=FORMATS, default="jsonl", help="Output format.")
+    arg_parser.add_argument("--output", default="-", help="Output file ('-' for stdout).")
+    arg_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes.")
+    arg_parser.add_argument("--jobs-per-task", type=int, default=DEFAULT_JOBS_PER_TASK,
+                            help="Jobs scored against a resume by one task.")
+    arg_parser.add_argument("--cache", default=None, help="ResumeCache file to read and populate.")
+    arg_parser.add_argument("--skills", nargs="?", const=DEFAULT_TAXONOMY_PATH, metavar="TAXONOMY",
+                            help="Count skill synonyms as one keyword, from a taxonomy JSON file (the shipped one by default).")
+    arg_parser.add_argument("--idf", metavar="STATS_FILE",
+                            help="Weight keywords by their IDF in a job description statistics file (see src.corpus_stats).")
+    args = arg_parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        pairs, failed = rank(iter_files(args.resumes, RESUME_EXTENSIONS), iter_jobs(args.jobs), output,
+                             args.format, args.workers, args.jobs_per_task, cache_path=args.cache,
+                             taxonomy_path=args.skills, stats_path=args.idf)
+    except BrokenPipeError:
+        # The consumer (e.g. head) has stopped reading.
+        return 0
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failed and not pairs else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
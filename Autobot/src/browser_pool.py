@@ -0,0 +1,263 @@
+"""
+Module: browser_pool.py
+Purpose: Applies to many jobs in parallel with a pool of long-lived browser workers.
+
+Each worker thread owns one JobAutomation and keeps its browser open across applications, so the
+cost of starting Chrome is paid once per worker instead of once per job. Workers pull
+applications from a shared queue. When an application fails, the worker assumes its browser
+may have crashed: it restarts the browser and puts the application back in the queue until
+max_attempts is reached. A browser is also recycled after max_uses applications to bound its
+memory growth. A worker whose browser cannot be started retries a few times, then stops. If no
+worker is left, the remaining applications are reported as failed instead of waiting forever.
+
+The optional on_start and on_result hooks let a caller such as the durable job queue record
+progress as it happens. on_start runs right before each try and can veto it by returning False.
+"""
+
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+from src.job_automation import ApplicationNotSubmitted, JobAutomation
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+# Attempts to start a browser before a worker gives up.
+SETUP_ATTEMPTS = 3
+
+@dataclass
+class Application:
+    """
+    One job application to submit.
+    """
+    job_url: str
+    resume_data: dict
+    pdf_resume_path: str
+    attempts: int = 0
+    may_have_submitted: bool = False
+
+@dataclass
+class ApplicationResult:
+    """
+    The outcome of one application.
+
+    Attributes:
+        job_url (str): The job application URL.
+        ok (bool): Whether the application went through.
+        attempts (int): Number of tries.
+        worker (int): Index of the worker that handled the last try.
+        error (str, optional): The last error, if the application failed.
+        may_have_submitted (bool): False only if no try got as far as submitting the form, so the
+                                   application can safely be tried again.
+    """
+    job_url: str
+    ok: bool
+    attempts: int
+    worker: int
+    error: Optional[str] = None
+    may_have_submitted: bool = True
+
+@dataclass
+class WorkerStats:
+    applications: int = 0
+    restarts: int = 0
+    recycles: int = 0
+
+class BrowserPool:
+    """
+    A pool of worker threads, each driving its own browser.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_uses: int = 25, max_attempts: int = 2,
+                 automation_factory: Callable[[], JobAutomation] = None, setup_retry_delay: float = 1.0,
+                 on_start: Callable[[Application], bool] = None,
+                 on_result: Callable[[ApplicationResult], None] = None):
+        """
+        Args:
+            workers (int): Number of browsers running in parallel.
+            max_uses (int): Applications after which a worker replaces its browser.
+            max_attempts (int): Tries per application before it is reported as failed.
+            automation_factory (Callable, optional): Creates a worker's JobAutomation. Defaults to
+                                                     headless Chrome.
+            setup_retry_delay (float): Seconds between attempts to start a browser.
+            on_start (Callable, optional): Called before each try; returning False skips the
+                                           application without a result.
+            on_result (Callable, optional): Called with every result as soon as it is known.
+        """
+        self.workers = workers
+        self.max_uses = max_uses
+        self.max_attempts = max_attempts
+        self.automation_factory = automation_factory or (lambda: JobAutomation(headless=True))
+        self.setup_retry_delay = setup_retry_delay
+        self.on_start = on_start
+        self.on_result = on_result
+        self.results: List[ApplicationResult] = []
+        self.stats = [WorkerStats() for _ in range(workers)]
+        self._queue: "queue.Queue[Optional[Application]]" = queue.Queue()
+        # Reentrant: _fail_pending() records results while holding it.
+        self._lock = threading.RLock()
+        self._threads: List[threading.Thread] = []
+        self._alive = 0
+
+    def _record(self, result: ApplicationResult) -> None:
+        with self._lock:
+            self.results.append(result)
+        level = logging.INFO if result.ok else logging.ERROR
+        logger.log(level, f"Worker {result.worker}: application to {result.job_url} "
+                          f"{'succeeded' if result.ok else 'failed: ' + str(result.error)}")
+        if self.on_result is not None:
+            try:
+                self.on_result(result)
+            except Exception as e:
+                logger.error(f"Result hook failed for {result.job_url}: {e}")
+
+    def _may_start(self, application: Application) -> bool:
+        """
+        Asks the on_start hook whether an application may be tried; a failing hook says no.
+        """
+        if self.on_start is None:
+            return True
+        try:
+            return self.on_start(application) is not False
+        except Exception as e:
+            logger.error(f"Start hook failed for {application.job_url}: {e}")
+            return False
+
+    def _start_browser(self, automation: JobAutomation) -> bool:
+        """
+        Starts a worker's browser, retrying a few times. Returns False if it never started.
+        """
+        for attempt in range(SETUP_ATTEMPTS):
+            try:
+                automation.setup_browser()
+                return True
+            except Exception as e:
+                logger.error(f"Browser start failed (attempt {attempt + 1}/{SETUP_ATTEMPTS}): {e}")
+                time.sleep(self.setup_retry_delay)
+        return False
+
+    def _work(self, index: int) -> None:
+        stats = self.stats[index]
+        automation = self.automation_factory()
+        started = self._start_browser(automation)
+        uses = 0
+        try:
+            while started:
+                application = self._queue.get()
+                if application is None:
+                    self._queue.task_done()
+                    break
+                if not self._may_start(application):
+                    logger.warning(f"Worker {index}: skipping {application.job_url}.")
+                    self._queue.task_done()
+                    continue
+                application.attempts += 1
+                try:
+                    automation.apply_for_job(application.job_url, application.resume_data, application.pdf_resume_path)
+                    self._record(ApplicationResult(application.job_url, True, application.attempts, index))
+                    failed = False
+                except Exception as e:
+                    failed = True
+                    application.may_have_submitted |= not isinstance(e, ApplicationNotSubmitted)
+                    if application.attempts < self.max_attempts:
+                        self._queue.put(application)
+                    else:
+                        self._record(ApplicationResult(application.job_url, False, application.attempts, index, str(e),
+                                                       application.may_have_submitted))
+                finally:
+                    self._queue.task_done()
+                stats.applications += 1
+                uses += 1
+                if failed or uses >= self.max_uses:
+                    if failed:
+                        stats.restarts += 1
+                        logger.warning(f"Worker {index}: restarting browser after a failed application.")
+                    else:
+                        stats.recycles += 1
+                        logger.info(f"Worker {index}: recycling browser after {uses} applications.")
+                    automation.quit_browser()
+                    uses = 0
+                    started = self._start_browser(automation)
+        finally:
+            automation.quit_browser()
+            with self._lock:
+                self._alive -= 1
+                if self._alive == 0:
+                    self._fail_pending("no browser worker is running")
+
+    def _fail_pending(self, reason: str) -> None:
+        """
+        Reports every queued application as failed, so join() does not wait forever.
+        """
+        while True:
+            try:
+                application = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if application is not None:
+                self._record(ApplicationResult(application.job_url, False, application.attempts, -1, reason,
+                                               application.may_have_submitted))
+            self._queue.task_done()
+
+    def start(self) -> None:
+        """
+        Starts the worker threads.
+        """
+        with self._lock:
+            self._alive = self.workers
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, args=(index,), name=f"browser-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job_url: str, resume_data: dict, pdf_resume_path: str) -> None:
+        """
+        Queues an application.
+        """
+        # Checked and queued under the lock, so the last worker cannot stop in between and leave the
+        # application unhandled.
+        with self._lock:
+            if self._threads and self._alive == 0:
+                self._record(ApplicationResult(job_url, False, 0, -1, "no browser worker is running", False))
+            else:
+                self._queue.put(Application(job_url, resume_data, pdf_resume_path))
+
+    def join(self) -> None:
+        """
+        Waits until every queued application has been handled.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Stops the workers after the queued applications are done and quits their browsers.
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def run(self, job_urls: List[str], resume_data: dict, pdf_resume_path: str) -> List[ApplicationResult]:
+        """
+        Applies to every job URL with the same resume and waits for the results.
+
+        Returns:
+            List[ApplicationResult]: One result per URL, in completion order.
+        """
+        with self:
+            for job_url in job_urls:
+                self.submit(job_url, resume_data, pdf_resume_path)
+            self.join()
+        return list(self.results)
@@ -0,0 +1,254 @@
+"""
+Module: bulk_ingest.py
+Purpose: Ingests a whole directory of PDF resumes in parallel.
+
+Text extraction and field parsing are fanned out over a ProcessPoolExecutor. Short documents are
+handled by a single task; documents with more than pages_per_task pages are split into page-range
+tasks that run on different cores and are stitched back together in page order. Results are
+yielded as soon as each document is finished, and a file that fails (or crashes its worker) is
+reported as an error result without stopping the rest of the run.
+
+Usage:
+    python -m src.bulk_ingest data/ --workers 8 --output resumes.jsonl
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional
+import PyPDF2
+from src.resume_parser import ResumeParser
+from src.resume_cache import ResumeCache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Documents longer than this many pages are split into several extraction tasks.
+DEFAULT_PAGES_PER_TASK = 16
+
+@dataclass
+class IngestResult:
+    """
+    The outcome of ingesting one PDF.
+    """
+    path: str
+    text: str = ""
+    fields: Dict[str, str] = field(default_factory=dict)
+    pages: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+_worker_cache = None
+
+def _init_worker(cache_path: Optional[str]) -> None:
+    """
+    Opens the shared resume cache once per worker process.
+    """
+    global _worker_cache
+    _worker_cache = ResumeCache(cache_path) if cache_path else None
+
+def _ingest_file(path: str, pages_per_task: int) -> IngestResult:
+    """
+    Worker task: extracts and parses a whole document, or only counts its pages when it is long
+    enough to be split into page-range tasks (the returned result then has no text).
+    """
+    parser = ResumeParser(path, cache=_worker_cache)
+    if _worker_cache is not None and "text" in parser._cached_entry():
+        parser.extract_text()
+        return IngestResult(path, parser.text, parser.parse_text())
+    with open(path, 'rb') as file:
+        page_count = len(PyPDF2.PdfReader(file).pages)
+    if page_count > pages_per_task:
+        return IngestResult(path, pages=page_count)
+    parser.extract_text()
+    return IngestResult(path, parser.text, parser.parse_text(), pages=page_count)
+
+def _extract_pages(path: str, start: int, stop: int) -> str:
+    """
+    Worker task: extracts the text of pages [start, stop) in the same format as ResumeParser.extract_text().
+    """
+    with open(path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        parts = []
+        for page in reader.pages[start:stop]:
+            page_text = page.extract_text()
+            if page_text:
+                parts.append(page_text + "\n")
+        return "".join(parts)
+
+def iter_pdf_paths(folder: str, recursive: bool = True) -> Iterator[str]:
+    """
+    Yields the paths of the PDF files in a folder, in sorted order.
+    """
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith('.pdf'):
+                yield os.path.join(root, name)
+        if not recursive:
+            break
+
+def ingest(paths: Iterable[str], workers: int = None, pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+           cache_path: str = None, max_pending: int = None) -> Iterator[IngestResult]:
+    """
+    Extracts and parses many PDFs in parallel, yielding one IngestResult per file as it finishes.
+
+    Args:
+        paths (Iterable[str]): PDF files to ingest. Consumed lazily.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        pages_per_task (int): Documents with more pages are split into page-range tasks.
+        cache_path (str, optional): ResumeCache file shared by the workers.
+        max_pending (int, optional): Maximum number of tasks in flight. Defaults to 4 per worker,
+                                     which keeps memory flat on very large directories.
+
+    Yields:
+        IngestResult: Results in completion order. Failed files have error set.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    cache = ResumeCache(cache_path) if cache_path else None
+    path_iter = iter(paths)
+    # future -> (task, isolated); a task is ("file", path) or ("pages", path, start, stop).
+    pending = {}
+    # path -> {"parts": [...], "remaining": n, "pages": n} for documents split into page ranges.
+    split_docs = {}
+    queued = []
+    # Tasks that were in flight when a worker died. They are re-run one at a time so the file
+    # that crashes the worker can be pinned down without failing its neighbours.
+    suspects = []
+
+    def submit(pool, task, isolated=False):
+        if task[0] == "file":
+            future = pool.submit(_ingest_file, task[1], pages_per_task)
+        else:
+            future = pool.submit(_extract_pages, *task[1:])
+        pending[future] = (task, isolated)
+
+    def fill(pool):
+        if suspects:
+            if not pending:
+                submit(pool, suspects.pop(), isolated=True)
+            return
+        while queued and len(pending) < max_pending:
+            submit(pool, queued.pop())
+        while len(pending) < max_pending:
+            path = next(path_iter, None)
+            if path is None:
+                return
+            submit(pool, ("file", path))
+
+    def new_pool():
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_path,))
+
+    pool = new_pool()
+    try:
+        fill(pool)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                task, isolated = pending.pop(future)
+                path = task[1]
+                try:
+                    value = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    if not isolated:
+                        suspects.append(task)
+                        continue
+                    if task[0] == "pages" and split_docs.pop(path, None) is None:
+                        continue
+                    logger.error(f"Failed to ingest {path}: worker process crashed")
+                    yield IngestResult(path, error="worker process crashed")
+                    continue
+                except Exception as e:
+                    # Only the first failing page range of a split document is reported.
+                    if task[0] == "pages" and split_docs.pop(path, None) is None:
+                        continue
+                    logger.error(f"Failed to ingest {path}: {e}")
+                    yield IngestResult(path, error=str(e))
+                    continue
+
+                if task[0] == "file":
+                    if value.text or value.pages <= pages_per_task:
+                        yield value
+                        continue
+                    starts = range(0, value.pages, pages_per_task)
+                    split_docs[path] = {"parts": [None] * len(starts), "remaining": len(starts), "pages": value.pages}
+                    for start in starts:
+                        queued.append(("pages", path, start, min(start + pages_per_task, value.pages)))
+                elif path in split_docs:
+                    doc = split_docs[path]
+                    doc["parts"][task[2] // pages_per_task] = value
+                    doc["remaining"] -= 1
+                    if doc["remaining"] == 0:
+                        del split_docs[path]
+                        yield _assemble(path, "".join(doc["parts"]), doc["pages"], cache)
+
+            if broken:
+                suspects.extend(task for task, _ in pending.values())
+                pending.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = new_pool()
+            fill(pool)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _assemble(path: str, text: str, pages: int, cache: Optional[ResumeCache]) -> IngestResult:
+    """
+    Parses the fields of a document whose pages were extracted by separate tasks.
+    """
+    try:
+        parser = ResumeParser(path, cache=cache)
+        parser.text = text
+        if cache is not None:
+            parser._cache_key = cache.key_for(path)
+            cache.update(parser._cache_key, text=text)
+        return IngestResult(path, text, parser.parse_text(), pages=pages)
+    except Exception as e:
+        logger.error(f"Failed to parse {path}: {e}")
+        return IngestResult(path, error=str(e))
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command-line entry point: ingests a directory and writes one JSON line per resume.
+    """
+    arg_parser = argparse.ArgumentParser(description="Ingest a directory of PDF resumes in parallel.")
+    arg_parser.add_argument("folder", help="Directory containing PDF resumes.")
+    arg_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes.")
+    arg_parser.add_argument("--pages-per-task", type=int, default=DEFAULT_PAGES_PER_TASK,
+                            help="Split documents with more pages into several tasks.")
+    arg_parser.add_argument("--cache", default=None, help="ResumeCache file to read and populate.")
+    arg_parser.add_argument("--no-text", action="store_true", help="Leave the extracted text out of the output.")
+    arg_parser.add_argument("--output", default="-", help="JSONL output file ('-' for stdout).")
+    args = arg_parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(args.output, 'w', encoding='utf-8')
+    succeeded = failed = 0
+    try:
+        for result in ingest(iter_pdf_paths(args.folder), args.workers, args.pages_per_task, args.cache):
+            record = asdict(result)
+            if args.no_text:
+                record.pop("text")
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            if result.ok:
+                succeeded += 1
+            else:
+                failed += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    logger.info(f"Ingested {succeeded} resumes, {failed} failed.")
+    return 1 if failed and not succeeded else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Module: content_extractor.py
+Purpose: Extracts the main content of a job posting page before it is sent to an LLM.
+
+A job page carries navigation bars, footers, cookie banners and "similar jobs" lists around the
+posting itself. Sending all of it to the LLM wastes tokens. The extractor first removes elements
+that are boilerplate by tag (nav, header, footer, aside, form, ...) or by id/class name (cookie,
+banner, related, share, ...). It then scores every text block (paragraph, list item, ...) by the
+amount of text it holds and by how little of that text is link text. Each block's score is added
+to its parent and half of it to its grandparent, so the container holding the most dense,
+link-poor text wins. That container and its well-scoring siblings are kept, whitespace is
+collapsed, and the result is cut to a token budget.
+
+Token counts are estimated as characters / 4, which is close enough for English text with the
+common LLM tokenizers and needs no tokenizer dependency.
+"""
+
+import re
+import math
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 3000
+
+# Elements that never hold the posting text.
+DROPPED_TAGS = ["script", "style", "noscript", "template", "svg", "iframe", "nav", "header", "footer",
+                "aside", "form", "button", "select", "dialog"]
+# Elements whose text is scored.
+TEXT_BLOCK_TAGS = {"p", "li", "td", "pre", "blockquote", "dd", "dt", "h2", "h3", "h4", "h5", "h6", "div", "section"}
+BOILERPLATE_NAMES = re.compile(
+    r"cookie|consent|banner|breadcrumb|nav|menu|footer|header|sidebar|related|similar|recommend|share|social|"
+    r"subscribe|newsletter|signup|login|modal|popup|advert|promo|comment", re.IGNORECASE)
+CONTENT_NAMES = re.compile(r"job|description|posting|content|main|article|detail|requirement|qualification|body",
+                           re.IGNORECASE)
+# Blocks shorter than this are too small to say anything about the layout.
+MIN_BLOCK_CHARS = 25
+
+_WHITESPACE = re.compile(r"[ \t\r\f\v\xa0]+")
+
+@dataclass
+class ContentExtraction:
+    """
+    The main content of a page and the tokens it saves.
+
+    Attributes:
+        text (str): The extracted main content, within the token budget.
+        tokens (int): Estimated tokens of text.
+        page_tokens (int): Estimated tokens of the whole page text without scripts and styles, as
+                           JobDescriptionExtractor.extract_text() produces it.
+        truncated (bool): Whether the content was cut to fit the token budget.
+    """
+    text: str
+    tokens: int
+    page_tokens: int
+    truncated: bool = False
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.page_tokens - self.tokens)
+
+def estimate_tokens(text: str) -> int:
+    """
+    Returns an estimate of the number of LLM tokens in text.
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+def collapse_whitespace(text: str) -> str:
+    """
+    Collapses runs of spaces within lines and drops empty lines.
+    """
+    lines = (_WHITESPACE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+def _names(element: Tag) -> str:
+    return " ".join([element.get("id") or ""] + list(element.get("class") or []))
+
+def _class_weight(element: Tag) -> int:
+    names = _names(element)
+    weight = 0
+    if CONTENT_NAMES.search(names):
+        weight += 25
+    if BOILERPLATE_NAMES.search(names):
+        weight -= 25
+    if element.name in ("article", "main"):
+        weight += 25
+    return weight
+
+def _link_density(element: Tag, text_length: int) -> float:
+    link_length = sum(len(link.get_text(" ", strip=True)) for link in element.find_all("a"))
+    return min(1.0, link_length / text_length) if text_length else 1.0
+
+def _remove_boilerplate(soup: BeautifulSoup) -> None:
+    for element in soup(DROPPED_TAGS):
+        element.decompose()
+    for element in soup.find_all(True):
+        if element.decomposed or element.name in ("html", "body", "main", "article"):
+            continue
+        names = _names(element)
+        if names.strip() and BOILERPLATE_NAMES.search(names) and not CONTENT_NAMES.search(names):
+            element.decompose()
+
+def _score_candidates(soup: BeautifulSoup) -> Dict[int, Tuple[Tag, float]]:
+    """
+    Scores the parents and grandparents of every text block.
+
+    Returns:
+        Dict[int, Tuple[Tag, float]]: Candidate and score keyed by id(candidate); Tag hashes its
+        markup, so it cannot be a dict key itself.
+    """
+    scores: Dict[int, Tuple[Tag, float]] = {}
+    for block in soup.find_all(TEXT_BLOCK_TAGS):
+        # Containers are only scored through the blocks inside them.
+        if block.name in ("div", "section") and block.find(TEXT_BLOCK_TAGS):
+            continue
+        text = block.get_text(" ", strip=True)
+        if len(text) < MIN_BLOCK_CHARS:
+            continue
+        score = (1 + text.count(",") + min(len(text) / 100, 3)) * (1 - _link_density(block, len(text)))
+        for ancestor, share in ((block.parent, 1.0), (block.parent.parent if block.parent else None, 0.5)):
+            if isinstance(ancestor, Tag) and ancestor.name != "[document]":
+                _, current = scores.get(id(ancestor), (ancestor, float(_class_weight(ancestor))))
+                scores[id(ancestor)] = (ancestor, current + score * share)
+    # Favour containers whose text is not mostly links.
+    for key, (candidate, score) in scores.items():
+        text_length = len(candidate.get_text(" ", strip=True))
+        scores[key] = (candidate, score * (1 - _link_density(candidate, text_length)))
+    return scores
+
+def _main_elements(soup: BeautifulSoup) -> Optional[List[Tag]]:
+    """
+    Returns the best scored container and its siblings that score well enough, in document order.
+    """
+    scores = _score_candidates(soup)
+    if not scores:
+        return None
+    top, top_score = max(scores.values(), key=lambda item: item[1])
+    if top.parent is None:
+        return [top]
+    threshold = max(10.0, top_score * 0.2)
+    return [sibling for sibling in top.parent.find_all(True, recursive=False)
+            if sibling is top or scores.get(id(sibling), (None, 0.0))[1] >= threshold]
+
+def truncate_to_budget(text: str, token_budget: int) -> str:
+    """
+    Cuts text to at most token_budget estimated tokens, at a line boundary when possible.
+    """
+    max_chars = token_budget * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars + 1)
+    return text[:cut if cut > 0 else max_chars]
+
+def extract_main_content(html: str, token_budget: int = DEFAULT_TOKEN_BUDGET) -> ContentExtraction:
+    """
+    Extracts the main content of an HTML page.
+
+    Args:
+        html (str): The page HTML.
+        token_budget (int): Maximum estimated tokens of the returned text.
+
+    Returns:
+        ContentExtraction: The content and its token statistics. Pages without any scorable
+        text block fall back to the whole page text without boilerplate.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(["script", "style"]):
+        element.decompose()
+    page_text = soup.get_text(separator="\n")
+    title = soup.find("h1")
+    title_text = title.get_text(" ", strip=True) if title else ""
+
+    _remove_boilerplate(soup)
+    elements = _main_elements(soup)
+    if elements is None:
+        text = collapse_whitespace(soup.get_text(separator="\n"))
+    else:
+        text = collapse_whitespace("\n".join(element.get_text(separator="\n") for element in elements))
+        # The job title usually sits outside the content container.
+        if title_text and title_text not in text:
+            text = f"{title_text}\n{text}"
+
+    content = truncate_to_budget(text, token_budget)
+    result = ContentExtraction(content, estimate_tokens(content), estimate_tokens(page_text), len(content) < len(text))
+    logger.info(f"Main content: {result.tokens} tokens of {result.page_tokens} "
+                f"({result.tokens_saved} saved{', truncated' if result.truncated else ''}).")
+    return result
@@ -0,0 +1,185 @@
+"""
+Module: corpus_stats.py
+Purpose: Document-frequency statistics over a corpus of job descriptions, used to weight ATS
+         keywords by inverse document frequency (IDF).
+
+With plain ATS scoring every criteria keyword counts the same, so "team" weighs as much as
+"kubernetes". CorpusStats records in how many postings each keyword appears; rare keywords then
+get a high weight and ubiquitous ones a low weight. The statistics live in a small gzipped JSON
+file that is loaded once per process (see load_corpus_stats()), and new postings can be added
+incrementally. IDF weights are cached and only recomputed after the statistics change. Digests of
+the most recently added postings (at most max_seen) are kept, so adding the same posting again is
+a no-op while the file stays bounded.
+
+Usage:
+    python -m src.corpus_stats data/jd_stats.json.gz postings/*.txt
+"""
+
+import os
+import sys
+import gzip
+import json
+import math
+import hashlib
+import logging
+from typing import Callable, Dict, Iterable, List
+from src.text_pipeline import DEFAULT_NORMALIZER
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATS_FORMAT_VERSION = 1
+# Document digests remembered for de-duplication; the oldest are forgotten first.
+MAX_SEEN = 50000
+
+_loaded: Dict[str, "CorpusStats"] = {}
+
+class CorpusStats:
+    """
+    Keyword document frequencies over a corpus of job descriptions.
+    """
+
+    def __init__(self, path: str = None, max_seen: int = MAX_SEEN):
+        """
+        Args:
+            path (str, optional): File the statistics are saved to by save().
+            max_seen (int): Number of recent document keys remembered, so re-adding one of those
+                            documents is a no-op. Older documents are counted again if re-added.
+        """
+        self.path = path
+        self.max_seen = max_seen
+        self.document_count = 0
+        self.document_frequency: Dict[str, int] = {}
+        # Keys of the documents counted most recently, oldest first.
+        self.seen: Dict[str, None] = {}
+        self._idf_cache: Dict[str, float] = {}
+
+    def add_document(self, keywords: Iterable[str], doc_key: str = None) -> bool:
+        """
+        Counts one document's distinct keywords.
+
+        Args:
+            keywords (Iterable[str]): The document's keywords; duplicates are ignored.
+            doc_key (str, optional): Unique key of the document. A key that was already added is skipped.
+
+        Returns:
+            bool: True if the document was counted.
+        """
+        if doc_key is not None:
+            if doc_key in self.seen:
+                return False
+            self.seen[doc_key] = None
+            if len(self.seen) > self.max_seen:
+                del self.seen[next(iter(self.seen))]
+        for keyword in set(keywords):
+            self.document_frequency[keyword] = self.document_frequency.get(keyword, 0) + 1
+        self.document_count += 1
+        # Every IDF depends on the document count, so cached weights are stale now.
+        self._idf_cache.clear()
+        return True
+
+    def add_text(self, text: str, keyword_extractor: Callable[[str], Iterable[str]] = None) -> bool:
+        """
+        Counts a job description, keyed by the digest of its text.
+
+        Args:
+            text (str): The job description text.
+            keyword_extractor (Callable, optional): Function returning the keywords of a text, e.g.
+                ATSEvaluator(...).extract_keywords. Defaults to the shared TextNormalizer.
+
+        Returns:
+            bool: True if the text was not counted before.
+        """
+        extractor = keyword_extractor or DEFAULT_NORMALIZER.keywords
+        doc_key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=12).hexdigest()
+        if doc_key in self.seen:
+            return False
+        return self.add_document(extractor(text), doc_key)
+
+    def idf(self, keyword: str) -> float:
+        """
+        Returns the smoothed IDF of a keyword: ln((1 + N) / (1 + df)) + 1. Unseen keywords get
+        the highest weight, and every weight is at least 1.
+        """
+        weight = self._idf_cache.get(keyword)
+        if weight is None:
+            df = self.document_frequency.get(keyword, 0)
+            weight = math.log((1 + self.document_count) / (1 + df)) + 1.0
+            self._idf_cache[keyword] = weight
+        return weight
+
+    def weights(self, keywords: Iterable[str]) -> List[float]:
+        """
+        Returns the IDF weight of each keyword, in order.
+        """
+        return [self.idf(keyword) for keyword in keywords]
+
+    def save(self, path: str = None) -> None:
+        """
+        Writes the statistics to a gzipped JSON file atomically.
+
+        Args:
+            path (str, optional): Destination. Defaults to the path given at construction.
+        """
+        path = path or self.path
+        data = {
+            "version": STATS_FORMAT_VERSION,
+            "documents": self.document_count,
+            "df": self.document_frequency,
+            "seen": list(self.seen),
+        }
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as file:
+            json.dump(data, file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        self.path = path
+        logger.info(f"Saved corpus statistics for {self.document_count} documents to {path}.")
+
+    @classmethod
+    def load(cls, path: str, max_seen: int = MAX_SEEN) -> "CorpusStats":
+        """
+        Reads statistics written by save(). A missing file gives empty statistics bound to path.
+        """
+        stats = cls(path, max_seen)
+        if not os.path.exists(path):
+            return stats
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get("version") != STATS_FORMAT_VERSION:
+            logger.warning(f"Ignoring corpus statistics at {path} with unsupported version {data.get('version')}.")
+            return stats
+        stats.document_count = data["documents"]
+        stats.document_frequency = data["df"]
+        stats.seen = dict.fromkeys(data["seen"][-max_seen:] if max_seen > 0 else [])
+        return stats
+
+def load_corpus_stats(path: str) -> CorpusStats:
+    """
+    Returns the statistics stored at path, reading the file only once per process.
+    """
+    path = os.path.abspath(path)
+    stats = _loaded.get(path)
+    if stats is None:
+        stats = CorpusStats.load(path)
+        _loaded[path] = stats
+    return stats
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command-line entry point: adds job description text files to a statistics file.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Usage: python -m src.corpus_stats STATS_FILE JOB_DESCRIPTION.txt [...]")
+        return 2
+    stats = load_corpus_stats(argv[0])
+    added = 0
+    for name in argv[1:]:
+        with open(name, 'r', encoding='utf-8') as file:
+            added += stats.add_text(file.read())
+    stats.save()
+    print(f"Added {added} new job descriptions; corpus now holds {stats.document_count}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
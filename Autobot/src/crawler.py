@@ -0,0 +1,238 @@
+"""
+Module: crawler.py
+Purpose: Fetches many job posting pages concurrently while staying polite to each host.
+
+Crawler.crawl() takes an iterable of URLs (it may be a generator over thousands of postings) and
+yields a CrawlResult for each page as soon as it is downloaded. At most `concurrency` requests are in
+flight overall, and at most `per_host` of them go to the same host. The event loop schedules the
+requests; the downloads themselves run on a thread pool over one keep-alive requests.Session, so
+the crawler needs no async HTTP library. Redirects are followed by requests, and compressed bodies
+are decoded by urllib3: gzip and deflate always, and brotli when the brotli package is installed.
+Duplicate URLs are fetched once. With an HTTPCache, unchanged pages are revalidated instead of
+downloaded again. Synchronous callers can consume the results as they arrive with stream(), which
+runs the crawl on a background thread and hands pages over through a bounded queue.
+
+Usage:
+    results = Crawler(concurrency=64, per_host=4).run(urls)
+    for result in Crawler().stream(urls):
+        ...
+"""
+
+import time
+import queue
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from src.http_cache import HTTPCache
+from src.telemetry import count, span
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; Autobot job crawler)"
+
+@dataclass
+class CrawlResult:
+    """
+    The outcome of fetching one URL.
+
+    Attributes:
+        url (str): The requested URL.
+        final_url (str): The URL after redirects.
+        status (int): HTTP status code, or 0 if the request failed.
+        html (str): The decoded body; empty on errors.
+        elapsed (float): Seconds spent on the request.
+        error (str, optional): Why the request failed.
+        from_cache (bool): The body is an unchanged copy from the HTTP cache.
+    """
+    url: str
+    final_url: str
+    status: int
+    html: str
+    elapsed: float
+    error: Optional[str] = None
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and (200 <= self.status < 300 or self.from_cache)
+
+class Crawler:
+    """
+    A concurrent page fetcher with global and per-host concurrency limits.
+    """
+
+    def __init__(self, concurrency: int = 64, per_host: int = 4, connect_timeout: float = 5.0,
+                 read_timeout: float = 20.0, max_redirects: int = 5, user_agent: str = USER_AGENT,
+                 http_cache: HTTPCache = None):
+        """
+        Args:
+            concurrency (int): Maximum number of requests in flight overall.
+            per_host (int): Maximum number of requests in flight to one host.
+            connect_timeout (float): Seconds to wait for a connection.
+            read_timeout (float): Seconds to wait for the server between bytes of the response.
+            max_redirects (int): Redirects followed before a request fails.
+            user_agent (str): User-Agent header sent with every request.
+            http_cache (HTTPCache, optional): Cache that serves fresh pages and revalidates stale ones.
+        """
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = (connect_timeout, read_timeout)
+        self.http_cache = http_cache
+        self.session = requests.Session()
+        self.session.max_redirects = max_redirects
+        self.session.headers.update({"User-Agent": user_agent, "Accept-Encoding": ACCEPT_ENCODING})
+        # One pool per host, each as large as the per-host limit.
+        adapter = HTTPAdapter(pool_connections=max(16, concurrency), pool_maxsize=per_host, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url: str) -> CrawlResult:
+        """
+        Downloads one page; runs in a worker thread.
+        """
+        start = time.perf_counter()
+        try:
+            with span("crawl_fetch"):
+                if self.http_cache is not None:
+                    page = self.http_cache.fetch(url, session=self.session, timeout=self.timeout)
+                    return CrawlResult(url, page.final_url, page.status, page.html, time.perf_counter() - start,
+                                       from_cache=page.from_cache)
+                response = self.session.get(url, timeout=self.timeout)
+                count("http_fetch_bytes", len(response.content))
+                html = response.text if response.status_code < 400 else ""
+                return CrawlResult(url, response.url, response.status_code, html, time.perf_counter() - start)
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            count("http_fetch_errors")
+            return CrawlResult(url, url, 0, "", time.perf_counter() - start, str(e))
+
+    async def crawl(self, urls: Iterable[str]) -> AsyncIterator[CrawlResult]:
+        """
+        Fetches URLs concurrently and yields their results in completion order.
+
+        Args:
+            urls (Iterable[str]): The URLs; consumed lazily, so it may be a generator.
+
+        Yields:
+            CrawlResult: One result per distinct URL.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="crawler")
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(url: str) -> CrawlResult:
+            host = urlsplit(url).netloc.lower()
+            limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+            async with limit:
+                return await loop.run_in_executor(executor, self.fetch, url)
+
+        # Requests waiting for their host keep a slot, so the window is larger than the thread pool;
+        # otherwise one slow host could hold every slot while the pool sits idle.
+        window = self.concurrency * 4
+        url_iterator = iter(urls)
+        seen = set()
+        pending = set()
+        fetched = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                while len(pending) < window:
+                    url = next(url_iterator, None)
+                    if url is None:
+                        break
+                    if url not in seen:
+                        seen.add(url)
+                        pending.add(asyncio.ensure_future(fetch(url)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    fetched += 1
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            executor.shutdown(wait=False)
+        elapsed = time.perf_counter() - start
+        logger.info(f"Crawled {fetched} pages in {elapsed:.2f}s ({fetched / elapsed if elapsed else 0:.0f} pages/s).")
+
+    def run(self, urls: Iterable[str]) -> List[CrawlResult]:
+        """
+        Blocking helper around crawl() for callers without an event loop.
+
+        Returns:
+            List[CrawlResult]: The results in completion order.
+        """
+        async def collect() -> List[CrawlResult]:
+            return [result async for result in self.crawl(urls)]
+        return asyncio.run(collect())
+
+    def stream(self, urls: Iterable[str], buffer: int = None) -> Iterator[CrawlResult]:
+        """
+        Blocking iterator over crawl() for callers without an event loop. The crawl runs on a
+        background thread and each result is yielded as soon as it is downloaded. At most `buffer`
+        results wait to be consumed; while the buffer is full no new requests are started.
+
+        Args:
+            urls (Iterable[str]): The URLs; consumed lazily, so it may be a generator.
+            buffer (int, optional): Results held for the consumer. Defaults to `concurrency`.
+
+        Yields:
+            CrawlResult: One result per distinct URL, in completion order.
+        """
+        results: queue.Queue = queue.Queue(maxsize=buffer or self.concurrency)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        done = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        async def pump() -> None:
+            crawl = self.crawl(urls)
+            try:
+                async for result in crawl:
+                    if not put(result):
+                        break
+            finally:
+                await crawl.aclose()
+
+        def produce() -> None:
+            try:
+                asyncio.run(pump())
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                put(done)
+
+        thread = threading.Thread(target=produce, name="crawler-stream", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            # Stops the crawl if the consumer gave up early; in-flight requests finish on their own.
+            stop.set()
+        thread.join()
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        self.session.close()
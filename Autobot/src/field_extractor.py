@@ -0,0 +1,258 @@
+"""
+Module: field_extractor.py
+Purpose: Extracts resume fields from text with declarative field specs.
+
+Each field is declared once as a FieldSpec: a name and a regular expression whose first capture
+group holds the value. All requested fields are found in a single pass over the text: their
+patterns are combined into one regular expression that the engine runs once, instead of one
+search per field, so the scan time barely grows as fields are added.
+
+Every alternative of the combined pattern matches its field inside a lookahead and consumes only
+one character, so the fields may overlap exactly as with one re.search() per field: a greedy
+"Name:" value running to the end of the line does not hide an "Email:" later on the same line.
+The combined pattern starts with the set of characters any field can start with, so the engine
+skips all other positions without trying the alternatives, and each alternative starts with its
+own field's characters, so a candidate position only tries the fields that can start there.
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NOT_FOUND = "Not found"
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Declaration of one extractable field.
+
+    Attributes:
+        name (str): Field name; must be a valid Python identifier.
+        pattern (str): Regular expression whose first capture group is the value. It is embedded
+                       in the extractor's combined pattern, so it may not use named groups or
+                       backreferences.
+        multiple (bool): Collect every match instead of only the first one.
+        ignore_case (bool): Match case-insensitively.
+        first_chars (str): Characters a match can start with. Only needed when the pattern does not
+                           begin with a literal letter or digit; it lets the scanner skip positions,
+                           and without it every position is a candidate for this field.
+    """
+    name: str
+    pattern: str
+    multiple: bool = False
+    ignore_case: bool = False
+    first_chars: str = ""
+
+    def starting_chars(self) -> Optional[str]:
+        """
+        Returns the characters a match can start with, or None if they are unknown.
+        """
+        if self.first_chars:
+            chars = self.first_chars
+        elif self.pattern[:1].isalnum():
+            chars = self.pattern[0]
+        else:
+            return None
+        return chars + chars.swapcase() if self.ignore_case else chars
+
+_MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?"
+
+DEFAULT_FIELD_SPECS = [
+    FieldSpec("name", r"Name:\s*(.+)"),
+    FieldSpec("email", r"Email:\s*([\w\.-]+@[\w\.-]+)"),
+    FieldSpec("phone", r"Phone:\s*([\d\-\+\(\)\s]+)"),
+    FieldSpec("location", r"Location:\s*(.+)"),
+    FieldSpec("skills", r"Skills:\s*(.+)", ignore_case=True),
+    FieldSpec("education", r"\b((?:Bachelor|Master|B\.?\s?Tech|M\.?\s?Tech|B\.?S\.?c?|M\.?S\.?c?|Ph\.?\s?D|MBA)\b[^\n]*)",
+              first_chars="BMP"),
+    FieldSpec("links", r"((?:https?://|www\.)[^\s,;]+)", multiple=True, ignore_case=True, first_chars="hw"),
+    FieldSpec("dates", r"\b(" + _MONTH + r"\s+\d{4}|\d{1,2}/\d{4})", multiple=True,
+              first_chars="JFMASOND0123456789"),
+]
+
+@dataclass(frozen=True)
+class _Alternative:
+    """
+    A field's alternative in a combined pattern.
+
+    Attributes:
+        name (str): Field name, also the name of the field's group.
+        group (int): Number of the field's group.
+        value_group (int): Number of the group holding the value.
+        multiple (bool): Whether the field is multi-valued.
+        later (tuple): (name, starting characters, pattern, multiple) of the fields after this one
+                       that can start at the same position.
+    """
+    name: str
+    group: int
+    value_group: int
+    multiple: bool
+    later: Tuple[Tuple[str, Optional[str], re.Pattern, bool], ...]
+
+class FieldExtractor:
+    """
+    A reusable extractor for a set of FieldSpecs.
+    """
+
+    def __init__(self, specs: Sequence[FieldSpec] = None):
+        """
+        Args:
+            specs (Sequence[FieldSpec], optional): Field declarations. Defaults to DEFAULT_FIELD_SPECS.
+        """
+        self.specs = {spec.name: spec for spec in (specs or DEFAULT_FIELD_SPECS)}
+        # Compiled pattern of each field, built on first use.
+        self._patterns: Dict[str, re.Pattern] = {}
+        # Combined pattern and, by field group number, the field's _Alternative, keyed by the tuple
+        # of requested field names.
+        self._plans: Dict[Tuple[str, ...], Tuple[re.Pattern, Dict[int, _Alternative]]] = {}
+
+    @property
+    def field_names(self) -> List[str]:
+        return list(self.specs)
+
+    def _pattern(self, name: str) -> re.Pattern:
+        """
+        Returns the compiled pattern of a single field.
+        """
+        pattern = self._patterns.get(name)
+        if pattern is None:
+            spec = self.specs[name]
+            pattern = re.compile(spec.pattern, re.IGNORECASE if spec.ignore_case else 0)
+            self._patterns[name] = pattern
+        return pattern
+
+    def _plan(self, fields: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[int, _Alternative]]:
+        """
+        Returns the combined pattern of the requested fields and the alternative of each field by
+        the number of its group in the combined pattern.
+
+        The alternative of a field is "[chars](?<=(?=(?P<field>pattern))(?s:.))": it consumes one of
+        the characters the field starts with, then steps back to run the field's pattern in a lookahead.
+        """
+        plan = self._plans.get(fields)
+        if plan is None:
+            starts = {name: self.specs[name].starting_chars() for name in fields}
+            all_chars = None if None in starts.values() else set("".join(starts.values()))
+            sources = []
+            for name in fields:
+                spec = self.specs[name]
+                source = f"(?i:{spec.pattern})" if spec.ignore_case else spec.pattern
+                sources.append(f"{_char_class(starts[name])}(?<=(?=(?P<{name}>{source}))(?s:.))")
+            combined = re.compile(f"{_char_class(all_chars)}(?<={'|'.join(sources)})")
+
+            alternatives = {}
+            for position, name in enumerate(fields):
+                # The later fields that can start where this one does.
+                later = tuple(
+                    (other, starts[other], self._pattern(other), self.specs[other].multiple)
+                    for other in fields[position + 1:]
+                    if starts[name] is None or starts[other] is None or set(starts[name]) & set(starts[other])
+                )
+                group = combined.groupindex[name]
+                alternatives[group] = _Alternative(name, group, group + 1, self.specs[name].multiple, later)
+            plan = self._plans[fields] = (combined, alternatives)
+        return plan
+
+    def scan(self, text: str, fields: Sequence[str] = None) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Finds the requested fields in text.
+
+        Args:
+            text (str): The text to scan.
+            fields (Sequence[str], optional): Field names to look for. Defaults to all fields.
+
+        Returns:
+            Dict[str, List[Tuple[str, int]]]: For each field, (value, end offset of the match)
+            pairs in text order; single-valued fields have at most one entry.
+        """
+        fields = tuple(fields or self.specs)
+        combined, alternatives = self._plan(fields)
+        found: Dict[str, List[Tuple[str, int]]] = {name: [] for name in fields}
+        # Where the next match of each field may start: as with finditer(), the matches of a
+        # multi-valued field do not overlap.
+        next_start = {name: 0 for name in fields}
+        remaining = sum(not self.specs[name].multiple for name in fields)
+        everything_single = remaining == len(fields)
+        for match in combined.finditer(text):
+            start = match.start()
+            alternative = alternatives[match.lastindex]
+            hits = [(alternative.name, match.group(alternative.value_group), match.end(alternative.group),
+                     alternative.multiple)]
+            # Only the first alternative that matches at a position is reported; the later fields
+            # that can start there are checked on their own.
+            for name, chars, pattern, multiple in alternative.later:
+                if chars is None or text[start] in chars:
+                    other = pattern.match(text, start)
+                    if other:
+                        hits.append((name, other.group(1), other.end(), multiple))
+            for name, value, end, multiple in hits:
+                if start < next_start[name]:
+                    continue
+                found[name].append((value.strip(), end))
+                if multiple:
+                    next_start[name] = max(end, start + 1)
+                else:
+                    next_start[name] = len(text) + 1
+                    remaining -= 1
+            if everything_single and not remaining:
+                break
+        return found
+
+    def extract(self, text: str, fields: Sequence[str] = None) -> Dict[str, object]:
+        """
+        Extracts field values from text.
+
+        Args:
+            text (str): The text to scan.
+            fields (Sequence[str], optional): Field names to extract. Defaults to all fields.
+
+        Returns:
+            Dict[str, object]: The value of each single-valued field ("Not found" if absent) and
+            the list of values of each multi-valued field.
+        """
+        return self.values(self.scan(text, fields))
+
+    def values(self, found: Dict[str, List[Tuple[str, int]]]) -> Dict[str, object]:
+        """
+        Converts the output of scan() to field values.
+        """
+        data = {}
+        for name, matches in found.items():
+            if self.specs[name].multiple:
+                data[name] = [value for value, _ in matches]
+            else:
+                data[name] = matches[0][0] if matches else NOT_FOUND
+        return data
+
+    def is_settled(self, found: Dict[str, List[Tuple[str, int]]], text_length: int) -> bool:
+        """
+        Tells whether a scan of a prefix of a document already holds the final value of every field:
+        each field is single-valued and was matched with more text following the match.
+        """
+        for name, matches in found.items():
+            if self.specs[name].multiple or not matches or matches[0][1] >= text_length:
+                return False
+        return True
+
+def _char_class(chars: Optional[Iterable[str]]) -> str:
+    """
+    Returns a regex matching one of chars, or any character if chars is None.
+    """
+    if chars is None:
+        return "(?s:.)"
+    return "[" + "".join(sorted({re.escape(char) for char in chars})) + "]"
+
+_default_extractor: Optional[FieldExtractor] = None
+
+def default_extractor() -> FieldExtractor:
+    """
+    Returns a shared FieldExtractor for DEFAULT_FIELD_SPECS.
+    """
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = FieldExtractor()
+    return _default_extractor
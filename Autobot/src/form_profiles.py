@@ -0,0 +1,204 @@
+"""
+Module: form_profiles.py
+Purpose: Declarative per-site descriptions of job application forms, and the browser scripts that
+         fill them in as few WebDriver round trips as possible.
+
+A FormProfile lists the form's fields as CSS selectors mapped to resume_data keys, plus an optional
+selector to wait for before filling ("ready"), the submit button and a selector that confirms the
+submission. Profiles are read from Config/form_profiles.json and chosen by the host of the
+application URL, falling back to the "default" profile.
+
+All text fields are filled by one injected script (FILL_SCRIPT), which sets each value and fires
+the input and change events that frameworks listen to. A field whose selector matches nothing, or
+matches an element that takes no text value, is skipped and reported without failing the rest. File inputs cannot be set from JavaScript,
+so they still take one send_keys() each. Readiness is detected by READY_SCRIPT. This asynchronous
+script resolves on the page's load event and, when a selector is given, on a MutationObserver
+seeing that element appear, so nothing waits for a fixed time. SUBMIT_SCRIPT clicks the submit
+button and likewise waits for the submission to be handled: the profile's confirmation appearing,
+the form being removed, or the page navigating away.
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+from typing import Dict, List, Optional, Tuple
+from src.field_extractor import NOT_FOUND
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Config', 'form_profiles.json')
+RESUME_KEY = "resume"
+
+# arguments[0]: [[selector, value], ...]. Returns [selector, reason] for every field that was not
+# filled: no element matched, or the element is not a text input, textarea or select.
+FILL_SCRIPT = """
+var skipped = [];
+arguments[0].forEach(function (pair) {
+    var element = document.querySelector(pair[0]);
+    if (!element) { skipped.push([pair[0], 'not found']); return; }
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                  : element instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+                  : element instanceof HTMLInputElement && element.type !== 'file' ? HTMLInputElement.prototype : null;
+    if (!prototype) { skipped.push([pair[0], 'cannot be filled (' + element.tagName.toLowerCase() + ')']); return; }
+    try {
+        var setter = Object.getOwnPropertyDescriptor(prototype, 'value').set;
+        element.focus();
+        setter.call(element, pair[1]);
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        element.blur();
+    } catch (error) {
+        skipped.push([pair[0], 'cannot be filled (' + error + ')']);
+    }
+});
+return skipped;
+"""
+
+# arguments[0]: submit button selector, arguments[1]: confirmation selector or null, arguments[2]:
+# timeout in ms. Calls back with "missing" without clicking if no button matches. Otherwise clicks
+# it and calls back with "confirmed" once the confirmation matches, "detached" once the submitted
+# form leaves the page, or "timeout". A submission that navigates to a new page unloads the script
+# before it calls back, which WebDriver reports as an error.
+SUBMIT_SCRIPT = """
+var selector = arguments[0], confirmation = arguments[1], timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+var button = document.querySelector(selector);
+if (!button) { done('missing'); return; }
+var form = button.form || button;
+var finished = false;
+var observer = new MutationObserver(check);
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    done(result);
+}
+function check() {
+    if (confirmation && document.querySelector(confirmation)) { finish('confirmed'); }
+    else if (!form.isConnected) { finish('detached'); }
+}
+observer.observe(document.documentElement, {childList: true, subtree: true});
+setTimeout(function () { finish('timeout'); }, timeout);
+button.click();
+"""
+
+# arguments[0]: selector or null, arguments[1]: timeout in ms. Calls back with true once the page
+# has loaded and the selector (if any) matches, or with false on timeout.
+READY_SCRIPT = """
+var selector = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    done(result);
+}
+function check() {
+    if (document.readyState === 'complete' && (!selector || document.querySelector(selector))) { finish(true); }
+}
+check();
+if (!finished) {
+    window.addEventListener('load', check);
+    if (selector) {
+        observer = new MutationObserver(check);
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+    }
+    setTimeout(function () { finish(false); }, timeout);
+}
+"""
+
+@dataclass(frozen=True)
+class FormField:
+    """
+    One form field.
+
+    Attributes:
+        selector (str): CSS selector of the input.
+        key (str): resume_data key of the value; "resume" is the PDF path, and "first_name" /
+                   "last_name" default to the parts of "name".
+        type (str): "text" or "file".
+    """
+    selector: str
+    key: str
+    type: str = "text"
+
+@dataclass(frozen=True)
+class FormProfile:
+    """
+    The application form of one site.
+    """
+    name: str
+    fields: Tuple[FormField, ...]
+    hosts: Tuple[str, ...] = ()
+    ready: Optional[str] = None
+    submit: Optional[str] = None
+    confirmation: Optional[str] = None
+
+    def matches(self, url: str) -> bool:
+        """
+        Tells whether the profile applies to a URL: its host is one of hosts or a subdomain of one.
+        """
+        host = (urlsplit(url).hostname or "").lower()
+        return any(host == suffix or host.endswith("." + suffix) for suffix in self.hosts)
+
+    def text_values(self, resume_data: dict) -> List[Tuple[str, str]]:
+        """
+        Returns the (selector, value) pairs of the text fields that have a value in resume_data.
+        """
+        values = []
+        for form_field in self.fields:
+            if form_field.type != "text":
+                continue
+            value = resolve_value(resume_data, form_field.key)
+            if value:
+                values.append((form_field.selector, value))
+        return values
+
+    @property
+    def file_fields(self) -> List[FormField]:
+        return [form_field for form_field in self.fields if form_field.type == "file"]
+
+def resolve_value(resume_data: dict, key: str) -> str:
+    """
+    Returns the value of a key in resume_data as a string, or "" if it is missing.
+    """
+    value = resume_data.get(key)
+    if value is None and key in ("first_name", "last_name"):
+        parts = str(resume_data.get("name") or "").split()
+        if parts and parts[0] != NOT_FOUND.split()[0]:
+            value = parts[0] if key == "first_name" else " ".join(parts[1:])
+    if value is None or value == NOT_FOUND:
+        return ""
+    return ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+
+def parse_profiles(data: Dict[str, dict]) -> Dict[str, FormProfile]:
+    """
+    Builds FormProfiles from their JSON representation.
+    """
+    profiles = {}
+    for name, spec in data.items():
+        fields = tuple(FormField(item["selector"], item["key"], item.get("type", "text")) for item in spec["fields"])
+        profiles[name] = FormProfile(name, fields, tuple(spec.get("hosts", ())), spec.get("ready"),
+                                     spec.get("submit"), spec.get("confirmation"))
+    return profiles
+
+def load_profiles(path: str = DEFAULT_PROFILES_PATH) -> Dict[str, FormProfile]:
+    """
+    Reads form profiles from a JSON file.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        profiles = parse_profiles(json.load(file))
+    logger.info(f"Loaded {len(profiles)} form profiles from {path}.")
+    return profiles
+
+def profile_for(url: str, profiles: Dict[str, FormProfile]) -> FormProfile:
+    """
+    Returns the profile whose hosts match the URL, or the "default" profile.
+    """
+    for profile in profiles.values():
+        if profile.matches(url):
+            return profile
+    return profiles["default"]
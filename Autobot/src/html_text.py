@@ -0,0 +1,157 @@
+"""
+Module: html_text.py
+Purpose: Pluggable backends that turn an HTML page into its visible text.
+
+The "stream" backend is an event-based extractor on top of the standard library's HTMLParser. It
+never builds a tree: strings are collected as the parser reports them, and everything inside
+script, style and noscript is skipped on the fly. It reproduces what the "bs4" backend (and the
+original JobDescriptionExtractor.extract_text()) returns: BeautifulSoup's get_text(separator="\\n")
+after those elements are removed. That includes BeautifulSoup's rule of collapsing
+whitespace-only strings outside pre/textarea to a single newline or space. If the streaming
+parser fails on a page, html_to_text() falls back to BeautifulSoup.
+"""
+
+import html
+import logging
+from html.parser import HTMLParser
+from html.entities import html5
+from typing import Callable, Dict, Iterable, List
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DROPPED_TAGS = frozenset({"script", "style", "noscript"})
+PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+# Characters BeautifulSoup treats as collapsible whitespace.
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+DEFAULT_BACKEND = "stream"
+
+class StreamingTextExtractor(HTMLParser):
+    """
+    Collects the text strings of an HTML document as it is fed, skipping dropped elements.
+    """
+
+    def __init__(self, separator: str = "\n"):
+        # Character references are resolved here, the way BeautifulSoup does, so both backends agree.
+        super().__init__(convert_charrefs=False)
+        self.separator = separator
+        self.strings: List[str] = []
+        self._data: List[str] = []
+        self._skip_depth = 0
+        self._preserve_depth = 0
+
+    def _flush(self) -> None:
+        """
+        Ends the current string, like BeautifulSoup does at every tag, comment or declaration.
+        """
+        if not self._data:
+            return
+        data = "".join(self._data)
+        self._data = []
+        if not self._preserve_depth and not data.strip(ASCII_SPACES):
+            data = "\n" if "\n" in data else " "
+        self.strings.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in DROPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in DROPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth = max(0, self._preserve_depth - 1)
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._data.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(html5.get(f"{name};", f"&{name}"))
+
+    def handle_charref(self, name):
+        self.handle_data(html.unescape(f"&#{name};"))
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.startswith("CDATA[") and not self._skip_depth:
+            self.strings.append(data[len("CDATA["):])
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    @property
+    def text(self) -> str:
+        return self.separator.join(self.strings)
+
+def stream_text(markup: str) -> str:
+    """
+    Extracts the text of a page with the streaming backend.
+    """
+    extractor = StreamingTextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return extractor.text
+
+def stream_text_chunks(chunks: Iterable[str]) -> str:
+    """
+    Extracts the text of a page delivered in pieces, e.g. from a streamed HTTP response.
+    """
+    extractor = StreamingTextExtractor()
+    for chunk in chunks:
+        extractor.feed(chunk)
+    extractor.close()
+    return extractor.text
+
+def soup_text(markup: str) -> str:
+    """
+    Extracts the text of a page with BeautifulSoup.
+    """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(markup, "html.parser")
+    for element in soup(list(DROPPED_TAGS)):
+        element.decompose()
+    return soup.get_text(separator="\n")
+
+BACKENDS: Dict[str, Callable[[str], str]] = {
+    "stream": stream_text,
+    "bs4": soup_text,
+}
+
+def html_to_text(markup: str, backend: str = DEFAULT_BACKEND) -> str:
+    """
+    Returns the visible text of an HTML page.
+
+    Args:
+        markup (str): The page HTML.
+        backend (str): "stream" or "bs4". The streaming backend falls back to BeautifulSoup on errors.
+
+    Returns:
+        str: The text strings of the page joined by newlines.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML text backend: {backend}")
+    try:
+        return BACKENDS[backend](markup)
+    except Exception as e:
+        if backend == "bs4":
+            raise
+        logger.warning(f"Streaming HTML parser failed ({e}); falling back to BeautifulSoup.")
+        return soup_text(markup)
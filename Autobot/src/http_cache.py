@@ -0,0 +1,183 @@
+"""
+Module: http_cache.py
+Purpose: An on-disk HTTP cache with conditional revalidation for fetched job pages.
+
+Pages are stored zlib-compressed in a SQLiteCache together with their ETag, Last-Modified and
+freshness lifetime. The lifetime comes from Cache-Control max-age, or from Expires when max-age is
+absent. A page that is still fresh is served without any request. A stale page is revalidated
+with If-None-Match / If-Modified-Since. When the server answers 304 Not Modified, the stored body
+is reused and so is any structured result recorded for it with store_details(). This lets
+JobDescriptionExtractor skip both the HTML parse and the LLM call for postings that did not
+change. Responses marked no-store are never cached, and no-cache ones are always revalidated.
+"""
+
+import os
+import json
+import time
+import zlib
+import logging
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import requests
+from src.sqlite_cache import SQLiteCache, CACHE_DIR
+from src.telemetry import count
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+@dataclass
+class HTTPFetch:
+    """
+    The outcome of a cached GET.
+
+    Attributes:
+        url (str): The requested URL.
+        status (int): Status of the network response, or 200 when a fresh copy was served without
+                      one. A revalidated page keeps the 304.
+        html (str): The page body (from the cache after a 304).
+        final_url (str): The URL after redirects.
+        from_cache (bool): The body is the stored copy, unchanged since it was cached.
+        details (Dict[str, object]): Structured results stored for this copy, by variant.
+    """
+    url: str
+    status: int
+    html: str
+    final_url: str
+    from_cache: bool = False
+    details: Dict[str, object] = field(default_factory=dict)
+
+def parse_cache_control(headers) -> Dict[str, Optional[str]]:
+    """
+    Returns the Cache-Control directives of a response, lower-cased, with their values (or None).
+    """
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+def freshness_lifetime(headers) -> float:
+    """
+    Returns how many seconds a response may be used without revalidation.
+    """
+    directives = parse_cache_control(headers)
+    if "no-cache" in directives:
+        return 0.0
+    if directives.get("max-age"):
+        try:
+            return max(0.0, float(directives["max-age"]))
+        except ValueError:
+            return 0.0
+    if headers.get("Expires"):
+        try:
+            return max(0.0, parsedate_to_datetime(headers["Expires"]).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
+
+class HTTPCache:
+    """
+    Caches page bodies and revalidates them with conditional requests.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = DEFAULT_MAX_BYTES, session: requests.Session = None):
+        """
+        Args:
+            path (str, optional): SQLite file to store the cache in. Defaults to CACHE_DIR/http.sqlite3.
+            max_bytes (int): Size above which least recently used pages are evicted.
+            session (requests.Session, optional): Session used by fetch() when none is passed.
+        """
+        self.store = SQLiteCache(path or os.path.join(CACHE_DIR, 'http.sqlite3'), max_bytes=max_bytes)
+        self.session = session or requests.Session()
+        self.revalidated = 0
+        self.fresh_hits = 0
+
+    def _load(self, url: str) -> Optional[dict]:
+        value = self.store.get(url)
+        return json.loads(zlib.decompress(value)) if value is not None else None
+
+    def _save(self, url: str, entry: dict) -> None:
+        self.store.set(url, zlib.compress(json.dumps(entry).encode('utf-8'), 6))
+
+    def fetch(self, url: str, session: requests.Session = None, timeout=10) -> HTTPFetch:
+        """
+        GETs a URL through the cache.
+
+        Args:
+            url (str): The page URL.
+            session (requests.Session, optional): Session to send the request with.
+            timeout: Timeout passed to requests.
+
+        Returns:
+            HTTPFetch: The page, with from_cache set when the stored copy was used.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        entry = self._load(url)
+        now = time.time()
+        if entry is not None and now - entry["stored_at"] < entry["max_age"]:
+            self.fresh_hits += 1
+            count("http_cache_lookups", result="fresh")
+            return HTTPFetch(url, 200, entry["body"], entry["final_url"], True, entry["details"])
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        response = (session or self.session).get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            count("http_cache_lookups", result="revalidated")
+            entry["stored_at"] = now
+            entry["max_age"] = freshness_lifetime(response.headers)
+            entry["etag"] = response.headers.get("ETag", entry.get("etag"))
+            entry["last_modified"] = response.headers.get("Last-Modified", entry.get("last_modified"))
+            self._save(url, entry)
+            logger.info(f"Page not modified: {url}")
+            return HTTPFetch(url, 304, entry["body"], entry["final_url"], True, entry["details"])
+
+        count("http_cache_lookups", result="miss")
+        count("http_fetch_bytes", len(response.content))
+        html = response.text if response.status_code < 400 else ""
+        if response.status_code == 200 and "no-store" not in parse_cache_control(response.headers):
+            self._save(url, {
+                "body": html,
+                "final_url": response.url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "stored_at": now,
+                "max_age": freshness_lifetime(response.headers),
+                "details": {},
+            })
+        return HTTPFetch(url, response.status_code, html, response.url)
+
+    def details(self, url: str, variant: str = "") -> Optional[object]:
+        """
+        Returns the structured result stored for the cached copy of a page, if any.
+        """
+        entry = self._load(url)
+        return entry["details"].get(variant) if entry is not None else None
+
+    def store_details(self, url: str, details: object, variant: str = "") -> None:
+        """
+        Records a structured result (e.g. extracted job details) for the cached copy of a page.
+        It is dropped as soon as the page changes.
+
+        Args:
+            url (str): The page URL.
+            details (object): JSON-serializable result.
+            variant (str): Distinguishes results produced differently, e.g. by another model.
+        """
+        entry = self._load(url)
+        if entry is None:
+            return
+        entry["details"][variant] = details
+        self._save(url, entry)
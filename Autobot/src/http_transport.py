@@ -0,0 +1,245 @@
+"""
+Module: http_transport.py
+Purpose: A shared, pooled and retrying HTTP transport for the LLM providers.
+
+Each provider gets one HTTPTransport wrapping a requests.Session. The session keeps connections alive, so
+repeated calls skip the TCP and TLS handshakes. Every request has a connect and a read timeout, so a
+hung provider fails fast instead of stalling the run. Connection errors, timeouts and retryable
+status codes (429 and 5xx) are retried with capped exponential backoff and full jitter. Requests
+with a non-idempotent method such as POST are only retried after an error is raised if the
+connection was never made. After a read timeout the server may already have processed the request,
+so retrying it could, for example, pay for the same completion twice. A
+Retry-After header on a 429 or 503 response takes precedence over the computed delay. Latency,
+retry and error counters are kept per provider and exposed through transport_stats().
+"""
+
+import time
+import random
+import logging
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods that can be repeated safely after a request may have reached the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+# Latencies kept per provider for percentile estimates.
+LATENCY_WINDOW = 1024
+
+_transports: Dict[str, "HTTPTransport"] = {}
+_registry_lock = threading.Lock()
+
+class TransportStats:
+    """
+    Request, retry and error counters and recent latencies of one transport.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, error: bool) -> None:
+        """
+        Records one attempt. An error is an exception or a non-2xx/3xx response.
+        """
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            self.total_latency += latency
+            self.latencies.append(latency)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def percentile(self, p: float) -> float:
+        """
+        Returns the p-th percentile (0-100) of the recent latencies in seconds, or 0.0 without data.
+        """
+        with self._lock:
+            ordered = sorted(self.latencies)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            requests_made, retries, errors, total = self.requests, self.retries, self.errors, self.total_latency
+        return {
+            "requests": requests_made,
+            "retries": retries,
+            "errors": errors,
+            "mean_latency": total / requests_made if requests_made else 0.0,
+            "p50_latency": self.percentile(50),
+            "p95_latency": self.percentile(95),
+        }
+
+class HTTPTransport:
+    """
+    A keep-alive session with timeouts, retries and statistics for one provider.
+    """
+
+    def __init__(self, name: str, pool_size: int = 10, connect_timeout: float = 5.0, read_timeout: float = 60.0,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 retry_statuses: Iterable[int] = RETRY_STATUSES, retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            name (str): Provider name, used in logs and statistics.
+            pool_size (int): Maximum number of kept-alive connections per host.
+            connect_timeout (float): Seconds to wait for a connection.
+            read_timeout (float): Seconds to wait for the server between bytes of the response.
+            max_retries (int): Retries after the first attempt.
+            backoff_base (float): Backoff cap of the first retry; doubles on every further retry.
+            backoff_max (float): Upper bound of any backoff or Retry-After delay.
+            retry_statuses (Iterable[int]): Status codes that are retried.
+            retry_methods (Iterable[str]): Methods retried after any connection error or timeout.
+                                           Other methods are only retried if no connection was made.
+            sleep (Callable[[float], None]): Function used to wait between attempts.
+        """
+        self.name = name
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.sleep = sleep
+        self.stats = TransportStats()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """
+        Returns the delay requested by a Retry-After header (seconds or an HTTP date), if any.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None or response.status_code not in (429, 503):
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _can_retry(self, method: str, error: requests.RequestException) -> bool:
+        """
+        Returns whether a request that raised error may be sent again.
+        """
+        if method.upper() in self.retry_methods or isinstance(error, requests.ConnectTimeout):
+            return True
+        # Connection refused and failed DNS lookups are raised as a MaxRetryError wrapping the cause.
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Returns the delay before retry number attempt (starting at 0).
+        """
+        if response is not None:
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request, retrying transient failures. Connection errors and timeouts of
+        non-idempotent methods are only retried when the connection could not be made.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Target URL.
+            **kwargs: Passed to requests.Session.request; a timeout given here overrides the default.
+
+        Returns:
+            requests.Response: The first successful response, or the last response once retries are
+            exhausted or the status is not retryable.
+
+        Raises:
+            requests.RequestException: If the last attempt failed without a response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.stats.record(time.perf_counter() - start, error=True)
+                if attempt >= self.max_retries or not self._can_retry(method, e):
+                    logger.error(f"{self.name}: {method} {url} failed after {attempt + 1} attempts: {e}")
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{self.name}: {e}; retrying in {delay:.2f}s.")
+            else:
+                self.stats.record(time.perf_counter() - start, error=response.status_code >= 400)
+                if response.status_code not in self.retry_statuses or attempt >= self.max_retries:
+                    return response
+                delay = self._backoff(attempt, response)
+                logger.warning(f"{self.name}: HTTP {response.status_code}; retrying in {delay:.2f}s.")
+                response.close()
+            self.stats.record_retry()
+            self.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections.
+        """
+        self.session.close()
+
+def get_transport(provider: str, **options) -> HTTPTransport:
+    """
+    Returns the shared transport of a provider, creating it on first use.
+
+    Args:
+        provider (str): Provider name, e.g. a ModelConfig name.
+        **options: HTTPTransport arguments, only used when the transport is created.
+    """
+    with _registry_lock:
+        transport = _transports.get(provider)
+        if transport is None:
+            transport = HTTPTransport(provider, **options)
+            _transports[provider] = transport
+        return transport
+
+def transport_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Returns the statistics of every transport created so far, keyed by provider.
+    """
+    with _registry_lock:
+        transports = list(_transports.values())
+    return {transport.name: transport.stats.as_dict() for transport in transports}
+
+def close_transports() -> None:
+    """
+    Closes and forgets every shared transport.
+    """
+    with _registry_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
@@ -1,99 +1,187 @@
 """
 Module: job_automation.py
 Purpose: Automates job application process using Selenium to fill forms and upload files.
+
+Forms are described by the declarative site profiles of src/form_profiles.py.
 """
 
-import time
 import logging
+from typing import Callable, Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 from config.config import CHROME_DRIVER_PATH
+from src.form_profiles import (FILL_SCRIPT, READY_SCRIPT, RESUME_KEY, SUBMIT_SCRIPT, FormProfile,
+                               load_profiles, profile_for, resolve_value)
+from src.telemetry import timed
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ApplicationNotSubmitted(Exception):
+    """
+    Raised when an application stopped before anything was submitted, so it may be tried again.
+    """
+
 class JobAutomation:
     """
     A class to automate the job application process.
     """
     
-    def __init__(self):
+    def __init__(self, headless: bool = False, driver_factory: Callable[[], object] = None,
+                 profiles: Dict[str, FormProfile] = None, ready_timeout: float = 10.0):
+        """
+        Args:
+            headless (bool): Run Chrome without a window.
+            driver_factory (Callable, optional): Creates the WebDriver instead of a local Chrome,
+                                                 e.g. a remote driver or a fake one in tests.
+            profiles (Dict[str, FormProfile], optional): Form profiles by name. Defaults to
+                                                         Config/form_profiles.json.
+            ready_timeout (float): Seconds to wait for a page, a submission or a confirmation.
+        """
         self.driver = None
+        self._script_timeout = None
+        self.headless = headless
+        self.driver_factory = driver_factory
+        self.ready_timeout = ready_timeout
+        self._profiles = profiles
     
+    @timed("browser_setup")
     def setup_browser(self) -> None:
         """
         Sets up the Chrome browser with desired options.
         """
+        self._script_timeout = None
         try:
+            if self.driver_factory is not None:
+                self.driver = self.driver_factory()
+                logger.info("Browser setup completed.")
+                return
             options = Options()
-            # Uncomment the following line for headless mode if needed:
-            # options.add_argument("--headless")
+            if self.headless:
+                options.add_argument("--headless=new")
             self.driver = webdriver.Chrome(executable_path=CHROME_DRIVER_PATH, options=options)
             logger.info("Browser setup completed.")
         except Exception as e:
             logger.error(f"Error setting up browser: {e}")
             raise
     
-    def navigate_to_url(self, url: str) -> None:
+    @property
+    def profiles(self) -> Dict[str, FormProfile]:
+        """
+        The form profiles, read from Config/form_profiles.json on first use.
+        """
+        if self._profiles is None:
+            self._profiles = load_profiles()
+        return self._profiles
+    
+    def _execute_async(self, script: str, timeout: float, *args) -> object:
         """
-        Navigates the browser to the specified URL.
+        Runs an asynchronous script that gives up by itself after timeout seconds. The driver's
+        script timeout, which may be shorter by default, is raised first so it does not cut the
+        script off.
+        """
+        if self._script_timeout is None or self._script_timeout < timeout + 1:
+            self._script_timeout = timeout + 1
+            self.driver.set_script_timeout(self._script_timeout)
+        return self.driver.execute_async_script(script, *args, int(timeout * 1000))
+    
+    def wait_until_ready(self, selector: Optional[str] = None, timeout: float = None) -> bool:
+        """
+        Waits in the browser until the page has loaded and, if given, the selector matches an element.
+        
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        timeout = self.ready_timeout if timeout is None else timeout
+        return bool(self._execute_async(READY_SCRIPT, timeout, selector))
+    
+    def submit_form(self, profile: FormProfile) -> bool:
+        """
+        Clicks the profile's submit button and waits until the submission has been handled: the
+        confirmation appeared, or, for profiles without one, the page navigated and loaded or the
+        form was removed.
+        
+        Returns:
+            bool: False if no sign of a completed submission appeared within ready_timeout.
+        
+        Raises:
+            ApplicationNotSubmitted: If no submit button matches; nothing was submitted.
+        """
+        try:
+            outcome = self._execute_async(SUBMIT_SCRIPT, self.ready_timeout, profile.submit, profile.confirmation)
+        except WebDriverException as e:
+            # The submission navigated away before the script could call back.
+            if "unload" not in str(e):
+                raise
+            outcome = "navigated"
+        if outcome == "missing":
+            raise ApplicationNotSubmitted(f"Submit button not found: {profile.submit}")
+        logger.info("Submitted the application.")
+        if outcome == "navigated" or (outcome == "detached" and profile.confirmation):
+            return self.wait_until_ready(profile.confirmation)
+        return outcome != "timeout"
+    
+    @timed("browser_navigate")
+    def navigate_to_url(self, url: str, ready_selector: Optional[str] = None) -> None:
+        """
+        Navigates the browser to the specified URL and waits until the page is ready.
+        
+        Args:
+            url (str): The page to open.
+            ready_selector (str, optional): CSS selector of an element to wait for, e.g. a form
+                                            rendered by JavaScript after the load event.
         """
         try:
             self.driver.get(url)
-            time.sleep(2)  # Allow time for the page to load
+            if not self.wait_until_ready(ready_selector):
+                logger.warning(f"Page not ready after {self.ready_timeout}s: {url}")
             logger.info(f"Navigated to URL: {url}")
         except Exception as e:
             logger.error(f"Error navigating to URL: {e}")
             raise
     
-    def apply_for_job(self, job_url: str, resume_data: dict, pdf_resume_path: str) -> None:
+    @timed("browser_apply")
+    def apply_for_job(self, job_url: str, resume_data: dict, pdf_resume_path: str,
+                      profile: Optional[FormProfile] = None) -> None:
         """
         Automates filling out a job application form.
         
+        All text fields of the site's form profile are filled by a single script call; file
+        inputs are uploaded with send_keys(), which browsers require.
+        
         Args:
             job_url (str): URL of the job application page.
             resume_data (dict): Dictionary of parsed resume data.
             pdf_resume_path (str): Path to the PDF resume file.
+            profile (FormProfile, optional): The form to fill. Defaults to the profile matching the URL.
+        
+        Raises:
+            ApplicationNotSubmitted: If the form has no submit button; nothing was submitted.
         """
         try:
-            self.navigate_to_url(job_url)
+            profile = profile or profile_for(job_url, self.profiles)
+            self.navigate_to_url(job_url, profile.ready)
             
-            # Fill in the name field (example using an element with ID "name_input")
-            try:
-                name_field = self.driver.find_element(By.ID, "name_input")
-                name_field.clear()
-                name_field.send_keys(resume_data.get("name", ""))
-                logger.info("Filled name field.")
-            except Exception as e:
-                logger.warning(f"Name field issue: {e}")
+            values = profile.text_values(resume_data)
+            skipped = self.driver.execute_script(FILL_SCRIPT, [list(pair) for pair in values]) or []
+            for selector, reason in skipped:
+                logger.warning(f"Form field {reason}: {selector}")
+            logger.info(f"Filled {len(values) - len(skipped)} fields with profile '{profile.name}'.")
             
-            # Fill in the email field (example using an element with ID "email_input")
-            try:
-                email_field = self.driver.find_element(By.ID, "email_input")
-                email_field.clear()
-                email_field.send_keys(resume_data.get("email", ""))
-                logger.info("Filled email field.")
-            except Exception as e:
-                logger.warning(f"Email field issue: {e}")
+            for form_field in profile.file_fields:
+                path = pdf_resume_path if form_field.key == RESUME_KEY else resolve_value(resume_data, form_field.key)
+                try:
+                    self.driver.find_element(By.CSS_SELECTOR, form_field.selector).send_keys(path)
+                    logger.info(f"Uploaded {form_field.key} file.")
+                except Exception as e:
+                    logger.warning(f"File upload issue ({form_field.selector}): {e}")
             
-            # Upload the PDF resume (example using an element with ID "resume_upload")
-            try:
-                upload_field = self.driver.find_element(By.ID, "resume_upload")
-                upload_field.send_keys(pdf_resume_path)
-                logger.info("Uploaded resume PDF.")
-            except Exception as e:
-                logger.warning(f"Resume upload issue: {e}")
-            
-            # Submit the application form (example using an element with ID "submit_btn")
-            try:
-                submit_button = self.driver.find_element(By.ID, "submit_btn")
-                submit_button.click()
-                logger.info("Submitted the application.")
-            except Exception as e:
-                logger.warning(f"Submit button issue: {e}")
-            
-            time.sleep(2)  # Allow some time after submission
+            if not profile.submit:
+                return
+            if not self.submit_form(profile):
+                logger.warning(f"No submission confirmation for {job_url}")
         except Exception as e:
             logger.error(f"Error during job application: {e}")
             raise
@@ -103,8 +191,14 @@ class JobAutomation:
         Closes the browser and quits the driver.
         """
         if self.driver:
-            self.driver.quit()
-            logger.info("Browser closed.")
+            try:
+                self.driver.quit()
+                logger.info("Browser closed.")
+            except Exception as e:
+                # A crashed browser cannot be quit cleanly; the driver is dropped either way.
+                logger.warning(f"Error closing browser: {e}")
+            finally:
+                self.driver = None
 
 # For independent testing
 if __name__ == "__main__":
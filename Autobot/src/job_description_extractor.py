@@ -18,14 +18,24 @@ The output is expected in clear, concise, and organized JSON format.
 import requests
 import json
 import logging
-from bs4 import BeautifulSoup
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.crawler import Crawler
+from src.llm_cache import LLMCache
+from src.http_cache import HTTPCache
+from src.html_text import DEFAULT_BACKEND, html_to_text
+from src.json_stream import JSONObjectStream
+from src.content_extractor import ContentExtraction, DEFAULT_TOKEN_BUDGET, extract_main_content
 from src.llm_integration import LLMIntegration
+from src.telemetry import count, span, timed
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DETAILS_MAX_TOKENS = 500
+
 class JobDescriptionExtractor:
-    def __init__(self, url: str, model_type: str = None):
+    def __init__(self, url: str, model_type: str = None, llm_cache: LLMCache = None, bypass_cache: bool = False,
+                 http_cache: HTTPCache = None):
         """
         Initialize the extractor with the target URL and an optional model type.
         
@@ -33,18 +43,57 @@ class JobDescriptionExtractor:
             url (str): The URL of the job posting.
             model_type (str, optional): The LLM model type (e.g., 'chatgpt', 'gemini', 'deepseek').
                                         If None, the default model will be used.
+            llm_cache (LLMCache, optional): Cache of LLM responses, so re-extracting a posting is free.
+            bypass_cache (bool): Ignore cached responses and query the model again.
+            http_cache (HTTPCache, optional): Cache of fetched pages. When a page is unchanged since
+                                              the last run, its previous job details are reused.
         """
         self.url = url
         self.html = ""
         self.text = ""
+        self.content: Optional[ContentExtraction] = None
         self.model_type = model_type
+        self.llm_cache = llm_cache
+        self.bypass_cache = bypass_cache
+        self.http_cache = http_cache
+        # Job details of an unchanged page, reused instead of parsing and calling the LLM again.
+        self.cached_details: Optional[dict] = None
+
+    @property
+    def details_variant(self) -> str:
+        """
+        Key under which job details are stored in the HTTP cache; results of different models are kept apart.
+        """
+        return self.model_type or ""
 
+    def _store_details(self, details: dict) -> None:
+        if self.http_cache is not None and details:
+            self.http_cache.store_details(self.url, details, self.details_variant)
+
+    @timed("fetch_webpage")
     def fetch_webpage(self) -> None:
         """
         Fetch the webpage content using an HTTP GET request.
         """
+        if self.http_cache is not None:
+            try:
+                page = self.http_cache.fetch(self.url, timeout=10)
+                if page.from_cache:
+                    self.html = page.html
+                    self.cached_details = page.details.get(self.details_variant)
+                    logger.info("Webpage unchanged; using the cached copy.")
+                elif page.status == 200:
+                    self.html = page.html
+                    logger.info("Webpage fetched successfully.")
+                else:
+                    logger.error(f"Failed to fetch webpage. Status code: {page.status}")
+            except Exception as e:
+                logger.error(f"Exception while fetching webpage: {e}")
+            return
+
         try:
             response = requests.get(self.url, timeout=10)
+            count("http_fetch_bytes", len(response.content))
             if response.status_code == 200:
                 self.html = response.text
                 logger.info("Webpage fetched successfully.")
@@ -53,23 +102,55 @@ class JobDescriptionExtractor:
         except Exception as e:
             logger.error(f"Exception while fetching webpage: {e}")
 
-    def extract_text(self) -> None:
+    def extract_text(self, backend: str = DEFAULT_BACKEND) -> None:
         """
-        Uses BeautifulSoup to parse the HTML and extract visible text, removing script and style elements.
+        Extracts the visible text of the HTML, leaving out script, style and noscript elements.
+
+        Args:
+            backend (str): HTML text backend, "stream" (event-based, no parse tree) or "bs4"
+                           (BeautifulSoup). Both produce the same text.
         """
+        if self.cached_details is not None:
+            logger.info("Job details of this page are cached; skipping text extraction.")
+            return
         if not self.html:
             logger.error("HTML content is empty. Call fetch_webpage() first.")
             return
 
         try:
-            soup = BeautifulSoup(self.html, "html.parser")
-            for element in soup(["script", "style"]):
-                element.decompose()
-            self.text = soup.get_text(separator="\n")
+            with span("html_to_text", backend=backend):
+                self.text = html_to_text(self.html, backend)
+            count("pages_parsed", backend=backend)
             logger.info("Text extracted from webpage successfully.")
         except Exception as e:
             logger.error(f"Error during text extraction: {e}")
 
+    @timed("extract_main_content")
+    def extract_main_content(self, token_budget: int = DEFAULT_TOKEN_BUDGET) -> None:
+        """
+        Like extract_text(), but keeps only the job posting body: navigation, footers, banners and
+        link lists are dropped, whitespace is collapsed and the text is cut to a token budget.
+        The token statistics are stored in self.content.
+
+        Args:
+            token_budget (int): Maximum estimated tokens of the extracted text.
+        """
+        if self.cached_details is not None:
+            logger.info("Job details of this page are cached; skipping content extraction.")
+            return
+        if not self.html:
+            logger.error("HTML content is empty. Call fetch_webpage() first.")
+            return
+
+        try:
+            self.content = extract_main_content(self.html, token_budget)
+            self.text = self.content.text
+            count("pages_parsed", backend="main_content")
+            count("prompt_tokens_saved", self.content.tokens_saved)
+            logger.info(f"Main content extracted from webpage; {self.content.tokens_saved} tokens saved.")
+        except Exception as e:
+            logger.error(f"Error during main content extraction: {e}")
+
     def extract_key_job_details(self) -> dict:
         """
         Uses a GenAI model via LLMIntegration to extract key job details from the job posting text.
@@ -87,12 +168,22 @@ class JobDescriptionExtractor:
         Returns:
             dict: A JSON/dictionary with the extracted job details.
         """
+        if self.cached_details is not None:
+            logger.info("Reusing the job details of the unchanged page.")
+            return self.cached_details
         if not self.text:
             logger.error("No text available for processing. Ensure fetch_webpage() and extract_text() are called first.")
             return {}
 
-        llm = LLMIntegration(self.model_type)
-        prompt = (
+        llm = LLMIntegration(self.model_type, cache=self.llm_cache, bypass_cache=self.bypass_cache)
+        response_text = llm.generate_text(self._build_prompt(), max_tokens=DETAILS_MAX_TOKENS)
+        return self._parse_response(response_text, store=True)
+
+    def _build_prompt(self) -> str:
+        """
+        Returns the job details prompt for the extracted text.
+        """
+        return (
             "Extract key job details from the provided website or job posting link. Include the following information in a structured format: \n"
             "1. Job Requirements\n"
             "2. Qualifications\n"
@@ -102,21 +193,120 @@ class JobDescriptionExtractor:
             "Ensure the output is clear, concise, and organized for easy reference.\n\n"
             "Job Description Text:\n" + self.text
         )
-        response_text = llm.generate_text(prompt, max_tokens=500)
+
+    def _parse_response(self, response_text: str, store: bool = False) -> dict:
+        """
+        Parses the LLM response as JSON. If the response is not valid JSON as a whole (e.g. it was
+        cut off or has trailing garbage), the top-level fields that are intact are returned.
+
+        Args:
+            response_text (str): The LLM response.
+            store (bool): Store the details in the HTTP cache. Only complete responses are stored,
+                          so a partial result is never served for later unchanged fetches.
+        """
         try:
             result = json.loads(response_text)
             logger.info("Job details extracted successfully via LLM.")
+            if store:
+                self._store_details(result)
             return result
         except Exception as e:
+            parser = JSONObjectStream()
+            parser.feed(response_text)
+            partial = parser.close()
+            if partial:
+                logger.warning(f"LLM response is not valid JSON ({e}); kept {len(partial)} intact sections.")
+                return partial
             logger.error(f"Failed to parse LLM response as JSON. Response was: {response_text}\nError: {e}")
             return {}
 
+    def iter_key_job_details(self) -> Iterator[Tuple[str, object]]:
+        """
+        Streams the job details from the LLM and yields each top-level section (e.g. "Qualifications")
+        as soon as its value has been received, so downstream stages can start before the
+        response is complete. Sections received before a truncated stream ends are still yielded.
+
+        Yields:
+            Tuple[str, object]: Section name and value.
+        """
+        if self.cached_details is not None:
+            yield from self.cached_details.items()
+            return
+        if not self.text:
+            logger.error("No text available for processing. Ensure fetch_webpage() and extract_text() are called first.")
+            return
+
+        llm = LLMIntegration(self.model_type, cache=self.llm_cache, bypass_cache=self.bypass_cache)
+        parser = JSONObjectStream()
+        for chunk in llm.stream_text(self._build_prompt(), max_tokens=DETAILS_MAX_TOKENS):
+            yield from parser.feed(chunk)
+        details = parser.close()
+        if parser.complete:
+            self._store_details(details)
+        logger.info(f"Streamed {len(details)} job detail sections via LLM.")
+
+    @classmethod
+    def extract_many(cls, urls: List[str], model_type: str = None, llm_cache: LLMCache = None,
+                     bypass_cache: bool = False, concurrency: int = 8,
+                     token_budget: int = DEFAULT_TOKEN_BUDGET, crawler: Crawler = None,
+                     http_cache: HTTPCache = None) -> List[dict]:
+        """
+        Extracts the key job details of many postings concurrently.
+
+        Pages are downloaded by a Crawler and each one is reduced to its main content as soon as it
+        arrives, while the remaining pages are still being fetched. Then all prompts go through LLMIntegration.generate_many() with at most
+        concurrency requests in flight, subject to the provider's rate limit.
+
+        Args:
+            urls (List[str]): The job posting URLs.
+            model_type (str, optional): The LLM model type.
+            llm_cache (LLMCache, optional): Cache of LLM responses.
+            bypass_cache (bool): Ignore cached responses and query the model again.
+            concurrency (int): Maximum number of simultaneous LLM calls.
+            token_budget (int): Maximum estimated tokens of each posting's text.
+            crawler (Crawler, optional): Crawler used to download the pages. Defaults to a Crawler
+                                         with its default concurrency limits and http_cache.
+            http_cache (HTTPCache, optional): Cache of fetched pages; unchanged pages reuse their
+                                              previous job details.
+
+        Returns:
+            List[dict]: The job details of each URL, in order; {} where fetching or parsing failed.
+        """
+        extractors = [cls(url, model_type, llm_cache, bypass_cache, http_cache) for url in urls]
+        positions: Dict[str, List[int]] = {}
+        for index, url in enumerate(urls):
+            positions.setdefault(url, []).append(index)
+
+        for page in (crawler or Crawler(http_cache=http_cache)).stream(positions):
+            if not page.ok:
+                logger.error(f"Failed to fetch {page.url}: {page.error or page.status}")
+                continue
+            for index in positions[page.url]:
+                extractor = extractors[index]
+                extractor.html = page.html
+                if page.from_cache and http_cache is not None:
+                    extractor.cached_details = http_cache.details(page.url, extractor.details_variant)
+                extractor.extract_main_content(token_budget)
+
+        results = [extractor.cached_details or {} for extractor in extractors]
+        ready = [index for index, extractor in enumerate(extractors)
+                 if extractor.cached_details is None and extractor.text]
+        if ready:
+            llm = LLMIntegration(model_type, cache=llm_cache, bypass_cache=bypass_cache)
+            prompts = [extractors[index]._build_prompt() for index in ready]
+            responses = llm.generate_batch(prompts, max_tokens=DETAILS_MAX_TOKENS, concurrency=concurrency)
+            for index, response_text in zip(ready, responses):
+                results[index] = extractors[index]._parse_response(response_text, store=True)
+        logger.info(f"Extracted job details for {len(ready)} of {len(urls)} postings via LLM.")
+        return results
+
 # # For independent testing.
 # if __name__ == "__main__":
 #     url = input("Enter the job posting URL: ").strip()
-#     extractor = JobDescriptionExtractor(url)
+#     from src.llm_cache import default_llm_cache
+#     extractor = JobDescriptionExtractor(url, llm_cache=default_llm_cache())
 #     extractor.fetch_webpage()
-#     extractor.extract_text()
+#     extractor.extract_main_content()
 #     job_details = extractor.extract_key_job_details()
 #     print("Extracted Job Details:")
 #     print(json.dumps(job_details, indent=4))
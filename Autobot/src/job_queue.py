@@ -0,0 +1,351 @@
+"""
+Module: job_queue.py
+Purpose: A durable queue of job postings in SQLite. It tracks each posting through the pipeline,
+         survives crashes and lets several processes share the work.
+
+Every posting is stored once, under an idempotency key derived from its normalized URL. Adding
+the same posting again is therefore a no-op. A posting moves through the statuses pending ->
+fetched -> scored -> applied, or ends as failed. Each step can save a JSON checkpoint payload,
+e.g. the extracted job details, so a resumed run continues from the last completed step.
+
+Workers claim postings with claim(). Claiming runs in one IMMEDIATE transaction, so two workers
+or processes never claim the same posting. The claim is a lease: a posting whose worker crashed
+becomes claimable again once its lease expires. Steps with side effects that must not run twice,
+like submitting an application, call start() right before acting. A started step that did not
+complete, because its lease expired or it failed, may still have taken effect. The posting is
+marked failed instead of being claimed again, so an application is submitted at most once.
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from typing import Dict, Iterable, List, Optional, Sequence
+from src.sqlite_cache import CACHE_DIR
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+FETCHED = "fetched"
+SCORED = "scored"
+APPLIED = "applied"
+FAILED = "failed"
+STATUSES = (PENDING, FETCHED, SCORED, APPLIED, FAILED)
+
+# Query parameters that only track where a link was clicked and do not identify the posting.
+TRACKING_PARAMS = frozenset({"gh_src", "lever-source", "ref", "source", "src"})
+
+@dataclass
+class QueuedJob:
+    """
+    One posting in the queue.
+
+    Attributes:
+        key (str): The idempotency key.
+        url (str): The posting URL as first added.
+        status (str): One of STATUSES.
+        attempts (int): Number of times the posting was claimed for its current step.
+        payload (dict): Checkpoint data saved by the completed steps.
+        error (str, optional): The last error.
+    """
+    key: str
+    url: str
+    status: str
+    attempts: int = 0
+    payload: Dict[str, object] = field(default_factory=dict)
+    error: Optional[str] = None
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a posting URL: lowercases the scheme and host, drops the fragment, tracking
+    parameters and a trailing slash, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS)
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+def idempotency_key(url: str) -> str:
+    """
+    Returns the idempotency key of a posting URL.
+    """
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+def default_worker_id() -> str:
+    """
+    Returns an ID unique to the calling host, process and thread.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+class JobQueue:
+    """
+    A persistent, multi-process queue of job postings.
+    """
+
+    def __init__(self, path: str = None, lease_seconds: float = 600.0, max_attempts: int = 3):
+        """
+        Args:
+            path (str, optional): SQLite file of the queue. Defaults to CACHE_DIR/job_queue.sqlite3.
+            lease_seconds (float): How long a claim lasts before another worker may take the posting over.
+            max_attempts (int): Claims per step before a posting is marked failed.
+        """
+        self.path = path or os.path.join(CACHE_DIR, 'job_queue.sqlite3')
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns this process's connection, reopening it after a fork.
+        """
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " key TEXT PRIMARY KEY, url TEXT NOT NULL, status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0, worker TEXT, lease_until REAL,"
+                " started INTEGER NOT NULL DEFAULT 0, payload TEXT NOT NULL DEFAULT '{}', error TEXT,"
+                " created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def __getstate__(self):
+        # Connections cannot be pickled; the receiving process opens its own.
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _transaction(self, statements) -> object:
+        """
+        Runs a function with the connection inside a write transaction and returns its result.
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(conn)
+                conn.execute("COMMIT")
+                return result
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _job(row: Sequence) -> QueuedJob:
+        key, url, status, attempts, payload, error = row
+        return QueuedJob(key, url, status, attempts, json.loads(payload), error)
+
+    def enqueue(self, urls: Iterable[str], payload: Dict[str, object] = None) -> int:
+        """
+        Adds postings to the queue as pending. Postings already in the queue are left as they are.
+
+        Args:
+            urls (Iterable[str]): Posting URLs.
+            payload (dict, optional): Initial checkpoint data of the new postings.
+
+        Returns:
+            int: Number of postings added.
+        """
+        now = time.time()
+        rows = {}
+        for url in urls:
+            rows.setdefault(idempotency_key(url), url)
+        encoded = json.dumps(payload or {})
+        def insert(conn):
+            return sum(conn.execute(
+                "INSERT OR IGNORE INTO jobs (key, url, status, payload, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, url, PENDING, encoded, now, now)
+            ).rowcount for key, url in rows.items())
+        added = self._transaction(insert)
+        logger.info(f"Queued {added} new postings ({len(rows) - added} already known).")
+        return added
+
+    def claim(self, statuses: Sequence[str], worker: str = None, limit: int = None,
+              at_most_once: bool = False, keys: Sequence[str] = None) -> List[QueuedJob]:
+        """
+        Atomically claims postings in the given statuses that no live lease holds.
+
+        Args:
+            statuses (Sequence[str]): Statuses the next step starts from, e.g. (FETCHED,).
+            worker (str, optional): ID of the claiming worker. Defaults to default_worker_id().
+            limit (int, optional): Maximum number of postings to claim; None claims all.
+            at_most_once (bool): Never claim postings whose step was start()ed; those whose lease
+                                 expired are marked failed.
+            keys (Sequence[str], optional): Only consider these postings, e.g. the ones of one run.
+
+        Returns:
+            List[QueuedJob]: The claimed postings, oldest first.
+        """
+        worker = worker or default_worker_id()
+        marks = ", ".join("?" for _ in statuses)
+        only = [] if keys is None else list(dict.fromkeys(keys))
+        def claim(conn):
+            now = time.time()
+            expired = f"status IN ({marks}) AND (lease_until IS NULL OR lease_until < ?)"
+            if keys is not None:
+                expired += f" AND key IN ({', '.join('?' for _ in only)})"
+            params = (*statuses, now, *only)
+            if at_most_once:
+                conn.execute(
+                    f"UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL, updated_at = ?,"
+                    f" error = 'interrupted after the step started; it may have completed' WHERE {expired} AND started = 1",
+                    (FAILED, now, *params)
+                )
+            conn.execute(
+                f"UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL, updated_at = ?,"
+                f" error = COALESCE(error, 'too many attempts') WHERE {expired} AND attempts >= ?",
+                (FAILED, now, *params, self.max_attempts)
+            )
+            claimable = expired + (" AND started = 0" if at_most_once else "")
+            claimed = [row[0] for row in conn.execute(
+                f"SELECT key FROM jobs WHERE {claimable} ORDER BY created_at, key LIMIT ?",
+                (*params, -1 if limit is None else limit)
+            )]
+            for key in claimed:
+                conn.execute(
+                    "UPDATE jobs SET worker = ?, lease_until = ?, attempts = attempts + 1, updated_at = ?"
+                    " WHERE key = ?", (worker, now + self.lease_seconds, now, key)
+                )
+            return [self._job(conn.execute(
+                "SELECT key, url, status, attempts, payload, error FROM jobs WHERE key = ?", (key,)
+            ).fetchone()) for key in claimed]
+        if keys is not None and not only:
+            return []
+        jobs = self._transaction(claim)
+        if jobs:
+            logger.info(f"Worker {worker} claimed {len(jobs)} postings.")
+        return jobs
+
+    def _update_owned(self, key: str, worker: str, assignments: str, params: tuple, condition: str = "") -> bool:
+        """
+        Updates a posting only if worker still holds its lease (and the extra SQL condition holds).
+        """
+        with self._lock:
+            return self._connection().execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE key = ? AND worker = ? AND lease_until >= ?{condition}",
+                (*params, time.time(), key, worker or default_worker_id(), time.time())
+            ).rowcount > 0
+
+    def start(self, key: str, worker: str = None) -> bool:
+        """
+        Records that a step with side effects is about to run, and renews the lease. A step can be
+        started once per claim: a second start() of the same claim, e.g. a retry after a try that
+        may have got as far as submitting, is refused.
+
+        Returns:
+            bool: False if the lease was lost or the step was already started; the step must not run.
+        """
+        return self._update_owned(key, worker, "started = 1, lease_until = ?", (time.time() + self.lease_seconds,),
+                                  " AND started = 0")
+
+    def checkpoint(self, key: str, status: str, payload: Dict[str, object] = None, worker: str = None) -> bool:
+        """
+        Completes a step: moves the posting to status, merges payload into its checkpoint data and
+        releases the lease.
+
+        Returns:
+            bool: False if the lease was lost and nothing was saved.
+        """
+        if status not in STATUSES:
+            raise ValueError(f"Unknown job status: {status}")
+        def save(conn):
+            row = conn.execute("SELECT payload FROM jobs WHERE key = ? AND worker = ? AND lease_until >= ?",
+                               (key, worker or default_worker_id(), time.time())).fetchone()
+            if row is None:
+                return False
+            merged = {**json.loads(row[0]), **(payload or {})}
+            conn.execute(
+                "UPDATE jobs SET status = ?, payload = ?, error = NULL, attempts = 0, worker = NULL,"
+                " lease_until = NULL, started = 0, updated_at = ? WHERE key = ?", (status, json.dumps(merged), time.time(), key)
+            )
+            return True
+        saved = self._transaction(save)
+        if not saved:
+            logger.warning(f"Lost the lease on {key} before saving status {status}.")
+        return saved
+
+    def fail(self, key: str, error: str, worker: str = None, retry: bool = True, took_effect: bool = True) -> bool:
+        """
+        Records a failed step. The posting stays claimable for another attempt if retry is set,
+        attempts remain and the step was not start()ed; otherwise it is marked failed. A started
+        step may have taken effect before failing, so it is never retried.
+
+        Args:
+            key (str): The posting's idempotency key.
+            error (str): Why the step failed.
+            worker (str, optional): ID of the worker holding the lease.
+            retry (bool): Allow another attempt.
+            took_effect (bool): Pass False if a started step is known to have stopped before its
+                                side effect, e.g. no form was submitted; it may then be retried.
+
+        Returns:
+            bool: False if the lease was lost.
+        """
+        started = "started" if took_effect else "0"
+        status = f"CASE WHEN ? AND attempts < ? AND {started} = 0 THEN status ELSE ? END"
+        return self._update_owned(
+            key, worker, f"status = {status}, error = ?, worker = NULL, lease_until = NULL, started = {started}",
+            (int(retry), self.max_attempts, FAILED, error)
+        )
+
+    def release(self, key: str, worker: str = None) -> bool:
+        """
+        Gives a claimed posting back without counting the attempt.
+        """
+        return self._update_owned(key, worker, "attempts = attempts - 1, worker = NULL, lease_until = NULL, started = 0", ())
+
+    def get(self, url: str) -> Optional[QueuedJob]:
+        """
+        Returns the posting for a URL, or None if it was never queued.
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT key, url, status, attempts, payload, error FROM jobs WHERE key = ?", (idempotency_key(url),)
+            ).fetchone()
+        return self._job(row) if row else None
+
+    def jobs(self, status: str) -> List[QueuedJob]:
+        """
+        Returns the postings in a status, oldest first.
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT key, url, status, attempts, payload, error FROM jobs WHERE status = ? ORDER BY created_at, key",
+                (status,)
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Returns the number of postings in each status.
+        """
+        with self._lock:
+            rows = self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: dict(rows).get(status, 0) for status in STATUSES}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
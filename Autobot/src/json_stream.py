@@ -0,0 +1,137 @@
+"""
+Module: json_stream.py
+Purpose: Incremental parsing of a JSON object that arrives in chunks, e.g. a streamed LLM response.
+
+JSONObjectStream is fed text as it arrives and returns each top-level key/value pair as soon as its
+value is complete, so a caller can act on the "Qualifications" section while the rest of the
+response is still being generated. Text before the opening brace (such as a Markdown code fence)
+and after the closing brace is ignored. A value that is not valid JSON is skipped with a warning
+instead of discarding the whole object, and the pairs completed before a truncated stream ends are
+kept.
+"""
+
+import json
+import logging
+from typing import Dict, List, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Parser states.
+_START, _KEY, _IN_KEY, _COLON, _VALUE, _DONE = range(6)
+
+class JSONObjectStream:
+    """
+    An incremental parser for the top-level members of one JSON object.
+    """
+
+    def __init__(self):
+        self.state = _START
+        self.items: Dict[str, object] = {}
+        # Keys whose values could not be parsed.
+        self.skipped: List[str] = []
+        self._key = None
+        self._chars: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def complete(self) -> bool:
+        """
+        True once the closing brace of the object has been seen.
+        """
+        return self.state == _DONE
+
+    def _emit(self) -> List[Tuple[str, object]]:
+        text = "".join(self._chars).strip()
+        try:
+            value = json.loads(text)
+        except ValueError:
+            logger.warning(f"Skipping malformed JSON value for key '{self._key}'.")
+            self.skipped.append(self._key)
+            return []
+        self.items[self._key] = value
+        return [(self._key, value)]
+
+    def feed(self, chunk: str) -> List[Tuple[str, object]]:
+        """
+        Consumes the next piece of text.
+
+        Args:
+            chunk (str): Text following everything fed so far.
+
+        Returns:
+            List[Tuple[str, object]]: The key/value pairs completed by this chunk, in order.
+        """
+        completed = []
+        for char in chunk:
+            state = self.state
+            if state == _VALUE:
+                if self._in_string:
+                    self._chars.append(char)
+                    if self._escape:
+                        self._escape = False
+                    elif char == "\\":
+                        self._escape = True
+                    elif char == '"':
+                        self._in_string = False
+                elif self._depth == 0 and char in ",}":
+                    completed.extend(self._emit())
+                    self.state = _KEY if char == "," else _DONE
+                else:
+                    self._chars.append(char)
+                    if char == '"':
+                        self._in_string = True
+                    elif char in "[{":
+                        self._depth += 1
+                    elif char in "]}":
+                        self._depth -= 1
+            elif state == _IN_KEY:
+                if self._escape:
+                    self._escape = False
+                    self._chars.append(char)
+                elif char == "\\":
+                    self._escape = True
+                    self._chars.append(char)
+                elif char == '"':
+                    raw_key = "".join(self._chars)
+                    try:
+                        self._key = json.loads(f'"{raw_key}"')
+                    except ValueError:
+                        self._key = raw_key
+                    self.state = _COLON
+                else:
+                    self._chars.append(char)
+            elif state == _KEY:
+                # Whitespace and separating commas are skipped.
+                if char == '"':
+                    self._chars = []
+                    self.state = _IN_KEY
+                elif char == "}":
+                    self.state = _DONE
+            elif state == _COLON:
+                if char == ":":
+                    self._chars = []
+                    self._depth = 0
+                    self._in_string = False
+                    self._escape = False
+                    self.state = _VALUE
+            elif state == _START:
+                if char == "{":
+                    self.state = _KEY
+            else:
+                break
+        return completed
+
+    def close(self) -> Dict[str, object]:
+        """
+        Ends the stream.
+
+        Returns:
+            Dict[str, object]: Every key/value pair completed so far. If the stream was cut off,
+            the value that was still being received is dropped.
+        """
+        if not self.complete:
+            logger.warning(f"JSON stream ended early; keeping {len(self.items)} completed fields.")
+        return self.items
@@ -0,0 +1,91 @@
+"""
+Module: llm_cache.py
+Purpose: A persistent cache of LLM responses, so that re-running the pipeline on the same job
+         postings does not pay for the same completion twice.
+
+Responses are keyed by the model, the SHA-256 of the prompt, max_tokens and temperature. Any change
+to one of them is a miss. Storage is a shared SQLiteCache: entries expire after a TTL, the least
+recently used ones are evicted once the cache grows past its size limit, and hit/miss counters are
+kept per LLMCache instance.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Optional
+from src.sqlite_cache import SQLiteCache, CACHE_DIR
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Job postings change rarely, but a cached completion should not outlive a model update by much.
+DEFAULT_TTL = 7 * 24 * 3600
+
+_default_cache = None
+
+class LLMCache:
+    """
+    Caches generated texts by model, prompt and sampling parameters.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = DEFAULT_MAX_BYTES, ttl: Optional[float] = DEFAULT_TTL):
+        """
+        Args:
+            path (str, optional): SQLite file to store the cache in. Defaults to CACHE_DIR/llm.sqlite3.
+            max_bytes (int): Size above which least recently used responses are evicted.
+            ttl (float, optional): Maximum age of a response in seconds. None keeps responses until evicted.
+        """
+        self.store = SQLiteCache(path or os.path.join(CACHE_DIR, 'llm.sqlite3'), max_bytes=max_bytes, ttl=ttl)
+
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+
+    @staticmethod
+    def key_for(model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+        """
+        Returns the cache key for one generate_text() call.
+
+        Args:
+            model (str): Identifies the model and endpoint, e.g. "ChatGPT@https://api.openai.com/...".
+            prompt (str): The prompt text.
+            max_tokens (int): Maximum tokens requested.
+            temperature (float): Sampling temperature.
+        """
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8', 'surrogatepass')).hexdigest()
+        return json.dumps([model, prompt_hash, int(max_tokens), float(temperature)], separators=(',', ':'))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached response for a key, or None on a miss.
+        """
+        value = self.store.get(key)
+        return value.decode('utf-8') if value is not None else None
+
+    def set(self, key: str, text: str) -> None:
+        """
+        Stores a response under a key.
+        """
+        self.store.set(key, text.encode('utf-8'))
+
+    def clear(self) -> None:
+        """
+        Drops every cached response.
+        """
+        self.store.clear()
+        logger.info("LLM response cache cleared.")
+
+def default_llm_cache() -> LLMCache:
+    """
+    Returns the process-wide LLM response cache stored under CACHE_DIR.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMCache()
+    return _default_cache
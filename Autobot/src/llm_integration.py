@@ -3,8 +3,15 @@ Module: llm_integration.py
 Purpose: Integrates with various LLM APIs to generate dynamic text (e.g., cover letters).
 """
 
+import json
+import asyncio
 import logging
-import requests
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+from src.llm_cache import LLMCache
+from src.rate_limiter import TokenBucket, get_rate_limiter
+from src.http_transport import HTTPTransport, get_transport
+from src.telemetry import count, span
 from config.config import get_model_config
 
 logging.basicConfig(level=logging.INFO)
@@ -15,30 +22,61 @@ class LLMIntegration:
     A class to interface with an LLM API.
     """
     
-    def __init__(self, model_type: str = None):
+    def __init__(self, model_type: str = None, cache: LLMCache = None, bypass_cache: bool = False,
+                 transport: HTTPTransport = None):
         """
         Initializes the integration with a chosen model configuration.
         
         Args:
             model_type (str, optional): The model type to use (e.g., 'chatgpt', 'gemini', 'deepseek').
-                                          If None, a prompt will ask the user for selection.
+                                          If None, AUTOBOT_MODEL or the default model is used.
+            cache (LLMCache, optional): Response cache consulted before calling the API.
+            bypass_cache (bool): Always call the API, but still store fresh responses in the cache.
+            transport (HTTPTransport, optional): Transport used for API calls. Defaults to the shared
+                                                 transport of the model's provider.
         """
         self.model_config = get_model_config(model_type)
+        self.cache = cache
+        self.bypass_cache = bypass_cache
+        self._transport = transport
+
+    @property
+    def transport(self) -> HTTPTransport:
+        """
+        The pooled, retrying transport API calls go through.
+        """
+        return self._transport or get_transport(self.model_config.name)
     
-    def generate_text(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7) -> str:
+    @property
+    def rate_limiter(self) -> TokenBucket:
         """
-        Sends a prompt to the LLM API and returns the generated text.
-        
-        Args:
-            prompt (str): The prompt for the LLM.
-            max_tokens (int): Maximum tokens for the generated text.
-            temperature (float): Sampling temperature for text generation.
-            
-        Returns:
-            The generated text as a string.
+        The token bucket shared by every call to the model's provider.
+        """
+        return get_rate_limiter(self.model_config.name, self.model_config.requests_per_second,
+                                self.model_config.burst)
+
+    def _cache_lookup(self, prompt: str, max_tokens: int, temperature: float) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns the cache key of a call (None without a cache) and the cached text, if any.
+        """
+        if self.cache is None:
+            return None, None
+        model = f"{self.model_config.name}@{self.model_config.api_url}"
+        cache_key = self.cache.key_for(model, prompt, max_tokens, temperature)
+        if self.bypass_cache:
+            return cache_key, None
+        cached_text = self.cache.get(cache_key)
+        count("llm_cache_lookups", result="miss" if cached_text is None else "hit")
+        if cached_text is not None:
+            logger.info("LLM response served from cache.")
+        return cache_key, cached_text
+
+    def _request_text(self, prompt: str, max_tokens: int, temperature: float, cache_key: Optional[str]) -> str:
+        """
+        Calls the API and caches a successful response under cache_key.
         """
         headers = {
-            "Authorization": f"Bearer {self.model_config.api_key}",
+            "Authorization": f"Bearer {self.model_config.resolve_api_key()}",
             "Content-Type": "application/json"
         }
         payload = {
@@ -47,10 +85,14 @@ class LLMIntegration:
             "temperature": temperature
         }
         try:
-            response = requests.post(self.model_config.api_url, headers=headers, json=payload)
+            with span("llm_request", provider=self.model_config.name):
+                response = self.transport.post(self.model_config.api_url, headers=headers, json=payload)
+            count("llm_requests", provider=self.model_config.name, status=response.status_code)
             if response.status_code == 200:
                 generated_text = response.json()['choices'][0]['text']
                 logger.info("LLM generated text successfully.")
+                if cache_key is not None:
+                    self.cache.set(cache_key, generated_text)
                 return generated_text
             else:
                 logger.error(f"LLM API error: {response.status_code} {response.text}")
@@ -59,6 +101,160 @@ class LLMIntegration:
             logger.error(f"Exception during LLM text generation: {e}")
             return ""
 
+    def generate_text(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7) -> str:
+        """
+        Sends a prompt to the LLM API and returns the generated text.
+        
+        Args:
+            prompt (str): The prompt for the LLM.
+            max_tokens (int): Maximum tokens for the generated text.
+            temperature (float): Sampling temperature for text generation.
+            
+        Returns:
+            The generated text as a string.
+        """
+        cache_key, cached_text = self._cache_lookup(prompt, max_tokens, temperature)
+        if cached_text is not None:
+            return cached_text
+        self.rate_limiter.wait()
+        return self._request_text(prompt, max_tokens, temperature, cache_key)
+
+    def stream_text(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7) -> Iterator[str]:
+        """
+        Sends a prompt with streaming enabled and yields the generated text as it arrives.
+
+        Server-sent events ("data: {...}" lines ending with "data: [DONE]") are decoded chunk by
+        chunk. A provider that ignores the stream flag and answers with one JSON body yields its
+        whole text at once. A complete response is cached like generate_text() does; an
+        interrupted one is not.
+
+        Args:
+            prompt (str): The prompt for the LLM.
+            max_tokens (int): Maximum tokens for the generated text.
+            temperature (float): Sampling temperature for text generation.
+
+        Yields:
+            str: Successive pieces of the generated text.
+        """
+        cache_key, cached_text = self._cache_lookup(prompt, max_tokens, temperature)
+        if cached_text is not None:
+            yield cached_text
+            return
+        self.rate_limiter.wait()
+        headers = {
+            "Authorization": f"Bearer {self.model_config.resolve_api_key()}",
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream"
+        }
+        payload = {
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True
+        }
+        pieces = []
+        finished = False
+        try:
+            # Only the wait for the response headers is timed; the stream is read at the caller's pace.
+            with span("llm_request", provider=self.model_config.name, stream=True):
+                response = self.transport.post(self.model_config.api_url, headers=headers, json=payload, stream=True)
+            count("llm_requests", provider=self.model_config.name, status=response.status_code)
+            with response:
+                if response.status_code != 200:
+                    logger.error(f"LLM API error: {response.status_code} {response.text}")
+                    return
+                if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                    pieces.append(response.json()['choices'][0]['text'])
+                    finished = True
+                    yield pieces[0]
+                else:
+                    for line in response.iter_lines(decode_unicode=True):
+                        if not line or not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            finished = True
+                            break
+                        piece = json.loads(data)['choices'][0].get('text') or ""
+                        if piece:
+                            pieces.append(piece)
+                            yield piece
+        except Exception as e:
+            logger.error(f"Exception during LLM text streaming: {e}")
+            return
+        if not finished:
+            logger.warning(f"LLM stream ended without completion after {len(pieces)} chunks.")
+            return
+        if cache_key is not None:
+            self.cache.set(cache_key, "".join(pieces))
+        logger.info("LLM streamed text successfully.")
+
+    async def agenerate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7,
+                        executor: Executor = None) -> str:
+        """
+        Asynchronous generate_text(): waits for the provider's rate limiter without blocking the
+        event loop, then runs the blocking API call in a worker thread.
+
+        Args:
+            prompt (str): The prompt for the LLM.
+            max_tokens (int): Maximum tokens for the generated text.
+            temperature (float): Sampling temperature for text generation.
+            executor (Executor, optional): Thread pool for the API call. Defaults to the loop's executor.
+
+        Returns:
+            The generated text as a string.
+        """
+        cache_key, cached_text = self._cache_lookup(prompt, max_tokens, temperature)
+        if cached_text is not None:
+            return cached_text
+        await self.rate_limiter.acquire()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._request_text, prompt, max_tokens, temperature, cache_key)
+
+    async def generate_many(self, prompts: Iterable[str], max_tokens: int = 300, temperature: float = 0.7,
+                            concurrency: int = 8, ordered: bool = True) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Generates texts for many prompts with at most concurrency API calls in flight.
+
+        Args:
+            prompts (Iterable[str]): The prompts.
+            max_tokens (int): Maximum tokens for each generated text.
+            temperature (float): Sampling temperature for text generation.
+            concurrency (int): Maximum number of simultaneous API calls.
+            ordered (bool): Yield results in submission order; otherwise as soon as each completes.
+
+        Yields:
+            Tuple[int, str]: The index of the prompt and its generated text.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="llm")
+
+        async def run(index: int, prompt: str) -> Tuple[int, str]:
+            async with semaphore:
+                return index, await self.agenerate(prompt, max_tokens, temperature, executor)
+
+        tasks = [asyncio.ensure_future(run(index, prompt)) for index, prompt in enumerate(prompts)]
+        try:
+            for next_result in (tasks if ordered else asyncio.as_completed(tasks)):
+                yield await next_result
+        finally:
+            # Stop outstanding calls if the caller stops iterating early.
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
+
+    def generate_batch(self, prompts: Iterable[str], max_tokens: int = 300, temperature: float = 0.7,
+                       concurrency: int = 8) -> List[str]:
+        """
+        Blocking helper around generate_many() for callers without an event loop.
+
+        Returns:
+            List[str]: The generated texts, in the order of the prompts.
+        """
+        async def collect() -> List[str]:
+            return [text async for _, text in self.generate_many(prompts, max_tokens, temperature, concurrency)]
+        return asyncio.run(collect())
+
 # # For independent testing
 # if __name__ == "__main__":
 #     prompt = "Generate a cover letter for a software engineer position."
@@ -4,70 +4,344 @@ Purpose: Entry point for the Job Application Bot that ties together:
          - Job application automation,
          - ATS evaluation for a resume against a job description, and
          - Comparison of two resumes using the ATS interface.
+
+Every task is a subcommand that takes its inputs as flags, so it can be scripted:
+
+    python -m src.main score --resume data/resume.pdf --job-file job.txt [--json] [--skills] [--idf stats.json.gz]
+    python -m src.main compare --resume a.pdf --resume b.pdf --job-url https://example.com/job
+    python -m src.main rank --job-file job.txt --top-k 5
+    python -m src.main batch-rank data/ jobs/ --format csv --output scores.csv
+    python -m src.main watch data/ jobs/
+    python -m src.main extract --url https://example.com/job [--model chatgpt] [--stream]
+    python -m src.main apply --resume data/resume.pdf --url https://example.com/apply [--url ...]
+
+Without a subcommand the interactive menu is shown. Modules are imported inside the command that
+needs them: scoring never loads Selenium, requests or BeautifulSoup, PyPDF2 is only imported to
+read a PDF, and the LLM secrets are only read when a model is called.
 """
 
+import os
+import sys
+import json
 import logging
-from src.resume_parser import ResumeParser
-from src.job_automation import JobAutomation
-from src.ats_interface import main as ats_interface_main
+import argparse
+from typing import List
+from src import telemetry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def run_job_application():
+DEFAULT_RESUME = "../data/sample_resume.pdf"
+DEFAULT_JOB_URLS = [
+    "https://example.com/job-application-1",
+    # Add more job URLs if desired
+]
+
+def run_job_application(job_urls: List[str] = None, pdf_resume_path: str = DEFAULT_RESUME, workers: int = None,
+                        headless: bool = True):
     """
     Runs the job application automation process.
+
+    Args:
+        job_urls (List[str], optional): Application URLs. Defaults to DEFAULT_JOB_URLS.
+        pdf_resume_path (str): The PDF resume to parse and upload.
+        workers (int, optional): Browsers running in parallel. Defaults to one per job, up to DEFAULT_WORKERS.
+        headless (bool): Run the browsers without a window.
+
+    Returns:
+        The list of ApplicationResults, or None if the resume could not be parsed.
     """
-    pdf_resume_path = "../data/sample_resume.pdf"
-    # Define the job application URLs (adjust as needed)
-    job_urls = [
-        "https://example.com/job-application-1",
-        # Add more job URLs if desired
-    ]
-    
+    from src.resume_parser import ResumeParser
+    from src.resume_cache import default_cache
+    from src.browser_pool import ApplicationResult, BrowserPool, DEFAULT_WORKERS
+    from src.job_automation import JobAutomation
+    from src.job_queue import JobQueue, APPLIED, FETCHED, PENDING, SCORED, default_worker_id
+    job_urls = DEFAULT_JOB_URLS if job_urls is None else job_urls
+
     try:
         # Parse the resume using ResumeParser
-        resume_parser = ResumeParser(pdf_resume_path)
+        resume_parser = ResumeParser(pdf_resume_path, cache=default_cache())
         resume_parser.extract_text()
         resume_data = resume_parser.parse_text()
         logger.info(f"Parsed Resume Data: {resume_data}")
     except Exception as e:
         logger.error(f"Failed to parse resume: {e}")
-        return
+        return None
 
-    # Setup and execute job automation
-    automation = JobAutomation()
-    try:
-        automation.setup_browser()
-        for url in job_urls:
-            logger.info(f"Applying for job at: {url}")
-            automation.apply_for_job(url, resume_data, pdf_resume_path)
-    except Exception as e:
-        logger.error(f"Error during job automation: {e}")
-    finally:
-        automation.quit_browser()
+    # Postings are tracked in a durable queue: a posting already applied to is never applied to
+    # again, and an interrupted run picks up where it stopped. Only this run's postings are
+    # considered, and each one is claimed right before its try, so its lease cannot expire while
+    # it waits for a browser.
+    job_queue = JobQueue()
+    job_queue.enqueue(job_urls)
+    worker = default_worker_id()
+    claimable = (PENDING, FETCHED, SCORED)
+    jobs = [job for job in map(job_queue.get, dict.fromkeys(job_urls)) if job.status in claimable]
+    if len(jobs) < len(set(job_urls)):
+        logger.info(f"Skipping {len(set(job_urls)) - len(jobs)} postings already applied to or failed.")
+    if not jobs:
+        logger.info(f"Nothing to apply to: {job_queue.counts()}")
+        return []
+    keys = {job.url: job.key for job in jobs}
+    vetoed = {}
+
+    def on_start(application):
+        key = keys[application.job_url]
+        if not job_queue.claim(claimable, worker, at_most_once=True, keys=[key]) or not job_queue.start(key, worker):
+            current = job_queue.get(application.job_url)
+            reason = f"skipped: the posting is {current.status}"
+            vetoed[application.job_url] = reason + (f" ({current.error})" if current.error else "")
+            return False
+        return True
+
+    def on_result(result):
+        if result.ok:
+            job_queue.checkpoint(keys[result.job_url], APPLIED, {"attempts": result.attempts}, worker)
+        elif result.may_have_submitted:
+            # The form may have been submitted before the try failed: never retry it.
+            job_queue.fail(keys[result.job_url], result.error, worker, retry=False)
+        else:
+            job_queue.fail(keys[result.job_url], result.error, worker, took_effect=False)
+
+    # Apply with a pool of browsers, each reused across applications. A failed try may already have
+    # submitted the form, so the pool does not retry; a later run only retries postings whose form
+    # was certainly not submitted.
+    pool = BrowserPool(workers=workers or max(1, min(len(jobs), DEFAULT_WORKERS)), max_attempts=1,
+                       automation_factory=lambda: JobAutomation(headless=headless),
+                       on_start=on_start, on_result=on_result)
+    results = pool.run([job.url for job in jobs], resume_data, pdf_resume_path)
+    results += [ApplicationResult(url, False, 0, -1, reason, False) for url, reason in vetoed.items()]
+    failed = [result for result in results if not result.ok]
+    logger.info(f"Applied to {len(results) - len(failed)} of {len(jobs)} jobs; queue: {job_queue.counts()}")
+    for result in failed:
+        logger.error(f"Application to {result.job_url} failed: {result.error}")
+    return results
+
+def job_description_text(args: argparse.Namespace) -> str:
+    """
+    Returns the job description given by --job-text, --job-file (- for stdin) or --job-url.
+    """
+    if args.job_text is not None:
+        return args.job_text
+    if args.job_file is not None:
+        if args.job_file == "-":
+            return sys.stdin.read()
+        with open(args.job_file, 'r', encoding='utf-8') as file:
+            return file.read()
+    from src.job_description_extractor import JobDescriptionExtractor
+    extractor = JobDescriptionExtractor(args.job_url)
+    extractor.fetch_webpage()
+    extractor.extract_main_content()
+    if not extractor.text:
+        raise SystemExit(f"Could not read a job description from {args.job_url}")
+    return extractor.text
+
+def print_json(data) -> None:
+    print(json.dumps(data, indent=2))
+
+def scoring_options(args: argparse.Namespace) -> dict:
+    """
+    Returns the skill_matcher and corpus_stats arguments selected by --skills and --idf.
+    """
+    options = {}
+    if args.skills:
+        from src.skill_matcher import load_skill_matcher
+        options["skill_matcher"] = load_skill_matcher(args.skills)
+    if args.idf:
+        from src.corpus_stats import load_corpus_stats
+        options["corpus_stats"] = load_corpus_stats(args.idf)
+    return options
+
+def command_score(args: argparse.Namespace) -> int:
+    from src.ats_interface import evaluate_resume, format_result
+    result = evaluate_resume(args.resume, job_description_text(args), use_cache=not args.no_cache,
+                             **scoring_options(args))
+    print_json(result) if args.json else print(format_result(result))
+    return 0
+
+def command_compare(args: argparse.Namespace) -> int:
+    from src.ats_interface import compare_resumes, format_comparison
+    if len(args.resume) < 2:
+        raise SystemExit("compare needs at least two --resume options")
+    results = compare_resumes(args.resume, job_description_text(args), use_cache=not args.no_cache,
+                              **scoring_options(args))
+    if args.json:
+        print_json([{"resume": path, **result} for path, result in zip(args.resume, results)])
+    else:
+        print(format_comparison(results))
+    return 0
+
+def command_rank(args: argparse.Namespace) -> int:
+    from src.ats_interface import DATA_FOLDER, format_ranking, rank_resumes
+    results = rank_resumes(job_description_text(args), args.top_k, args.folder or DATA_FOLDER)
+    if args.json:
+        print_json([{"resume": file, "score": score} for file, score in results])
+    else:
+        print(format_ranking(results))
+    return 0
+
+def command_batch_rank(args: argparse.Namespace) -> int:
+    from src.batch_rank import main as batch_rank_main
+    return batch_rank_main(args.batch_args)
 
-def main():
+def command_watch(args: argparse.Namespace) -> int:
+    from src.watch import main as watch_main
+    return watch_main(args.watch_args)
+
+def command_extract(args: argparse.Namespace) -> int:
+    from src.llm_cache import default_llm_cache
+    from src.job_description_extractor import JobDescriptionExtractor
+    extractor = JobDescriptionExtractor(args.url, args.model, llm_cache=None if args.no_cache else default_llm_cache())
+    extractor.fetch_webpage()
+    extractor.extract_main_content(args.token_budget)
+    if args.stream:
+        details = {}
+        for section, value in extractor.iter_key_job_details():
+            details[section] = value
+            print_json({section: value})
+        return 0 if details else 1
+    details = extractor.extract_key_job_details()
+    print_json(details)
+    return 0 if details else 1
+
+def command_apply(args: argparse.Namespace) -> int:
+    job_urls = list(args.url)
+    if args.urls_file:
+        with open(args.urls_file, 'r', encoding='utf-8') as file:
+            job_urls.extend(line.strip() for line in file if line.strip() and not line.startswith("#"))
+    if not job_urls:
+        raise SystemExit("apply needs --url or --urls-file")
+    results = run_job_application(job_urls, args.resume, args.workers, headless=not args.show_browser)
+    if results is None:
+        return 1
+    return 0 if all(result.ok for result in results) else 1
+
+def add_job_options(parser: argparse.ArgumentParser) -> None:
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--job-text", help="Job description text.")
+    source.add_argument("--job-file", help="File with the job description ('-' for stdin).")
+    source.add_argument("--job-url", help="Job posting URL; its main content is used.")
+
+def add_scoring_options(parser: argparse.ArgumentParser) -> None:
+    from src.skill_matcher import DEFAULT_TAXONOMY_PATH
+    parser.add_argument("--skills", nargs="?", const=DEFAULT_TAXONOMY_PATH, metavar="TAXONOMY",
+                        help="Count skill synonyms as one keyword, from a taxonomy JSON file (the shipped one by default).")
+    parser.add_argument("--idf", metavar="STATS_FILE",
+                        help="Weight keywords by their IDF in a job description statistics file (see src.corpus_stats).")
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Returns the command-line parser.
+    """
+    arg_parser = argparse.ArgumentParser(description="Job Application Bot")
+    arg_parser.add_argument("--metrics", metavar="DIR",
+                            help="Record stage timings and counters; write DIR/autobot.prom and DIR/autobot.json.")
+    arg_parser.add_argument("--profile", metavar="DIR", help="Write a cProfile dump per stage to DIR.")
+    arg_parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    commands = arg_parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    score = commands.add_parser("score", help="Score a resume against a job description.")
+    score.add_argument("--resume", required=True, help="Resume PDF, or a plain text file. Use compare for several.")
+    add_job_options(score)
+    add_scoring_options(score)
+    score.add_argument("--json", action="store_true", help="Print the result as JSON.")
+    score.add_argument("--no-cache", action="store_true", help="Do not use the resume cache.")
+    score.set_defaults(handler=command_score)
+
+    compare = commands.add_parser("compare", help="Score several resumes against the same job description.")
+    compare.add_argument("--resume", action="append", required=True, help="Resume file; give it twice or more.")
+    add_job_options(compare)
+    add_scoring_options(compare)
+    compare.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    compare.add_argument("--no-cache", action="store_true", help="Do not use the resume cache.")
+    compare.set_defaults(handler=command_compare)
+
+    rank = commands.add_parser("rank", help="Rank a folder of resumes against a job description.")
+    add_job_options(rank)
+    rank.add_argument("--folder", help="Folder with PDF resumes. Defaults to the data folder.")
+    rank.add_argument("--top-k", type=int, default=10, help="Number of resumes to show.")
+    rank.add_argument("--json", action="store_true", help="Print the ranking as JSON.")
+    rank.set_defaults(handler=command_rank)
+
+    batch_rank = commands.add_parser("batch-rank", add_help=False,
+                                     help="Stream the scores of every resume of a folder against many jobs "
+                                          "as JSONL or CSV (see python -m src.batch_rank --help).")
+    batch_rank.add_argument("batch_args", nargs=argparse.REMAINDER)
+    batch_rank.set_defaults(handler=command_batch_rank)
+
+    watch = commands.add_parser("watch", add_help=False,
+                                help="Keep the scores of a resume folder up to date while resumes and job "
+                                     "descriptions are edited (see python -m src.watch --help).")
+    watch.add_argument("watch_args", nargs=argparse.REMAINDER)
+    watch.set_defaults(handler=command_watch)
+
+    extract = commands.add_parser("extract", help="Extract the key details of a job posting with an LLM.")
+    extract.add_argument("--url", required=True, help="Job posting URL.")
+    extract.add_argument("--model", help="Model type (chatgpt, gemini, deepseek). Defaults to AUTOBOT_MODEL or chatgpt.")
+    extract.add_argument("--token-budget", type=int, default=3000, help="Maximum prompt tokens of the posting text.")
+    extract.add_argument("--stream", action="store_true", help="Print each section as soon as it is received.")
+    extract.add_argument("--no-cache", action="store_true", help="Do not use the LLM response cache.")
+    extract.set_defaults(handler=command_extract)
+
+    apply = commands.add_parser("apply", help="Apply to jobs with the browser automation.")
+    apply.add_argument("--resume", default=DEFAULT_RESUME, help="PDF resume to parse and upload.")
+    apply.add_argument("--url", action="append", default=[], help="Application URL; may be repeated.")
+    apply.add_argument("--urls-file", help="File with one application URL per line.")
+    apply.add_argument("--workers", type=int, help="Browsers running in parallel.")
+    apply.add_argument("--show-browser", action="store_true", help="Run the browsers with a window.")
+    apply.set_defaults(handler=command_apply)
+    return arg_parser
+
+def export_telemetry(metrics_dir: str = None, profile_dir: str = None) -> None:
     """
-    Main function providing a menu to choose between job application automation 
-    and ATS evaluation (including resume comparison).
+    Writes the recorded stage timings and counters, and the per-stage profiles.
+    """
+    if metrics_dir:
+        telemetry.write_prometheus(os.path.join(metrics_dir, "autobot.prom"))
+        telemetry.write_json(os.path.join(metrics_dir, "autobot.json"))
+    if profile_dir:
+        telemetry.dump_profiles(profile_dir)
+
+def interactive_menu() -> None:
+    """
+    Menu to choose between job application automation and ATS evaluation (including resume comparison).
     """
     print("Welcome to the Job Application Bot")
     print("Please select an option:")
     print("1. Apply for job (automation)")
     print("2. Evaluate a single resume against a job description (ATS Evaluation)")
     print("3. Compare two resumes for ATS Evaluation")
-    
+
     choice = input("Enter your choice (1/2/3): ").strip()
-    
+
     if choice == "1":
         run_job_application()
     elif choice == "2" or choice == "3":
         # The ats_interface_main() function in ats_interface.py provides
         # interactive options for evaluating and comparing resumes.
+        from src.ats_interface import main as ats_interface_main
         ats_interface_main()
     else:
         print("Invalid choice. Exiting.")
 
+def main(argv: List[str] = None) -> int:
+    """
+    Runs a subcommand, or the interactive menu when none is given.
+
+    Returns:
+        int: The process exit status.
+    """
+    args = build_parser().parse_args(argv)
+    logging.getLogger().setLevel(args.log_level)
+    if args.metrics or args.profile:
+        telemetry.enable(profile_dir=args.profile)
+    try:
+        if args.command is None:
+            interactive_menu()
+            return 0
+        return args.handler(args)
+    finally:
+        export_telemetry(args.metrics, args.profile)
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
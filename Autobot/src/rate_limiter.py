@@ -0,0 +1,88 @@
+"""
+Module: rate_limiter.py
+Purpose: Token-bucket rate limiting for calls to the LLM providers.
+
+A TokenBucket refills at a fixed rate up to a burst capacity, and every call takes one token.
+Callers reserve their token under a thread lock and are told how long to wait for it. The bucket
+therefore works both for threads (wait()) and for coroutines on any event loop (acquire()), and
+concurrent callers are spaced out evenly instead of waking up together.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_limiters: Dict[str, "TokenBucket"] = {}
+_registry_lock = threading.Lock()
+
+class TokenBucket:
+    """
+    A token bucket; a rate of None means unlimited.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate (float, optional): Tokens added per second. None disables limiting.
+            capacity (float): Maximum number of tokens, i.e. the largest burst allowed.
+            clock (Callable[[], float]): Monotonic time source in seconds.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens from the bucket, going into debt if needed.
+
+        Returns:
+            float: Seconds the caller must wait before using the reserved tokens.
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= tokens
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def wait(self, tokens: float = 1.0) -> None:
+        """
+        Blocks the calling thread until the tokens are available.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Suspends the calling coroutine until the tokens are available.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+def get_rate_limiter(provider: str, rate: Optional[float] = None, capacity: float = 1.0) -> TokenBucket:
+    """
+    Returns the shared token bucket of a provider, creating it on first use.
+
+    Args:
+        provider (str): Provider name, e.g. a ModelConfig name.
+        rate (float, optional): Requests per second, only used when the bucket is created.
+        capacity (float): Burst size, only used when the bucket is created.
+    """
+    with _registry_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = TokenBucket(rate, capacity)
+            _limiters[provider] = limiter
+        return limiter
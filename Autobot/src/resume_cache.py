@@ -0,0 +1,97 @@
+"""
+Module: resume_cache.py
+Purpose: A content-addressed on-disk cache for resume parsing results.
+
+Entries are keyed by the SHA-256 of the PDF bytes, the parser version and the PDF backend, so a
+renamed or copied file is still a hit while an edited file, a parser change or a PyPDF2 upgrade is
+a miss. Each entry holds the extracted text and, once parse_text() has run, the parsed fields.
+Storage is a shared SQLiteCache with size-based LRU eviction, safe to use from several processes.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Dict, Optional
+from src.sqlite_cache import SQLiteCache, CACHE_DIR
+from src.resume_parser import PARSER_VERSION, pdf_backend
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_default_cache = None
+
+def file_digest(path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ResumeCache:
+    """
+    Caches extracted resume text and parsed fields by file content.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path (str, optional): SQLite file to store the cache in. Defaults to CACHE_DIR/resumes.sqlite3.
+            max_bytes (int): Size above which least recently used entries are evicted.
+        """
+        self.store = SQLiteCache(path or os.path.join(CACHE_DIR, 'resumes.sqlite3'), max_bytes=max_bytes)
+        self.prefix = f"{PARSER_VERSION}:{pdf_backend()}:"
+
+    def key_for(self, pdf_path: str) -> str:
+        """
+        Returns the cache key for a PDF file.
+        """
+        return self.prefix + file_digest(pdf_path)
+
+    def get(self, key: str) -> Dict[str, object]:
+        """
+        Returns the cached entry for a key, or an empty dict on a miss.
+
+        The entry may contain "text" (the extracted text) and "fields" (the parse_text() result).
+        """
+        value = self.store.get(key)
+        return json.loads(value) if value is not None else {}
+
+    def update(self, key: str, text: Optional[str] = None, fields: Optional[Dict[str, object]] = None) -> None:
+        """
+        Stores the text and/or fields for a key, keeping whatever part is already cached. Fields
+        are merged into the cached ones. The read and the write happen in one transaction, so
+        concurrent writers (e.g. bulk ingestion workers) do not overwrite each other's results.
+        """
+        def merge(value: Optional[bytes]) -> bytes:
+            entry = json.loads(value) if value is not None else {}
+            if text is not None:
+                entry["text"] = text
+            if fields is not None:
+                entry["fields"] = {**entry.get("fields", {}), **fields}
+            return json.dumps(entry).encode('utf-8')
+        self.store.update(key, merge)
+
+    def invalidate(self, pdf_path: str = None) -> None:
+        """
+        Drops the cached entry for one PDF, or the whole cache when no path is given.
+        """
+        if pdf_path is None:
+            self.store.clear()
+            logger.info("Resume cache cleared.")
+        else:
+            self.store.delete(self.key_for(pdf_path))
+
+def default_cache() -> ResumeCache:
+    """
+    Returns the process-wide resume cache stored under CACHE_DIR.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResumeCache()
+    return _default_cache
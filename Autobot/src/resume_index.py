@@ -0,0 +1,240 @@
+"""
+Module: resume_index.py
+Purpose: Maintains a persistent BM25 inverted index over the resume corpus so the best resumes for a
+         job description can be retrieved without scoring every file.
+
+The index stores, for every term, a postings map of resume id -> term frequency. Queries only touch
+the postings of the terms in the job description, and a MaxScore-style cut-off stops admitting new
+candidates as soon as the remaining query terms can no longer push one into the top-k. Resumes can be
+added and removed one at a time, and sync_directory() keeps the index in step with a folder of PDFs.
+"""
+
+import os
+import json
+import math
+import heapq
+import logging
+from collections import Counter
+from typing import Dict, List, Tuple, Optional
+from src.resume_parser import ResumeParser
+from src.text_pipeline import DEFAULT_NORMALIZER
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into index terms using the same cleaning rules as ATSEvaluator, but keeping repeats
+    so that term frequencies can be counted.
+
+    Args:
+        text (str): The input text.
+
+    Returns:
+        List[str]: The terms in document order.
+    """
+    return list(DEFAULT_NORMALIZER.terms(text))
+
+
+class ResumeIndex:
+    """
+    A BM25 inverted index over resume texts, keyed by resume id (the PDF file name).
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initializes an empty index.
+
+        Args:
+            k1 (float): BM25 term-frequency saturation parameter.
+            b (float): BM25 document-length normalization parameter.
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.documents: Dict[str, Dict[str, object]] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def add_document(self, doc_id: str, text: str, signature: Optional[List[float]] = None) -> None:
+        """
+        Adds a document to the index, replacing any previous version with the same id.
+
+        Args:
+            doc_id (str): Unique id of the document.
+            text (str): The document text.
+            signature (List[float], optional): File mtime and size, used by sync_directory() to
+                                               detect modified files.
+        """
+        if doc_id in self.documents:
+            self.remove_document(doc_id)
+        term_counts = Counter(tokenize(text))
+        for term, tf in term_counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        length = sum(term_counts.values())
+        self.documents[doc_id] = {"length": length, "signature": signature, "terms": list(term_counts)}
+        self.total_length += length
+
+    def remove_document(self, doc_id: str) -> bool:
+        """
+        Removes a document from the index.
+
+        Args:
+            doc_id (str): Id of the document to remove.
+
+        Returns:
+            bool: True if the document was indexed.
+        """
+        document = self.documents.pop(doc_id, None)
+        if document is None:
+            return False
+        for term in document["terms"]:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+        self.total_length -= document["length"]
+        return True
+
+    def add_resume(self, pdf_path: str, doc_id: str = None, cache=None) -> None:
+        """
+        Extracts the text of a resume PDF with ResumeParser and adds it to the index.
+
+        Args:
+            pdf_path (str): Path to the PDF resume.
+            doc_id (str, optional): Id to index it under. Defaults to the file name.
+            cache (ResumeCache, optional): Cache passed on to ResumeParser.
+        """
+        stat = os.stat(pdf_path)
+        text = ResumeParser(pdf_path, cache=cache).extract_text()
+        self.add_document(doc_id or os.path.basename(pdf_path), text, [stat.st_mtime, stat.st_size])
+
+    def sync_directory(self, folder: str, cache=None) -> Tuple[List[str], List[str]]:
+        """
+        Brings the index in line with the PDFs in a folder: new or modified files are (re)indexed
+        and files that disappeared are removed. Unchanged files are not re-parsed.
+
+        Args:
+            folder (str): Folder containing the PDF resumes.
+            cache (ResumeCache, optional): Cache passed on to ResumeParser.
+
+        Returns:
+            Tuple[List[str], List[str]]: Ids of the documents added or updated, and of those removed.
+        """
+        present = {}
+        for name in os.listdir(folder):
+            if name.lower().endswith('.pdf'):
+                stat = os.stat(os.path.join(folder, name))
+                present[name] = [stat.st_mtime, stat.st_size]
+
+        added = []
+        for name, signature in present.items():
+            document = self.documents.get(name)
+            if document is not None and document["signature"] == signature:
+                continue
+            try:
+                self.add_resume(os.path.join(folder, name), name, cache=cache)
+                added.append(name)
+            except Exception as e:
+                logger.error(f"Skipping {name}, could not index it: {e}")
+        removed = [doc_id for doc_id in list(self.documents) if doc_id not in present]
+        for doc_id in removed:
+            self.remove_document(doc_id)
+        logger.info(f"Index synced: {len(added)} added or updated, {len(removed)} removed, {len(self)} total.")
+        return added, removed
+
+    def _idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.documents) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the top-k resumes for a job description ranked by BM25.
+
+        Args:
+            query (str): The job description text.
+            top_k (int): Number of results to return.
+
+        Returns:
+            List[Tuple[str, float]]: (resume id, score) pairs, best first.
+        """
+        if not self.documents or top_k <= 0:
+            return []
+        avg_length = self.total_length / len(self.documents) or 1.0
+        terms = [term for term in set(tokenize(query)) if term in self.postings]
+        # Highest-impact terms first; a term can add at most idf * (k1 + 1) to any document.
+        weighted = sorted(((self._idf(term), term) for term in terms), reverse=True)
+        remaining_bound = sum(idf * (self.k1 + 1) for idf, _ in weighted)
+
+        scores: Dict[str, float] = {}
+        admitting = True
+        for idf, term in weighted:
+            if admitting and len(scores) >= top_k:
+                threshold = heapq.nlargest(top_k, scores.values())[-1]
+                # A resume not seen yet scores at most remaining_bound, so none can enter the top-k.
+                admitting = threshold < remaining_bound
+            postings = self.postings[term]
+            if admitting:
+                candidates = postings.items()
+            elif len(scores) < len(postings):
+                candidates = ((doc_id, postings[doc_id]) for doc_id in scores if doc_id in postings)
+            else:
+                candidates = ((doc_id, tf) for doc_id, tf in postings.items() if doc_id in scores)
+            for doc_id, tf in candidates:
+                norm = self.k1 * (1 - self.b + self.b * self.documents[doc_id]["length"] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+            remaining_bound -= idf * (self.k1 + 1)
+        return heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to disk atomically.
+
+        Args:
+            path (str): Destination file.
+        """
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "documents": self.documents,
+            "postings": self.postings,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        logger.info(f"Saved resume index with {len(self)} documents to {path}.")
+
+    @classmethod
+    def load(cls, path: str) -> "ResumeIndex":
+        """
+        Loads an index written by save(). Returns an empty index if the file does not exist
+        or was written by an incompatible version.
+
+        Args:
+            path (str): Index file.
+
+        Returns:
+            ResumeIndex: The loaded index.
+        """
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            logger.warning(f"Ignoring resume index at {path} with unsupported version {data.get('version')}.")
+            return cls()
+        index = cls(k1=data["k1"], b=data["b"])
+        index.documents = data["documents"]
+        index.postings = data["postings"]
+        index.total_length = sum(document["length"] for document in index.documents.values())
+        return index
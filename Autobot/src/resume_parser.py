@@ -4,75 +4,177 @@ Purpose: Provides functionalities to extract text from a PDF resume and parse ke
 """
 
 
-import PyPDF2
-import re
 import logging
-from typing import Dict
+import functools
+from typing import Dict, Iterator, List, Tuple
+from src.field_extractor import FieldExtractor, default_extractor
+from src.telemetry import count, timed
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump PARSER_VERSION whenever extraction or parsing output changes, so cached results are not reused.
+PARSER_VERSION = "2"
+
+@functools.lru_cache(maxsize=None)
+def pdf_backend() -> str:
+    """
+    Returns the name and version of the PDF library, e.g. "PyPDF2-3.0.1".
+    
+    PyPDF2 takes tens of milliseconds to import, so it is only imported when a PDF is read or a
+    cache key needs its version.
+    """
+    import PyPDF2
+    return f"PyPDF2-{PyPDF2.__version__}"
+
 class ResumeParser:
     """
     A class to extract text from a PDF file and parse key resume information.
     """
+    # Fields returned by parse_text() when none are requested explicitly.
+    DEFAULT_FIELDS = ['name', 'email', 'phone']
     
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, cache=None, field_extractor: FieldExtractor = None):
         """
         Initialize the ResumeParser with the path to the PDF file.
+        
+        Args:
+            pdf_path (str): Path to the PDF resume.
+            cache (ResumeCache, optional): Content-addressed cache for the extracted text and parsed fields.
+            field_extractor (FieldExtractor, optional): Field definitions to parse with.
+                                                        Defaults to the shared default extractor.
         """
         self.pdf_path = pdf_path
+        self.field_extractor = field_extractor or default_extractor()
         self.text = ""
         self.parsed_data: Dict[str, str] = {}
+        self.cache = cache
+        self._cache_key = None
     
-    def extract_text(self) -> str:
+    def _cached_entry(self) -> Dict[str, object]:
         """
-        Extracts text from the PDF file.
+        Returns the cache entry for this PDF, or an empty dict if there is none or no cache is set.
+        """
+        if self.cache is None:
+            return {}
+        if self._cache_key is None:
+            self._cache_key = self.cache.key_for(self.pdf_path)
+        entry = self.cache.get(self._cache_key)
+        count("resume_cache_lookups", result="hit" if entry else "miss")
+        return entry
+    
+    def iter_pages(self) -> Iterator[str]:
+        """
+        Lazily yields the text of each page of the PDF, one page at a time.
         
-        Returns:
-            The extracted text as a single string.
+        Pages without extractable text yield an empty string. Closing the generator early stops
+        reading the file, so callers only pay for the pages they consume.
+        
+        Yields:
+            The text of each page.
         """
+        import PyPDF2
         try:
             with open(self.pdf_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
                 for page in reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                self.text = text
-                logger.info("Successfully extracted text from PDF.")
-                return text
+                    text = page.extract_text() or ""
+                    count("pdf_pages_parsed")
+                    yield text
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             raise
     
-    def parse_text(self) -> Dict[str, str]:
+    @timed("pdf_extract_text")
+    def extract_text(self) -> str:
+        """
+        Extracts text from the PDF file.
+        
+        Returns:
+            The extracted text as a single string.
+        """
+        entry = self._cached_entry()
+        if "text" in entry:
+            self.text = entry["text"]
+            logger.info("Loaded resume text from cache.")
+            return self.text
+        text = "".join(page_text + "\n" for page_text in self.iter_pages() if page_text)
+        self.text = text
+        logger.info("Successfully extracted text from PDF.")
+        if self.cache is not None:
+            self.cache.update(self._cache_key, text=text)
+        return text
+    
+    def _scan_pages(self, fields: List[str]) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Streams pages until every requested field has been found, without extracting the rest.
+        
+        A match only counts as settled once more text follows it, because a field at the very end
+        of what has been read so far (e.g. a phone number) could continue on the next page. The
+        buffer is scanned after pages 1, 2, 4, 8, ... so the total scan work stays linear.
+        If the whole document ends up being read, it is kept as self.text.
+        """
+        parts = []
+        next_check = 1
+        pages = self.iter_pages()
+        for page_count, page_text in enumerate(pages, start=1):
+            if page_text:
+                parts.append(page_text + "\n")
+            if page_count < next_check:
+                continue
+            next_check *= 2
+            buffer = "".join(parts)
+            found = self.field_extractor.scan(buffer, fields)
+            if self.field_extractor.is_settled(found, len(buffer)):
+                pages.close()
+                logger.info(f"Found all requested fields after reading {page_count} page(s).")
+                return found
+        
+        self.text = "".join(parts)
+        if self.cache is not None:
+            self.cache.update(self._cache_key, text=self.text)
+        return self.field_extractor.scan(self.text, fields)
+    
+    @timed("resume_parse")
+    def parse_text(self, fields: List[str] = None) -> Dict[str, str]:
         """
-        Parses the extracted text to find key resume fields.
+        Parses the resume to find key fields.
+        
+        If the text has not been extracted yet, pages are streamed and reading stops as soon as
+        every requested field has been found.
+        
+        Args:
+            fields (List[str], optional): Fields to parse, from the field extractor's specs.
+                                          Defaults to DEFAULT_FIELDS.
         
         Returns:
             A dictionary with parsed resume data (e.g., name, email, phone).
         """
-        if not self.text:
-            self.extract_text()
-            
-        data = {}
+        fields = list(fields or self.DEFAULT_FIELDS)
         try:
-            # Example: Extract name assuming it's prefixed with "Name:"
-            name_match = re.search(r"Name:\s*(.+)", self.text)
-            data['name'] = name_match.group(1).strip() if name_match else "Not found"
-            
-            # Example: Extract email
-            email_match = re.search(r"Email:\s*([\w\.-]+@[\w\.-]+)", self.text)
-            data['email'] = email_match.group(1).strip() if email_match else "Not found"
-            
-            # Example: Extract phone number (simple regex; customize as needed)
-            phone_match = re.search(r"Phone:\s*([\d\-\+\(\)\s]+)", self.text)
-            data['phone'] = phone_match.group(1).strip() if phone_match else "Not found"
+            if self.text:
+                found = self.field_extractor.scan(self.text, fields)
+            else:
+                entry = self._cached_entry()
+                cached = entry.get("fields", {})
+                if all(field in cached for field in fields):
+                    self.parsed_data = {field: cached[field] for field in fields}
+                    logger.info("Loaded parsed resume data from cache.")
+                    return dict(self.parsed_data)
+                if "text" in entry:
+                    self.text = entry["text"]
+                    found = self.field_extractor.scan(self.text, fields)
+                else:
+                    found = self._scan_pages(fields)
             
+            data = self.field_extractor.values(found)
             self.parsed_data = data
             logger.info("Successfully parsed resume data.")
+            if self.cache is not None:
+                # The cache merges these fields into the ones already stored, so no second lookup is needed.
+                if self._cache_key is None:
+                    self._cache_key = self.cache.key_for(self.pdf_path)
+                self.cache.update(self._cache_key, fields=data)
             return data
         except Exception as e:
             logger.error(f"Error parsing resume text: {e}")
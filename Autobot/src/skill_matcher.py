@@ -0,0 +1,184 @@
+"""
+Module: skill_matcher.py
+Purpose: Detects skills from a curated taxonomy in resumes and job descriptions.
+
+The taxonomy maps canonical skill ids to their surface forms and synonyms, for example
+"kubernetes" -> ["Kubernetes", "k8s"]. All surface forms are compiled once into an Aho-Corasick
+automaton, so every taxonomy hit in a text is found in one linear pass no matter how many phrases
+the taxonomy holds. Hits are reported with their canonical id, which ATSEvaluator uses as the
+keyword, so "k8s" in a resume matches "Kubernetes" in a job description.
+
+Matching ignores case, except for the forms a taxonomy lists as case-sensitive: short aliases such
+as "Go" or "TS" are skills only when written exactly so, and ordinary words otherwise.
+"""
+
+import os
+import re
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sample taxonomy shipped with the project; point load_skill_matcher() at a full one in production.
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Config', 'skill_taxonomy.json')
+
+_WHITESPACE = re.compile(r"\s+")
+
+_matchers: Dict[str, "SkillMatcher"] = {}
+
+def normalize(text: str) -> str:
+    """
+    Lower-cases text and collapses runs of whitespace into single spaces.
+    """
+    return _WHITESPACE.sub(" ", text.lower())
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+@dataclass(frozen=True)
+class SkillHit:
+    """
+    One occurrence of a taxonomy phrase.
+
+    Attributes:
+        skill_id (str): Canonical id of the skill.
+        phrase (str): The normalized surface form that matched.
+        start (int): Start offset in the normalized text.
+        end (int): End offset (exclusive) in the normalized text.
+    """
+    skill_id: str
+    phrase: str
+    start: int
+    end: int
+
+class SkillMatcher:
+    """
+    An Aho-Corasick automaton over every surface form of a skill taxonomy.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Union[Iterable[str], Dict[str, List[str]]]]):
+        """
+        Builds the automaton.
+
+        Args:
+            taxonomy (Dict): Canonical skill id -> surface forms, either as a list or as a dict with
+                             "forms" and "case_sensitive" lists. The id itself is always matched as well.
+        """
+        self.phrases: List[str] = []
+        self.skill_ids: List[str] = []
+        # The exact spelling a phrase must have in the text, or None if any case matches.
+        self.cased_forms: List[Optional[str]] = []
+        # Trie stored as parallel lists indexed by state number; state 0 is the root.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for skill_id, forms in taxonomy.items():
+            case_sensitive = []
+            if isinstance(forms, dict):
+                case_sensitive = forms.get("case_sensitive", [])
+                forms = forms.get("forms", [])
+            for form in {normalize(form).strip() for form in [skill_id, *forms]}:
+                if form:
+                    self._add(form, skill_id)
+            for form in {_WHITESPACE.sub(" ", form).strip() for form in case_sensitive}:
+                if form:
+                    self._add(form.lower(), skill_id, cased_form=form)
+        self._build_failure_links()
+        logger.info(f"Built skill matcher with {len(self.phrases)} phrases for {len(taxonomy)} skills.")
+
+    def _add(self, phrase: str, skill_id: str, cased_form: Optional[str] = None) -> None:
+        state = 0
+        for char in phrase:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(len(self.phrases))
+        self.phrases.append(phrase)
+        self.skill_ids.append(skill_id)
+        self.cased_forms.append(cased_form)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Inherit the matches of the longest proper suffix.
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> List[SkillHit]:
+        """
+        Returns every whole-word taxonomy hit in text, in order of their end offset.
+
+        Args:
+            text (str): The resume or job description text.
+
+        Returns:
+            List[SkillHit]: The hits, with offsets into normalize(text).
+        """
+        collapsed = _WHITESPACE.sub(" ", text)
+        text = collapsed.lower()
+        # Case-sensitive forms are checked against the original spelling, which is only aligned with
+        # the normalized text when lower-casing kept every character's length.
+        original = collapsed if len(collapsed) == len(text) else None
+        goto, fail, output = self._goto, self._fail, self._output
+        hits = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+            end = position + 1
+            if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[position]):
+                continue
+            for pattern_id in output[state]:
+                phrase = self.phrases[pattern_id]
+                start = end - len(phrase)
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(phrase[0]):
+                    continue
+                cased_form = self.cased_forms[pattern_id]
+                if cased_form is not None and (original is None or original[start:end] != cased_form):
+                    continue
+                hits.append(SkillHit(self.skill_ids[pattern_id], phrase, start, end))
+        return hits
+
+    def skills(self, text: str) -> FrozenSet[str]:
+        """
+        Returns the canonical ids of the skills mentioned in text.
+        """
+        return frozenset(hit.skill_id for hit in self.find(text))
+
+def load_taxonomy(path: str = DEFAULT_TAXONOMY_PATH) -> Dict[str, Union[List[str], Dict[str, List[str]]]]:
+    """
+    Reads a taxonomy JSON file mapping canonical skill ids to lists of synonyms, or to a dict with
+    "forms" and "case_sensitive" lists of synonyms.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+def load_skill_matcher(path: str = DEFAULT_TAXONOMY_PATH) -> SkillMatcher:
+    """
+    Returns the SkillMatcher for a taxonomy file, building it only on first use in this process.
+    """
+    path = os.path.abspath(path)
+    matcher = _matchers.get(path)
+    if matcher is None:
+        matcher = SkillMatcher(load_taxonomy(path))
+        _matchers[path] = matcher
+    return matcher
@@ -0,0 +1,252 @@
+"""
+Module: sqlite_cache.py
+Purpose: A small persistent key/value cache on top of SQLite, shared by the caches in this project.
+
+Entries are stored as blobs together with their size and last access time. Triggers keep the
+total size in a row of the meta table, updated in the same transaction as every insert, update
+and delete, so a write never has to sum the table. When the total grows past max_bytes the least
+recently used entries are evicted in batches, in access-time order from the index, until it falls
+to low_water * max_bytes; the headroom spares the next writes another eviction. Entries older
+than ttl seconds (if set) are treated as missing. SQLite's own locking makes the file safe to share
+between threads and processes; every process opens its own connection in WAL mode.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Callable, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Directory holding the project's cache files; override with the AUTOBOT_CACHE_DIR environment variable.
+CACHE_DIR = os.getenv('AUTOBOT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'autobot'))
+
+# Most entries deleted by one eviction statement.
+EVICT_BATCH = 256
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS entries ("
+    " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+    " created_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)",
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN"
+    " UPDATE meta SET value = value + NEW.size WHERE name = 'total_bytes'; END",
+    "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN"
+    " UPDATE meta SET value = value - OLD.size WHERE name = 'total_bytes'; END",
+    "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN"
+    " UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'total_bytes'; END",
+    # Created after the triggers, so a database written before the meta table existed starts
+    # from the sum of its entries and no later write is missed.
+    "INSERT OR IGNORE INTO meta (name, value) SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM entries",
+]
+
+# Replaces an entry in place: unlike INSERT OR REPLACE, this fires the update trigger instead of
+# deleting the old row without firing the delete trigger.
+UPSERT = (
+    "INSERT INTO entries (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)"
+    " ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size,"
+    " created_at = excluded.created_at, accessed_at = excluded.accessed_at"
+)
+
+class SQLiteCache:
+    """
+    A size-bounded LRU cache of bytes values stored in a SQLite database file.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024, ttl: Optional[float] = None,
+                 low_water: float = 0.9):
+        """
+        Initializes the cache, creating the database file if needed.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            max_bytes (int): Total size of the stored values above which LRU eviction starts.
+            ttl (float, optional): Maximum age of an entry in seconds. None keeps entries until evicted.
+            low_water (float): Fraction of max_bytes that an eviction brings the total size down to.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.low_water = low_water
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns this process's connection, reopening it after a fork.
+        """
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def __getstate__(self):
+        # Connections cannot be pickled; the receiving process opens its own.
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the value stored under key and marks it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            The stored bytes, or None on a miss or an expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Stores a value under key, evicting least recently used entries if the cache is over size.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The value to store.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(UPSERT, (key, sqlite3.Binary(value), len(value), now, now))
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def update(self, key: str, function: Callable[[Optional[bytes]], bytes]) -> bytes:
+        """
+        Replaces the value under key by function(current value) in one write transaction, so
+        concurrent updates of the same key from other threads or processes are not lost.
+
+        Args:
+            key (str): The cache key.
+            function (Callable): Receives the stored bytes, or None on a miss or an expired entry,
+                                 and returns the new value.
+
+        Returns:
+            bytes: The stored value.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+                current = None
+                if row is not None and (self.ttl is None or now - row[1] <= self.ttl):
+                    current = row[0]
+                value = function(current)
+                conn.execute(UPSERT, (key, sqlite3.Binary(value), len(value), now, now))
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return value
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """
+        If the total size is over max_bytes, deletes the least recently used entries until it is
+        at most low_water * max_bytes.
+        """
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * self.low_water)
+        evicted = 0
+        while total > target:
+            # Count the oldest entries that free enough space, reading sizes in index order only as
+            # far as needed, then delete them with one statement.
+            count = 0
+            freed = 0
+            for (size,) in conn.execute("SELECT size FROM entries ORDER BY accessed_at LIMIT ?", (EVICT_BATCH,)):
+                count += 1
+                freed += size
+                if total - freed <= target:
+                    break
+            if count == 0:
+                break
+            conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at LIMIT ?)", (count,)
+            )
+            evicted += count
+            total = self._total_bytes(conn)
+        logger.info(f"Evicted {evicted} entries from cache {self.path}.")
+
+    def delete(self, key: str) -> bool:
+        """
+        Removes one entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        with self._lock:
+            return self._connection().execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._connection().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        """
+        Returns the total size of the stored values.
+        """
+        with self._lock:
+            return self._total_bytes(self._connection())
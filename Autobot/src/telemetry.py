@@ -0,0 +1,276 @@
+"""
+Module: telemetry.py
+Purpose: Lightweight per-stage tracing and counters for the pipeline, exported as a Prometheus text
+         file and as JSON, with optional cProfile dumps per stage.
+
+Stages are timed with span("stage", label=value) used as a context manager, or with the @timed
+decorator. Events and sizes are counted with count("name", amount, label=value). Telemetry is
+off by default. While it is off, span() returns a shared no-op object and count() returns at
+once, so instrumented code pays for one global check per call.
+
+enable() turns recording on. With a profile directory, each span also runs under cProfile and
+the profiles are merged per stage into <directory>/<stage>.prof, readable with pstats or
+snakeviz. Only one profiler can be active per thread, so a stage nested in another one is
+profiled as part of the outer stage.
+"""
+
+import os
+import json
+import time
+import functools
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "autobot"
+# Upper bounds (seconds) of the stage duration histogram buckets.
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_enabled = False
+_profile_dir: Optional[str] = None
+_lock = threading.Lock()
+_local = threading.local()
+# (stage, labels) -> [count, total seconds, max seconds, bucket counts]
+_stages: Dict[Tuple[str, Labels], list] = {}
+_counters: Dict[Tuple[str, Labels], float] = {}
+# (stage, thread id) -> cProfile.Profile; merged per stage when dumped.
+_profiles: Dict[Tuple[str, int], object] = {}
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+class _NullSpan:
+    """
+    The span returned while telemetry is disabled.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class Span:
+    """
+    Times one run of a stage and records it when the block exits.
+    """
+    __slots__ = ("name", "labels", "start", "profiler")
+
+    def __init__(self, name: str, labels: Labels):
+        self.name = name
+        self.labels = labels
+        self.start = 0.0
+        self.profiler = None
+
+    def __enter__(self) -> "Span":
+        if _profile_dir is not None and not getattr(_local, "profiling", False):
+            import cProfile
+            key = (self.name, threading.get_ident())
+            with _lock:
+                self.profiler = _profiles.setdefault(key, cProfile.Profile())
+            _local.profiling = True
+            self.profiler.enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        if self.profiler is not None:
+            self.profiler.disable()
+            _local.profiling = False
+        with _lock:
+            stats = _stages.get((self.name, self.labels))
+            if stats is None:
+                stats = _stages[(self.name, self.labels)] = [0, 0.0, 0.0, [0] * len(BUCKETS)]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            for index, bound in enumerate(BUCKETS):
+                if elapsed <= bound:
+                    stats[3][index] += 1
+        return False
+
+def span(name: str, **labels) -> object:
+    """
+    Returns a context manager timing a stage, e.g. `with span("llm_request", provider="ChatGPT"):`.
+    """
+    if not _enabled:
+        return NULL_SPAN
+    return Span(name, _labels(labels))
+
+def timed(name: str, **labels) -> Callable:
+    """
+    Decorator timing every call of a function as a stage.
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with Span(name, _labels(labels)):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name: str, amount: float = 1, **labels) -> None:
+    """
+    Adds amount to a counter, e.g. count("http_fetch_bytes", len(body)).
+    """
+    if not _enabled:
+        return
+    key = (name, _labels(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+def enable(profile_dir: str = None) -> None:
+    """
+    Starts recording spans and counters.
+
+    Args:
+        profile_dir (str, optional): Directory for per-stage cProfile dumps; None disables profiling.
+    """
+    global _enabled, _profile_dir
+    if profile_dir is not None:
+        os.makedirs(profile_dir, exist_ok=True)
+    _profile_dir = profile_dir
+    _enabled = True
+
+def disable() -> None:
+    """
+    Stops recording. Collected data is kept until reset().
+    """
+    global _enabled, _profile_dir
+    _enabled = False
+    _profile_dir = None
+
+def is_enabled() -> bool:
+    return _enabled
+
+def reset() -> None:
+    """
+    Discards every recorded span, counter and profile.
+    """
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _profiles.clear()
+
+def snapshot() -> Dict[str, List[dict]]:
+    """
+    Returns the recorded stages and counters as plain data.
+    """
+    with _lock:
+        stages = [{"stage": name, "labels": dict(labels), "count": stats[0], "total_seconds": round(stats[1], 6),
+                   "max_seconds": round(stats[2], 6)} for (name, labels), stats in sorted(_stages.items())]
+        counters = [{"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(_counters.items())]
+    return {"stages": stages, "counters": counters}
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _label_text(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _metric_name(name: str) -> str:
+    return "".join(char if char.isalnum() or char == "_" else "_" for char in f"{METRIC_PREFIX}_{name}")
+
+def prometheus_text() -> str:
+    """
+    Renders the recorded data in the Prometheus text exposition format.
+
+    Stages become one histogram, {prefix}_stage_duration_seconds, labelled by stage; counters
+    become {prefix}_{name}_total.
+    """
+    with _lock:
+        stages = sorted((key, (stats[0], stats[1], list(stats[3]))) for key, stats in _stages.items())
+        counters = sorted(_counters.items())
+    metric = _metric_name("stage_duration_seconds")
+    lines = [f"# HELP {metric} Time spent in each pipeline stage.", f"# TYPE {metric} histogram"]
+    for (name, labels), (calls, total, buckets) in stages:
+        labels = (("stage", name),) + labels
+        for bound, bucket_count in zip(BUCKETS, buckets):
+            lines.append(f"{metric}_bucket{_label_text(labels, (('le', repr(bound)),))} {bucket_count}")
+        lines.append(f"{metric}_bucket{_label_text(labels, (('le', '+Inf'),))} {calls}")
+        lines.append(f"{metric}_sum{_label_text(labels)} {total:.6f}")
+        lines.append(f"{metric}_count{_label_text(labels)} {calls}")
+    declared = set()
+    for (name, labels), value in counters:
+        metric = _metric_name(f"{name}_total")
+        if metric not in declared:
+            declared.add(metric)
+            lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric}{_label_text(labels)} {value:g}")
+    return "\n".join(lines) + "\n"
+
+def _write_atomic(path: str, text: str) -> None:
+    # Written to a temporary file and renamed, so a collector never reads a partial file.
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temporary, path)
+
+def write_prometheus(path: str) -> None:
+    """
+    Writes the Prometheus text file, e.g. for node_exporter's textfile collector.
+    """
+    _write_atomic(path, prometheus_text())
+    logger.info(f"Metrics written to {path}.")
+
+def write_json(path: str) -> None:
+    """
+    Writes the recorded stages and counters as JSON.
+    """
+    _write_atomic(path, json.dumps(snapshot(), indent=2) + "\n")
+    logger.info(f"Metrics written to {path}.")
+
+def dump_profiles(directory: str = None) -> List[str]:
+    """
+    Writes one merged cProfile dump per stage.
+
+    Args:
+        directory (str, optional): Target directory. Defaults to the directory given to enable().
+
+    Returns:
+        List[str]: The written files.
+    """
+    directory = directory or _profile_dir
+    if directory is None:
+        return []
+    import pstats
+    with _lock:
+        by_stage: Dict[str, List[object]] = {}
+        for (name, _), profiler in _profiles.items():
+            by_stage.setdefault(name, []).append(profiler)
+    paths = []
+    for name, profilers in sorted(by_stage.items()):
+        stats = None
+        for profiler in profilers:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(profiler)
+                else:
+                    stats.add(profiler)
+            except TypeError:
+                # A profiler that never collected anything cannot be turned into stats.
+                continue
+        if stats is None:
+            continue
+        path = os.path.join(directory, f"{_metric_name(name)[len(METRIC_PREFIX) + 1:]}.prof")
+        stats.dump_stats(path)
+        paths.append(path)
+    logger.info(f"Wrote {len(paths)} stage profiles to {directory}.")
+    return paths
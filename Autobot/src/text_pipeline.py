@@ -0,0 +1,162 @@
+"""
+Module: text_pipeline.py
+Purpose: A reusable text normalization pipeline for keyword extraction.
+
+TextNormalizer lower-cases text, strips punctuation with a precomputed translation table, splits it
+into tokens, optionally reduces plurals to their singular form ("APIs" -> "api"), drops stopwords
+and short words, and emits n-grams ("machine learning", "rest api") over runs of non-stopword
+tokens. Results are memoized per text digest in a bounded LRU cache, so a job description or resume
+that appears many times in a batch is only tokenized once.
+"""
+
+import string
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import FrozenSet, Iterable, List, Tuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# The stopword list ATSEvaluator has always used.
+BASIC_STOPWORDS = frozenset({
+    'the', 'and', 'to', 'of', 'a', 'in', 'for', 'on', 'with', 'as', 'by',
+    'at', 'an', 'be', 'this', 'that', 'from', 'is', 'are', 'it', 'or', 'if',
+    'you', 'your', 'i', 'we', 'us', 'our'
+})
+
+# A broader list for n-gram extraction, where filler words would otherwise glue phrases together.
+ENGLISH_STOPWORDS = BASIC_STOPWORDS | frozenset({
+    'about', 'all', 'also', 'am', 'any', 'been', 'but', 'can', 'could', 'do', 'does', 'etc',
+    'has', 'have', 'he', 'her', 'his', 'how', 'into', 'its', 'may', 'more', 'most', 'must',
+    'no', 'not', 'other', 'over', 'own', 'plus', 'should', 'so', 'such', 'than', 'their',
+    'them', 'then', 'there', 'these', 'they', 'those', 'through', 'under', 'up', 'was',
+    'were', 'what', 'when', 'where', 'which', 'while', 'who', 'will', 'within', 'would',
+    'work', 'working', 'years', 'year', 'strong', 'ability', 'experience', 'including'
+})
+
+# Words that end in "s" but are not plurals, or whose singular is not used in practice.
+INVARIANT_WORDS = frozenset({
+    'aws', 'kubernetes', 'postgres', 'windows', 'analytics', 'statistics', 'economics',
+    'physics', 'mathematics', 'series', 'news', 'sales', 'devops', 'pandas', 'redis',
+    'express', 'sass', 'less', 'ios', 'macos', 'gis', 'jenkins', 'kafka', 'js'
+})
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+
+def singularize(word: str) -> str:
+    """
+    Reduces a regular English plural to its singular form ("apis" -> "api", "technologies" -> "technology").
+    Words in INVARIANT_WORDS and words ending in -ss, -us, -is are left unchanged.
+    """
+    if len(word) <= 3 or word in INVARIANT_WORDS or not word.endswith('s'):
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith(('ss', 'us', 'sis', 'xis')):
+        return word
+    return word[:-1]
+
+
+class TextNormalizer:
+    """
+    Turns text into keywords with configurable stopwords, n-grams and plural reduction.
+    """
+
+    def __init__(self, stopwords: Iterable[str] = BASIC_STOPWORDS, min_length: int = 3,
+                 ngram_range: Tuple[int, int] = (1, 1), singularize_plurals: bool = False,
+                 cache_size: int = 4096):
+        """
+        Args:
+            stopwords (Iterable[str]): Words to drop. N-grams never span a stopword.
+            min_length (int): Minimum length of a single-word keyword.
+            ngram_range (Tuple[int, int]): Smallest and largest n-gram size to emit.
+            singularize_plurals (bool): Reduce plural words to their singular form.
+            cache_size (int): Number of texts whose results are memoized (0 disables the cache).
+        """
+        self.stopwords = frozenset(stopwords)
+        self.min_length = min_length
+        self.ngram_range = ngram_range
+        self.singularize_plurals = singularize_plurals
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[bytes, Tuple[Tuple[str, ...], FrozenSet[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clean(self, text: str) -> List[str]:
+        """
+        Lower-cases text, removes punctuation and splits it into words.
+        """
+        return text.lower().translate(_PUNCTUATION_TABLE).split()
+
+    def _analyze(self, text: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Returns every keyword occurrence in order, and the set of distinct keywords.
+        """
+        words = self.clean(text)
+        if self.singularize_plurals:
+            words = [singularize(word) for word in words]
+        min_n, max_n = self.ngram_range
+        stopwords = self.stopwords
+        terms = []
+        if min_n <= 1:
+            terms.extend(word for word in words if word not in stopwords and len(word) >= self.min_length)
+        if max_n >= 2:
+            run: List[str] = []
+            for word in words + [None]:
+                if word is not None and word not in stopwords:
+                    run.append(word)
+                    continue
+                for n in range(max(min_n, 2), max_n + 1):
+                    terms.extend(" ".join(run[i:i + n]) for i in range(len(run) - n + 1))
+                run = []
+        return tuple(terms), frozenset(terms)
+
+    def _lookup(self, text: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Returns the memoized analysis of text, computing it on a miss.
+        """
+        if self.cache_size <= 0:
+            return self._analyze(text)
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+        result = self._analyze(text)
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def terms(self, text: str) -> Tuple[str, ...]:
+        """
+        Returns every keyword occurrence in text, in order and with repeats (for term frequencies).
+        """
+        return self._lookup(text)[0]
+
+    def keywords(self, text: str) -> FrozenSet[str]:
+        """
+        Returns the distinct keywords of text.
+        """
+        return self._lookup(text)[1]
+
+    def clear_cache(self) -> None:
+        """
+        Empties the memoization cache and resets its counters.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+# Normalizer reproducing ATSEvaluator's original single-word keywords. Shared so that repeated
+# texts are tokenized once per process.
+DEFAULT_NORMALIZER = TextNormalizer()
@@ -0,0 +1,489 @@
+"""
+Module: watch.py
+Purpose: Watch mode: keeps the scores of a folder of resumes against a set of saved job descriptions
+         up to date while the files are edited.
+
+The first pass scores every pair, like batch_rank. After that only the documents that changed are
+read again. A changed resume is re-extracted and tokenized, its keyword set is diffed against the
+previous version, and only the jobs that mention an added or removed keyword are re-scored; the
+score of every other pair cannot have changed. A changed job description re-scores its own column.
+Added and deleted files add and remove their rows and columns.
+
+Changes are detected with inotify (through ctypes, so no extra package is needed). Where inotify
+is not available, e.g. on macOS or on some network filesystems, the folders are polled for
+modification times and sizes instead. Bursts of events, such as an editor's save, are collected
+for a short debounce delay and handled together.
+
+Every updated pair is printed as one JSON line; a pair that disappeared has "removed": true.
+
+Usage:
+    python -m src.watch data/ jobs/ [--poll] [--interval 1.0] [--skills] [--idf stats.json.gz]
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import select
+import struct
+import logging
+import argparse
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from src.ats_evaluator import ATSEvaluator
+from src.ats_interface import read_resume_text
+from src.corpus_stats import CorpusStats, load_corpus_stats
+from src.batch_rank import JOB_EXTENSIONS, RESUME_EXTENSIONS, read_job_file, iter_files, iter_jobs
+from src.skill_matcher import DEFAULT_TAXONOMY_PATH, SkillMatcher, load_skill_matcher
+from src.telemetry import count
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 0.2
+
+class Update(NamedTuple):
+    """
+    A changed pair of the score table; result is None when the pair was removed.
+    """
+    resume: str
+    job: str
+    result: Optional[dict]
+
+class ScoreTable:
+    """
+    The ATS scores of every (resume, job) pair, updated incrementally as keyword sets change.
+
+    Args:
+        corpus_stats (CorpusStats, optional): IDF statistics the scores are weighted with.
+    """
+
+    def __init__(self, corpus_stats: CorpusStats = None):
+        self.corpus_stats = corpus_stats
+        self.resumes: Dict[str, FrozenSet[str]] = {}
+        self.jobs: Dict[str, List[str]] = {}
+        self.scores: Dict[Tuple[str, str], dict] = {}
+        # keyword -> ids of the jobs whose criteria contain it
+        self._jobs_by_keyword: Dict[str, Set[str]] = {}
+
+    def _score(self, resume: str, job: str) -> Update:
+        result = ATSEvaluator.score_keywords(self.jobs[job], self.resumes[resume], self.corpus_stats)
+        self.scores[(resume, job)] = result
+        return Update(resume, job, result)
+
+    def set_resume(self, resume: str, keywords: Iterable[str]) -> List[Update]:
+        """
+        Adds or replaces a resume and re-scores the pairs its keyword changes can affect.
+        """
+        keywords = frozenset(keywords)
+        previous = self.resumes.get(resume)
+        self.resumes[resume] = keywords
+        if previous is None:
+            jobs = set(self.jobs)
+        else:
+            jobs = set()
+            for keyword in keywords ^ previous:
+                jobs.update(self._jobs_by_keyword.get(keyword, ()))
+        return [self._score(resume, job) for job in sorted(jobs)]
+
+    def remove_resume(self, resume: str) -> List[Update]:
+        if self.resumes.pop(resume, None) is None:
+            return []
+        return [Update(resume, job, None) for job in sorted(self.jobs) if self.scores.pop((resume, job), None)]
+
+    def set_job(self, job: str, keywords: Sequence[str]) -> List[Update]:
+        """
+        Adds or replaces a job description and re-scores its column if its keywords changed.
+        """
+        keywords = list(keywords)
+        previous = self.jobs.get(job)
+        if previous is not None and set(previous) == set(keywords):
+            return []
+        if previous is not None:
+            self._unindex(job, previous)
+        self.jobs[job] = keywords
+        for keyword in keywords:
+            self._jobs_by_keyword.setdefault(keyword, set()).add(job)
+        return [self._score(resume, job) for resume in sorted(self.resumes)]
+
+    def remove_job(self, job: str) -> List[Update]:
+        keywords = self.jobs.pop(job, None)
+        if keywords is None:
+            return []
+        self._unindex(job, keywords)
+        return [Update(resume, job, None) for resume in sorted(self.resumes) if self.scores.pop((resume, job), None)]
+
+    def _unindex(self, job: str, keywords: Sequence[str]) -> None:
+        for keyword in keywords:
+            jobs = self._jobs_by_keyword.get(keyword)
+            if jobs is not None:
+                jobs.discard(job)
+                if not jobs:
+                    del self._jobs_by_keyword[keyword]
+
+    def ranking(self, job: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the best (resume, score) pairs for a job.
+        """
+        ranked = [(resume, self.scores[(resume, job)]["ats_score"]) for resume in self.resumes if (resume, job) in self.scores]
+        return sorted(ranked, key=lambda item: (-item[1], item[0]))[:top_k]
+
+class IncrementalRanker:
+    """
+    Maps changed files to ScoreTable updates for one resume folder and one job source.
+
+    Args:
+        resume_folder (str): Folder with PDF or plain text resumes.
+        jobs_source (str): Job description folder, .jsonl file or single file (see batch_rank.iter_jobs).
+        use_cache (bool): Use the shared resume cache for PDFs.
+        skill_matcher (SkillMatcher, optional): Skill taxonomy matcher, as for ATSEvaluator.
+        corpus_stats (CorpusStats, optional): IDF statistics, as for ATSEvaluator.
+    """
+
+    def __init__(self, resume_folder: str, jobs_source: str, use_cache: bool = True,
+                 skill_matcher: SkillMatcher = None, corpus_stats: CorpusStats = None):
+        self.resume_folder = resume_folder
+        self.jobs_source = jobs_source
+        self.use_cache = use_cache
+        self.jobs_in_folder = os.path.isdir(jobs_source)
+        self.table = ScoreTable(corpus_stats)
+        self._tokenizer = ATSEvaluator("", "", skill_matcher=skill_matcher)
+
+    def _keywords(self, text: str) -> List[str]:
+        return self._tokenizer.extract_keywords(text or "")
+
+    def load(self) -> List[Update]:
+        """
+        Reads and scores every resume and job description.
+        """
+        updates = self._reload_jobs()
+        for path in iter_files(self.resume_folder, RESUME_EXTENSIONS):
+            updates.extend(self._update_resume(path))
+        logger.info(f"Scored {len(self.table.resumes)} resumes against {len(self.table.jobs)} jobs.")
+        return updates
+
+    def _update_resume(self, path: str) -> List[Update]:
+        if not os.path.exists(path):
+            return self.table.remove_resume(path)
+        try:
+            keywords = self._keywords(read_resume_text(path, self.use_cache))
+        except Exception as e:
+            # A half-written or broken file keeps its previous scores until it can be read again.
+            logger.error(f"Failed to read resume {path}: {e}")
+            return []
+        return self.table.set_resume(path, keywords)
+
+    def _reload_jobs(self) -> List[Update]:
+        try:
+            jobs = {job: self._keywords(text) for job, text in iter_jobs(self.jobs_source)}
+        except FileNotFoundError:
+            jobs = {}
+        except Exception as e:
+            logger.error(f"Failed to read job descriptions from {self.jobs_source}: {e}")
+            return []
+        updates = []
+        for job in sorted(set(self.table.jobs) - set(jobs)):
+            updates.extend(self.table.remove_job(job))
+        for job, keywords in jobs.items():
+            updates.extend(self.table.set_job(job, keywords))
+        return updates
+
+    def _update_job_file(self, path: str) -> List[Update]:
+        job = os.path.relpath(path, self.jobs_source)
+        if not os.path.exists(path):
+            return self.table.remove_job(job)
+        try:
+            keywords = self._keywords(read_job_file(path))
+        except Exception as e:
+            logger.error(f"Failed to read job description {path}: {e}")
+            return []
+        return self.table.set_job(job, keywords)
+
+    def refresh(self, paths: Iterable[str]) -> List[Update]:
+        """
+        Updates the table for changed, added or deleted files and directories.
+
+        Returns:
+            List[Update]: The pairs whose results changed, in the order they were updated.
+        """
+        updates = []
+        for path in sorted(set(paths)):
+            if not self.jobs_in_folder and os.path.abspath(path) == os.path.abspath(self.jobs_source):
+                updates.extend(self._reload_jobs())
+            elif self.jobs_in_folder and _is_within(path, self.jobs_source):
+                for file in self._affected(path, JOB_EXTENSIONS,
+                                           [os.path.join(self.jobs_source, job) for job in self.table.jobs]):
+                    updates.extend(self._update_job_file(file))
+            elif _is_within(path, self.resume_folder):
+                for file in self._affected(path, RESUME_EXTENSIONS, self.table.resumes):
+                    updates.extend(self._update_resume(file))
+        count("watch_rescored_pairs", len(updates))
+        return updates
+
+    @staticmethod
+    def _affected(path: str, extensions: Sequence[str], known: Iterable[str]) -> List[str]:
+        # A directory that appeared or disappeared stands for every file below it.
+        if os.path.isdir(path):
+            return list(iter_files(path, extensions))
+        if os.path.exists(path):
+            return [path] if path.lower().endswith(tuple(extensions)) else []
+        prefix = os.path.join(path, "")
+        return [file for file in known if file == path or file.startswith(prefix)]
+
+def _is_within(path: str, folder: str) -> bool:
+    path, folder = os.path.abspath(path), os.path.abspath(folder)
+    return path == folder or path.startswith(os.path.join(folder, ""))
+
+class PollingWatcher:
+    """
+    Detects changed files by comparing modification times and sizes between scans.
+    """
+
+    def __init__(self, paths: Sequence[str], interval: float = DEFAULT_INTERVAL):
+        self.paths = list(paths)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.paths:
+            files = [root] if os.path.isfile(root) else (
+                os.path.join(directory, name) for directory, _, names in os.walk(root) for name in names)
+            for path in files:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: float = None) -> Set[str]:
+        """
+        Waits for timeout seconds (the interval by default) and returns the files that changed since the last call.
+        """
+        time.sleep(self.interval if timeout is None else timeout)
+        snapshot = self._scan()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+class InotifyWatcher:
+    """
+    Detects changed files with Linux inotify, watching every directory below the given paths.
+    A watched file is watched through its directory, so it is still seen when an editor replaces it.
+    """
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, paths: Sequence[str]):
+        import ctypes
+        import ctypes.util
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._ctypes = ctypes
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._directories: Dict[int, str] = {}
+        # Watched single files, by their directory; None means the whole directory is of interest.
+        self._files: Dict[str, Optional[Set[str]]] = {}
+        try:
+            for path in paths:
+                if os.path.isdir(path):
+                    self._watch_tree(path)
+                else:
+                    directory = os.path.dirname(path) or "."
+                    if directory not in self._files:
+                        self._add_watch(directory)
+                        self._files[directory] = set()
+                    if self._files[directory] is not None:
+                        self._files[directory].add(os.path.basename(path))
+        except Exception:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            error = self._ctypes.get_errno()
+            raise OSError(error, f"inotify_add_watch({directory}): {os.strerror(error)}")
+        self._directories[wd] = directory
+
+    def _watch_tree(self, root: str) -> None:
+        for directory, _, _ in os.walk(root):
+            if self._files.get(directory, ()) is not None:
+                self._add_watch(directory)
+                self._files[directory] = None
+
+    def _all_files(self) -> Set[str]:
+        files = set()
+        for directory, names in self._files.items():
+            if names is None:
+                try:
+                    files.update(os.path.join(directory, name) for name in os.listdir(directory))
+                except OSError:
+                    files.add(directory)
+            else:
+                files.update(os.path.join(directory, name) for name in names)
+        return files
+
+    def poll(self, timeout: float = None) -> Set[str]:
+        """
+        Waits up to timeout seconds (forever when None) for events and returns the paths they concern.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            if not chunk:
+                break
+            data += chunk
+        changed = set()
+        offset = 0
+        while offset + self.EVENT.size <= len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            raw_name = data[offset + self.EVENT.size:offset + self.EVENT.size + length]
+            offset += self.EVENT.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped: report everything so the caller re-reads it.
+                logger.warning("inotify queue overflowed; re-reading all watched files.")
+                changed.update(self._all_files())
+                continue
+            if mask & self.IN_IGNORED:
+                self._directories.pop(wd, None)
+                continue
+            directory = self._directories.get(wd)
+            if directory is None:
+                continue
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+            names = self._files.get(directory)
+            if names is not None and name not in names:
+                continue
+            path = os.path.join(directory, name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._watch_tree(path)
+                changed.add(path)
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO | self.IN_DELETE):
+                # IN_CREATE alone is skipped for files: the content follows with IN_CLOSE_WRITE.
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+def open_watcher(paths: Sequence[str], interval: float = DEFAULT_INTERVAL, polling: bool = False):
+    """
+    Returns an InotifyWatcher, or a PollingWatcher when polling is requested or inotify is not available.
+    """
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify is not available ({e}); polling every {interval} s instead.")
+    return PollingWatcher(paths, interval)
+
+def watch(ranker: IncrementalRanker, on_update: Callable[[List[Update]], None], watcher=None,
+          stop: threading.Event = None, debounce: float = DEFAULT_DEBOUNCE, interval: float = DEFAULT_INTERVAL) -> None:
+    """
+    Scores everything once, then keeps the table up to date until stop is set.
+
+    Args:
+        ranker (IncrementalRanker): The resume folder and job source to watch.
+        on_update (Callable): Called with the updated pairs after the first pass and after each change.
+        watcher (optional): An InotifyWatcher or PollingWatcher. Defaults to open_watcher().
+        stop (threading.Event, optional): Ends the loop when set. Runs until interrupted by default.
+        debounce (float): Seconds without new events before a burst of changes is handled.
+        interval (float): Seconds between checks of stop, and between scans when polling.
+    """
+    stop = stop or threading.Event()
+    own_watcher = watcher is None
+    watcher = watcher or open_watcher([ranker.resume_folder, ranker.jobs_source], interval)
+    try:
+        on_update(ranker.load())
+        while not stop.is_set():
+            changed = watcher.poll(interval)
+            if not changed:
+                continue
+            while True:
+                more = watcher.poll(debounce)
+                if not more:
+                    break
+                changed |= more
+            start = time.perf_counter()
+            updates = ranker.refresh(changed)
+            logger.info(f"{len(changed)} changed files: re-scored {len(updates)} pairs in "
+                        f"{(time.perf_counter() - start) * 1000:.1f} ms.")
+            if updates:
+                on_update(updates)
+    finally:
+        if own_watcher:
+            watcher.close()
+
+def print_updates(updates: List[Update]) -> None:
+    for update in updates:
+        record = {"resume": update.resume, "job": update.job}
+        record.update(update.result if update.result is not None else {"removed": True})
+        print(json.dumps(record))
+    sys.stdout.flush()
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command-line entry point: prints the score table, then every change to it, until interrupted.
+    """
+    arg_parser = argparse.ArgumentParser(description="Keep resume scores up to date while the files change.")
+    arg_parser.add_argument("resumes", help="Directory with PDF or plain text resumes.")
+    arg_parser.add_argument("jobs", help="Job description file, .jsonl file or directory.")
+    arg_parser.add_argument("--poll", action="store_true", help="Poll for changes instead of using inotify.")
+    arg_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between polls.")
+    arg_parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                            help="Seconds to wait for a burst of changes to end.")
+    arg_parser.add_argument("--no-cache", action="store_true", help="Do not use the resume cache.")
+    arg_parser.add_argument("--skills", nargs="?", const=DEFAULT_TAXONOMY_PATH, metavar="TAXONOMY",
+                            help="Count skill synonyms as one keyword, from a taxonomy JSON file (the shipped one by default).")
+    arg_parser.add_argument("--idf", metavar="STATS_FILE",
+                            help="Weight keywords by their IDF in a job description statistics file (see src.corpus_stats).")
+    args = arg_parser.parse_args(argv)
+
+    ranker = IncrementalRanker(args.resumes, args.jobs, use_cache=not args.no_cache,
+                               skill_matcher=load_skill_matcher(args.skills) if args.skills else None,
+                               corpus_stats=load_corpus_stats(args.idf) if args.idf else None)
+    watcher = open_watcher([args.resumes, args.jobs], args.interval, polling=args.poll)
+    try:
+        watch(ranker, print_updates, watcher, debounce=args.debounce, interval=args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,193 @@
 import sys
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Add the project root directory to the sys.path so that 'src' can be found.
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
+
+import pytest
+from benchmarks.corpus import build_pdf
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """
+    Returns a factory that writes a PDF with the given pages (lists of text lines) to tmp_path.
+    """
+    def factory(name, pages):
+        path = tmp_path / name
+        path.write_bytes(build_pdf(pages))
+        return str(path)
+    return factory
+
+class StubServer:
+    """
+    A local HTTP/1.1 server whose responses come from a handler function.
+
+    The handler receives the request (method, path, headers, body) and returns a (status, headers,
+    body) tuple. Every request is recorded in .requests, with the client port in "port".
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = {"method": self.command, "path": self.path, "headers": dict(self.headers),
+                           "body": self.rfile.read(length), "port": self.client_address[1]}
+                stub.requests.append(request)
+                status, headers, body = stub.handler(request)
+                body = body.encode() if isinstance(body, str) else body
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_HEAD = _serve
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stub_server():
+    """
+    Returns a factory starting StubServers that are shut down after the test.
+    """
+    servers = []
+    def factory(handler):
+        server = StubServer(handler)
+        servers.append(server)
+        return server
+    yield factory
+    for server in servers:
+        server.close()
+
+class FakeElement:
+    def __init__(self, driver, element):
+        self.driver = driver
+        self.element = element
+
+    def send_keys(self, value):
+        self.driver.calls += 1
+        self.driver.set_value(self.element, self.driver.values.get(FakeDriver.field_name(self.element), "") + value)
+
+class FakeDriver:
+    """
+    A minimal WebDriver stand-in that loads real HTML forms over HTTP and records submissions.
+
+    execute_script() and execute_async_script() emulate the scripts of src.form_profiles on the
+    parsed page. Submitting a <form> behaves like a real form post: the page navigates to
+    confirmation_page, unloading the script before it can call back. Asynchronous scripts that
+    would outlive the script timeout (30 s by default, as in WebDriver) time out. Every call that
+    would be a WebDriver round trip is counted in .calls.
+    """
+    def __init__(self, submissions=None, crash_urls=(),
+                 confirmation_page='<div class="application-confirmation">Thank you for applying.</div>'):
+        self.submissions = [] if submissions is None else submissions
+        self.crash_urls = crash_urls
+        self.confirmation_page = confirmation_page
+        self.script_timeout = 30
+        self.current_url = None
+        self.soup = None
+        self.values = {}
+        self.calls = 0
+        self.quit_called = False
+
+    @staticmethod
+    def field_name(element):
+        return element.get("id") or element.get("name")
+
+    def set_value(self, element, value):
+        self.values[self.field_name(element)] = value
+
+    @staticmethod
+    def fillable(element):
+        return element.name in ("textarea", "select") or \
+            (element.name == "input" and element.get("type", "text").lower() != "file")
+
+    def get(self, url):
+        import requests
+        from bs4 import BeautifulSoup
+        from selenium.common.exceptions import WebDriverException
+        self.calls += 1
+        if url in self.crash_urls:
+            self.crash_urls.remove(url)
+            raise WebDriverException("chrome not reachable")
+        self.soup = BeautifulSoup(requests.get(url, timeout=5).text, "html.parser")
+        self.current_url, self.values = url, {}
+
+    def set_script_timeout(self, seconds):
+        self.calls += 1
+        self.script_timeout = seconds
+
+    def execute_script(self, script, *args):
+        from src.form_profiles import FILL_SCRIPT
+        self.calls += 1
+        if script == FILL_SCRIPT:
+            skipped = []
+            for selector, value in args[0]:
+                element = self.soup.select_one(selector)
+                if element is None:
+                    skipped.append([selector, "not found"])
+                elif not self.fillable(element):
+                    skipped.append([selector, f"cannot be filled ({element.name})"])
+                else:
+                    self.set_value(element, value)
+            return skipped
+        raise NotImplementedError(script)
+
+    def execute_async_script(self, script, *args):
+        from bs4 import BeautifulSoup
+        from selenium.common.exceptions import JavascriptException, TimeoutException
+        from src.form_profiles import READY_SCRIPT, SUBMIT_SCRIPT
+        self.calls += 1
+        if args[-1] > self.script_timeout * 1000:
+            raise TimeoutException("script timeout")
+        if script == READY_SCRIPT:
+            return not args[0] or self.soup.select_one(args[0]) is not None
+        if script == SUBMIT_SCRIPT:
+            button = self.soup.select_one(args[0])
+            if button is None:
+                return "missing"
+            self.submissions.append((self.current_url, dict(self.values)))
+            if button.find_parent("form") is not None:
+                self.soup, self.values = BeautifulSoup(self.confirmation_page, "html.parser"), {}
+                raise JavascriptException("javascript error: document unloaded while waiting for result")
+            return "confirmed" if args[1] and self.soup.select_one(args[1]) else "timeout"
+        raise NotImplementedError(script)
+
+    def find_element(self, by, selector):
+        from selenium.common.exceptions import NoSuchElementException
+        self.calls += 1
+        element = self.soup.select_one(selector)
+        if element is None:
+            raise NoSuchElementException(selector)
+        return FakeElement(self, element)
+
+    def quit(self):
+        self.quit_called = True
+
+@pytest.fixture
+def fake_driver():
+    """
+    Returns the FakeDriver class; call it with (submissions, crash_urls) to make a driver.
+    """
+    return FakeDriver
@@ -14,3 +14,21 @@ def test_ats_evaluator():
     assert "keywords_missing" in result
     # Check that ATS score is computed (score > 0 if keywords match)
     assert result["ats_score"] > 0
+
+def test_evaluate_matrix_matches_evaluate():
+    resumes = [
+        "John Doe, experienced Python developer with Django and REST API skills.",
+        "Jane Roe, Java and Spring engineer. Some Python scripting.",
+        "",
+    ]
+    criteria = [
+        "Basic qualifications: Python, Django, REST API, and strong problem solving.",
+        "Requirements: Java, Spring, Kubernetes.",
+        "the and of",
+    ]
+    matrix = ATSEvaluator.evaluate_matrix(resumes, criteria)
+    assert matrix.scores.shape == (3, 3)
+    for i, resume in enumerate(resumes):
+        for j, job in enumerate(criteria):
+            expected = ATSEvaluator(resume, job).evaluate()
+            assert matrix.result(i, j) == expected
@@ -0,0 +1,90 @@
+import io
+import csv
+import json
+from src.ats_evaluator import ATSEvaluator
+from src.batch_rank import RESUME_EXTENSIONS, iter_files, iter_jobs, main, rank
+from src.resume_parser import ResumeParser
+
+JOBS = {
+    "backend.txt": "Python engineer with Docker, Kubernetes and PostgreSQL experience.",
+    "frontend.txt": "React developer who knows TypeScript, CSS and accessibility.",
+    "data.txt": "Data scientist: Python, pandas, SQL and statistics.",
+}
+
+def write_inputs(tmp_path, make_pdf):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "alice.txt").write_text("Python, Docker and Kubernetes on PostgreSQL; some pandas and SQL.")
+    (resumes / "bob.txt").write_text("React and TypeScript developer, CSS expert.")
+    (resumes / "broken.pdf").write_bytes(b"not a pdf")
+    (resumes / "notes.doc").write_text("ignored")
+    make_pdf("resumes/carol.pdf", [["Carol", "Statistics, pandas and SQL"]])
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    for name, text in JOBS.items():
+        (jobs / name).write_text(text)
+    return str(resumes), str(jobs)
+
+def test_rank_streams_every_pair_with_evaluate_scores(tmp_path, make_pdf):
+    resumes, jobs = write_inputs(tmp_path, make_pdf)
+    output = io.StringIO()
+    pairs, failed = rank(iter_files(resumes, RESUME_EXTENSIONS), iter_jobs(jobs), output, workers=2,
+                         jobs_per_task=2, max_pending=2, queue_size=1)
+    assert (pairs, failed) == (9, 1)
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    errors = [record for record in records if "error" in record]
+    assert len(errors) == 1 and errors[0]["resume"].endswith("broken.pdf")
+    scores = {(record["resume"].rsplit("/", 1)[1], record["job"]): record for record in records if "error" not in record}
+    assert len(scores) == 9
+    for (resume, job), record in scores.items():
+        path = f"{resumes}/{resume}"
+        text = ResumeParser(path).extract_text() if resume.endswith(".pdf") else open(path).read()
+        expected = ATSEvaluator(text, JOBS[job]).evaluate()
+        assert record["ats_score"] == expected["ats_score"]
+        assert sorted(record["keywords_matched"]) == sorted(expected["keywords_matched"])
+        assert sorted(record["keywords_missing"]) == sorted(expected["keywords_missing"])
+    assert scores[("alice.txt", "backend.txt")]["ats_score"] > scores[("alice.txt", "frontend.txt")]["ats_score"]
+
+def test_workers_count_skill_synonyms_with_the_taxonomy(tmp_path):
+    from src.skill_matcher import DEFAULT_TAXONOMY_PATH
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "alice.txt").write_text("Ran k8s clusters.")
+    output = io.StringIO()
+    rank(iter_files(str(resumes), RESUME_EXTENSIONS), [("ops", "Kubernetes")], output, workers=1,
+         taxonomy_path=DEFAULT_TAXONOMY_PATH)
+    assert json.loads(output.getvalue())["keywords_matched"] == ["kubernetes"]
+
+def test_workers_weight_keywords_with_corpus_statistics(tmp_path):
+    from src.corpus_stats import CorpusStats
+    stats = CorpusStats()
+    for posting in ["Team player with Kubernetes.", "Team player, Python.", "Team player, Java."]:
+        stats.add_text(posting)
+    stats.save(str(tmp_path / "stats.json.gz"))
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "alice.txt").write_text("Kubernetes")
+    output = io.StringIO()
+    rank(iter_files(str(resumes), RESUME_EXTENSIONS), [("ops", "Team player, Kubernetes.")], output, workers=1,
+         stats_path=str(tmp_path / "stats.json.gz"))
+    expected = ATSEvaluator("Kubernetes", "Team player, Kubernetes.", corpus_stats=stats).evaluate()
+    unweighted = ATSEvaluator("Kubernetes", "Team player, Kubernetes.").evaluate()
+    assert json.loads(output.getvalue())["ats_score"] == expected["ats_score"] > unweighted["ats_score"]
+
+def test_jobs_can_come_from_a_jsonl_file(tmp_path):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text('{"id": "j1", "text": "Python"}\n\n{"text": "Go"}\n')
+    assert list(iter_jobs(str(jobs))) == [("j1", "Python"), ("3", "Go")]
+
+def test_cli_writes_csv(tmp_path, make_pdf):
+    resumes, jobs = write_inputs(tmp_path, make_pdf)
+    output = tmp_path / "scores.csv"
+    assert main([resumes, f"{jobs}/backend.txt", "--format", "csv", "--workers", "1", "--output", str(output)]) == 0
+    with open(output, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 4
+    alice = next(row for row in rows if row["resume"].endswith("alice.txt"))
+    assert alice["job"] == "backend.txt" and float(alice["ats_score"]) > 0
+    assert "docker" in alice["keywords_matched"].split(";")
+    assert next(row for row in rows if row["resume"].endswith("broken.pdf"))["error"]
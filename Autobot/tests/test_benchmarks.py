@@ -0,0 +1,52 @@
+import json
+import logging
+from benchmarks.harness import BenchResult, compare, load_baseline, percentile, run_case, save_baseline
+from benchmarks.suite import CASES, main, run_suite
+
+def result(p50_ms=1.0, peak_kb=100.0, name="case"):
+    return BenchResult(name, "small", 10, 0.1, p50_ms, p50_ms, p50_ms, 1000 / p50_ms, 1.0, peak_kb)
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 51 and percentile(values, 99) == 100 and percentile([], 50) == 0.0
+
+def test_run_case_measures_latency_and_memory():
+    measured = run_case("alloc", "small", lambda n: bytearray(n), [256 * 1024] * 5, 5 * 256 * 1024, repeats=2)
+    assert measured.calls == 10 and measured.key == "alloc[small]"
+    assert 0 < measured.p50_ms <= measured.p95_ms <= measured.p99_ms
+    assert measured.peak_kb >= 256
+
+def test_compare_flags_slower_and_larger_cases():
+    baseline = {"case[small]": {"p50_ms": 1.0, "peak_kb": 100.0}}
+    assert compare([result(1.2, 110.0)], baseline) == []
+    regressions = compare([result(2.0, 1000.0)], baseline)
+    assert len(regressions) == 2 and "median latency" in regressions[0] and "peak memory" in regressions[1]
+    assert compare([result(2.0, name="new")], baseline) == []
+
+def test_baseline_round_trip_keeps_other_cases(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    assert load_baseline(path) == {}
+    save_baseline(path, [result(name="a")], {"b[small]": {"p50_ms": 1.0, "peak_kb": 1.0}})
+    assert set(load_baseline(path)) == {"a[small]", "b[small]"}
+
+def test_every_case_runs_on_a_small_corpus():
+    results = run_suite(tuple(CASES), ("small",), count=2, repeats=1)
+    assert [measured.key for measured in results] == [f"{name}[small]" for name in CASES]
+    assert all(measured.calls == 2 and measured.p50_ms > 0 for measured in results)
+
+def test_scoring_cases_do_not_measure_memoized_results():
+    from src.text_pipeline import DEFAULT_NORMALIZER
+    hits = DEFAULT_NORMALIZER.hits
+    run_suite(("ats_evaluate", "end_to_end"), ("small",), count=2, repeats=2)
+    assert DEFAULT_NORMALIZER.hits == hits
+
+def test_suite_fails_on_regression(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"resume_extract_text[small]": {"p50_ms": 0.001, "peak_kb": 0.1}}))
+    try:
+        code = main(["--cases", "resume_extract_text", "--sizes", "small", "--count", "2", "--repeats", "1",
+                     "--baseline", str(path)])
+    finally:
+        logging.disable(logging.NOTSET)
+    assert code == 1
+    assert "REGRESSION resume_extract_text[small]" in capsys.readouterr().err
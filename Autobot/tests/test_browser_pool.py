@@ -0,0 +1,97 @@
+import threading
+import pytest
+from selenium.common.exceptions import WebDriverException
+from src.job_automation import JobAutomation
+from src.browser_pool import BrowserPool
+from src.job_queue import JobQueue, PENDING
+
+FORM = """<html><body><form>
+<input id="name_input"><input id="email_input"><input id="resume_upload" type="file">
+<button id="submit_btn">Apply</button></form></body></html>"""
+
+@pytest.fixture
+def make_pool(fake_driver):
+    def factory(submissions, drivers, crash_urls=(), **options):
+        lock = threading.Lock()
+        def driver_factory():
+            driver = fake_driver(submissions, crash_urls)
+            with lock:
+                drivers.append(driver)
+            return driver
+        return BrowserPool(automation_factory=lambda: JobAutomation(driver_factory=driver_factory),
+                           setup_retry_delay=0, **options)
+    return factory
+
+def test_pool_applies_to_every_job_and_reuses_drivers(stub_server, make_pool):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, FORM))
+    submissions, drivers = [], []
+    pool = make_pool(submissions, drivers, workers=3, max_uses=100)
+    urls = [f"{server.url}/job/{i}" for i in range(12)]
+    results = pool.run(urls, {"name": "Ada", "email": "ada@example.com"}, "/tmp/resume.pdf")
+
+    assert sorted(result.job_url for result in results) == sorted(urls)
+    assert all(result.ok for result in results)
+    assert len(drivers) == 3 and all(driver.quit_called for driver in drivers)
+    assert sorted(url for url, _ in submissions) == sorted(urls)
+    assert submissions[0][1] == {"name_input": "Ada", "email_input": "ada@example.com", "resume_upload": "/tmp/resume.pdf"}
+
+def test_crashed_driver_is_restarted_and_job_retried(stub_server, make_pool):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, FORM))
+    crash_url = f"{server.url}/job/crash"
+    submissions, drivers = [], []
+    pool = make_pool(submissions, drivers, crash_urls={crash_url}, workers=1)
+    results = pool.run([crash_url, f"{server.url}/job/ok"], {"name": "Ada"}, "/tmp/resume.pdf")
+
+    by_url = {result.job_url: result for result in results}
+    assert by_url[crash_url].ok and by_url[crash_url].attempts == 2
+    assert pool.stats[0].restarts == 1 and len(drivers) == 2
+
+def test_drivers_are_recycled_after_max_uses(stub_server, make_pool):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, FORM))
+    submissions, drivers = [], []
+    pool = make_pool(submissions, drivers, workers=1, max_uses=2)
+    pool.run([f"{server.url}/job/{i}" for i in range(5)], {}, "/tmp/resume.pdf")
+    assert pool.stats[0].recycles == 2 and len(drivers) == 3
+
+def test_pool_without_any_browser_reports_failures(monkeypatch):
+    def broken_factory():
+        raise WebDriverException("cannot start chrome")
+    monkeypatch.setattr("src.browser_pool.time.sleep", lambda seconds: None)
+    pool = BrowserPool(workers=2, automation_factory=lambda: JobAutomation(driver_factory=broken_factory),
+                       setup_retry_delay=0)
+    results = pool.run(["http://example.com/a", "http://example.com/b"], {}, "/tmp/resume.pdf")
+    assert len(results) == 2 and not any(result.ok for result in results)
+
+def test_hooks_report_results_and_can_skip_applications(stub_server, make_pool):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, FORM))
+    submissions, drivers, reported = [], [], []
+    skipped = f"{server.url}/job/claimed-elsewhere"
+    pool = make_pool(submissions, drivers, workers=2,
+                     on_start=lambda application: application.job_url != skipped, on_result=reported.append)
+    results = pool.run([f"{server.url}/job/1", skipped, f"{server.url}/job/2"], {"name": "Ada"}, "/tmp/resume.pdf")
+    assert sorted(result.job_url for result in reported) == sorted(result.job_url for result in results)
+    assert skipped not in {url for url, _ in submissions} and len(results) == 2
+
+def test_queued_job_is_not_retried_once_a_try_started(stub_server, tmp_path, make_pool):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, FORM))
+    crash_url = f"{server.url}/job/crash"
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue([crash_url])
+    [job] = queue.claim((PENDING,), "w1")
+    submissions, drivers = [], []
+    # The first try fails after start(); the pool's retry must be refused by the queue.
+    pool = make_pool(submissions, drivers, crash_urls={crash_url}, workers=1,
+                     on_start=lambda application: queue.start(job.key, "w1"))
+    assert pool.run([crash_url], {"name": "Ada"}, "/tmp/resume.pdf") == []
+    assert submissions == [] and pool.stats[0].applications == 1
+
+def test_results_tell_whether_the_form_may_have_been_submitted(stub_server, make_pool):
+    no_button = "<form><input id='name_input'></form>"
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, no_button if "plain" in request["path"] else FORM))
+    crash_url = f"{server.url}/job/crash"
+    submissions, drivers = [], []
+    pool = make_pool(submissions, drivers, crash_urls={crash_url}, workers=1, max_attempts=1)
+    results = pool.run([f"{server.url}/job/plain", crash_url], {"name": "Ada"}, "/tmp/resume.pdf")
+    by_url = {result.job_url: result for result in results}
+    assert not by_url[f"{server.url}/job/plain"].ok and not by_url[f"{server.url}/job/plain"].may_have_submitted
+    assert not by_url[crash_url].ok and by_url[crash_url].may_have_submitted
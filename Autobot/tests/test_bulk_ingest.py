@@ -0,0 +1,26 @@
+import json
+from src.bulk_ingest import ingest, iter_pdf_paths, main
+from src.resume_parser import ResumeParser
+
+def test_ingest_splits_long_documents_and_isolates_failures(make_pdf, tmp_path):
+    short = make_pdf("short.pdf", [["Name: John Doe", "Email: john.doe@example.com"]])
+    long = make_pdf("long.pdf", [[f"Name: Jane Roe" if i == 0 else f"Page {i}"] for i in range(7)])
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    
+    results = {r.path: r for r in ingest(iter_pdf_paths(str(tmp_path)), workers=2, pages_per_task=3)}
+    assert set(results) == {short, long, str(broken)}
+    assert results[short].fields["name"] == "John Doe"
+    assert results[short].fields["email"] == "john.doe@example.com"
+    assert results[long].text == ResumeParser(long).extract_text()
+    assert results[long].pages == 7
+    assert results[long].fields["name"] == "Jane Roe"
+    assert not results[str(broken)].ok
+
+def test_cli_writes_jsonl(make_pdf, tmp_path):
+    make_pdf("a.pdf", [["Name: A"]])
+    output = tmp_path / "out.jsonl"
+    assert main([str(tmp_path), "--workers", "1", "--no-text", "--output", str(output)]) == 0
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records[0]["fields"]["name"] == "A"
+    assert "text" not in records[0]
@@ -0,0 +1,115 @@
+import os
+import sys
+import json
+import subprocess
+import pytest
+from src import main as cli
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+RESUME = "Jane Doe\nPython developer with Docker, Kubernetes and SQL experience.\n"
+JOB = "We need a Python engineer who knows Docker, Kubernetes, SQL and Terraform."
+
+@pytest.fixture
+def inputs(tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text(RESUME, encoding="utf-8")
+    other = tmp_path / "other.txt"
+    other.write_text("Jane Roe\nJava developer.\n", encoding="utf-8")
+    job = tmp_path / "job.txt"
+    job.write_text(JOB, encoding="utf-8")
+    return str(resume), str(other), str(job)
+
+def test_importing_the_cli_loads_no_heavy_dependencies():
+    code = ("import sys, src.main; "
+            "print(','.join(name for name in ('selenium', 'PyPDF2', 'requests', 'bs4', 'numpy') if name in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == ""
+
+def test_score_prints_json(inputs, capsys):
+    resume, _, job = inputs
+    assert cli.main(["score", "--resume", resume, "--job-file", job, "--json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert 0 <= result["ats_score"] <= 100
+    assert "docker" in [keyword.lower() for keyword in result["keywords_matched"]]
+
+def test_score_reads_the_job_text_from_a_flag(inputs, capsys):
+    resume, _, _ = inputs
+    assert cli.main(["score", "--resume", resume, "--job-text", JOB]) == 0
+    assert "ATS Score:" in capsys.readouterr().out
+
+def test_score_counts_skill_synonyms_with_the_taxonomy(tmp_path, capsys):
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Ran k8s clusters.", encoding="utf-8")
+    args = ["score", "--resume", str(resume), "--job-text", "Kubernetes", "--json"]
+    assert cli.main(args) == 0
+    assert json.loads(capsys.readouterr().out)["keywords_matched"] == []
+    assert cli.main(args + ["--skills"]) == 0
+    assert json.loads(capsys.readouterr().out)["keywords_matched"] == ["kubernetes"]
+
+def test_score_weights_keywords_with_corpus_statistics(tmp_path, capsys):
+    from src.ats_evaluator import ATSEvaluator
+    from src.corpus_stats import CorpusStats
+    stats = CorpusStats()
+    for posting in ["Team player with Kubernetes.", "Team player, Python.", "Team player, Java."]:
+        stats.add_text(posting)
+    stats_file = str(tmp_path / "stats.json.gz")
+    stats.save(stats_file)
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Kubernetes", encoding="utf-8")
+    assert cli.main(["score", "--resume", str(resume), "--job-text", "Team player, Kubernetes.", "--json",
+                     "--idf", stats_file]) == 0
+    expected = ATSEvaluator("Kubernetes", "Team player, Kubernetes.", corpus_stats=stats).evaluate()
+    unweighted = ATSEvaluator("Kubernetes", "Team player, Kubernetes.").evaluate()
+    assert json.loads(capsys.readouterr().out)["ats_score"] == expected["ats_score"] > unweighted["ats_score"]
+
+def test_compare_names_the_better_resume(inputs, capsys):
+    resume, other, job = inputs
+    assert cli.main(["compare", "--resume", resume, "--resume", other, "--job-file", job]) == 0
+    assert "Resume 1 has a better ATS match." in capsys.readouterr().out
+
+def test_compare_needs_two_resumes(inputs):
+    resume, _, job = inputs
+    with pytest.raises(SystemExit):
+        cli.main(["compare", "--resume", resume, "--job-file", job])
+
+def test_a_job_source_is_required(inputs):
+    resume, _, _ = inputs
+    with pytest.raises(SystemExit):
+        cli.main(["score", "--resume", resume])
+
+def test_apply_passes_the_flags_to_the_application_run(monkeypatch, tmp_path):
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text("# postings\nhttps://example.com/b\n\n", encoding="utf-8")
+    calls = []
+    monkeypatch.setattr(cli, "run_job_application", lambda *args, **kwargs: calls.append((args, kwargs)) or [])
+    assert cli.main(["apply", "--resume", "cv.pdf", "--url", "https://example.com/a", "--urls-file", str(urls_file),
+                     "--workers", "2"]) == 0
+    assert calls == [((["https://example.com/a", "https://example.com/b"], "cv.pdf", 2), {"headless": True})]
+
+def test_apply_run_only_touches_its_own_postings(monkeypatch, tmp_path, make_pdf):
+    from src.job_queue import JobQueue, APPLIED, PENDING
+    applied = []
+    class Automation:
+        def setup_browser(self):
+            pass
+        def quit_browser(self):
+            pass
+        def apply_for_job(self, url, resume_data, pdf_resume_path):
+            applied.append(url)
+    monkeypatch.setattr("src.job_queue.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("src.resume_cache.default_cache", lambda: None)
+    monkeypatch.setattr("src.job_automation.JobAutomation", lambda headless=True: Automation())
+    queue = JobQueue()
+    queue.enqueue(["https://example.com/stale", "https://example.com/held"])
+    queue.claim((PENDING,), "other-worker", keys=[queue.get("https://example.com/held").key])
+    resume = make_pdf("resume.pdf", [["Name: Ada Lovelace"]])
+
+    results = cli.run_job_application(["https://example.com/new", "https://example.com/held"], resume, workers=1)
+    assert applied == ["https://example.com/new"]
+    by_url = {result.job_url: result for result in results}
+    assert by_url["https://example.com/new"].ok
+    assert not by_url["https://example.com/held"].ok and "skipped" in by_url["https://example.com/held"].error
+    assert queue.get("https://example.com/stale").status == PENDING
+    assert queue.get("https://example.com/new").status == APPLIED
+    assert cli.run_job_application(["https://example.com/new"], resume, workers=1) == [] and len(applied) == 1
@@ -0,0 +1,56 @@
+from src.content_extractor import extract_main_content, estimate_tokens, truncate_to_budget
+from src.job_description_extractor import JobDescriptionExtractor
+
+JOB_PAGE = """
+<html><head><title>Jobs</title><script>var tracking = "x".repeat(1000);</script></head>
+<body>
+  <header><a href="/">Home</a> <a href="/jobs">Jobs</a> <a href="/about">About us</a></header>
+  <div id="cookie-banner">We use cookies to improve your experience. Accept all cookies?</div>
+  <div class="layout">
+    <div class="menu"><ul>{menu}</ul></div>
+    <div class="job-description">
+      <h1>Senior Backend Engineer</h1>
+      <p>We are looking for a backend engineer to design, build and run our payment services.</p>
+      <h3>Requirements</h3>
+      <ul>
+        <li>5+ years of experience with Python, Go or Java in production systems.</li>
+        <li>Hands-on experience with PostgreSQL, Kafka and Kubernetes.</li>
+      </ul>
+      <p>You will own services end to end, from design reviews to on-call, with a small team.</p>
+    </div>
+    <div class="similar-jobs"><h3>Similar jobs</h3><ul>{similar}</ul></div>
+  </div>
+  <footer>{footer}</footer>
+</body></html>
+""".format(
+    menu="".join(f'<li><a href="/c/{i}">Category number {i} with a long name</a></li>' for i in range(30)),
+    similar="".join(f'<li><a href="/j/{i}">Frontend Engineer, Berlin office, team {i}</a></li>' for i in range(20)),
+    footer="Copyright, imprint, privacy policy, terms of service, careers, press, investors. " * 5,
+)
+
+def test_keeps_the_posting_and_drops_boilerplate():
+    result = extract_main_content(JOB_PAGE)
+    assert result.text.startswith("Senior Backend Engineer")
+    assert "PostgreSQL, Kafka and Kubernetes" in result.text
+    assert "on-call" in result.text
+    for boilerplate in ("cookies", "Category number", "Frontend Engineer", "Copyright", "tracking"):
+        assert boilerplate not in result.text
+    assert "\n\n" not in result.text
+    assert result.tokens_saved > 3 * result.tokens
+
+def test_token_budget_cuts_at_a_line_boundary():
+    result = extract_main_content(JOB_PAGE, token_budget=30)
+    assert result.truncated and result.tokens <= 30
+    assert result.text.endswith("payment services.")
+
+def test_truncate_to_budget():
+    assert truncate_to_budget("short", 10) == "short"
+    assert truncate_to_budget("aaaa\nbbbb\ncccc", 2) == "aaaa"
+    assert estimate_tokens("x" * 9) == 3
+
+def test_extractor_main_content_stage():
+    extractor = JobDescriptionExtractor("http://example.com/job")
+    extractor.html = JOB_PAGE
+    extractor.extract_main_content()
+    assert extractor.text == extractor.content.text
+    assert "Senior Backend Engineer" in extractor.text
@@ -0,0 +1,68 @@
+from src.corpus_stats import CorpusStats, load_corpus_stats
+from src.ats_evaluator import ATSEvaluator
+
+POSTINGS = [
+    "Team player with Kubernetes experience.",
+    "Team player who knows Python.",
+    "Team player, Java and Spring.",
+    "Team player with good communication.",
+]
+
+def test_idf_weights_rare_keywords_higher(tmp_path):
+    stats = CorpusStats()
+    for posting in POSTINGS:
+        assert stats.add_text(posting)
+    assert not stats.add_text(POSTINGS[0])
+    assert stats.document_count == 4
+    assert stats.idf("kubernetes") > stats.idf("team")
+    
+    path = str(tmp_path / "stats.json.gz")
+    stats.save(path)
+    loaded = load_corpus_stats(path)
+    assert load_corpus_stats(path) is loaded
+    assert loaded.document_frequency == stats.document_frequency
+    assert not loaded.add_text(POSTINGS[1])
+
+def test_weighted_scoring_single_and_batch():
+    stats = CorpusStats()
+    for posting in POSTINGS:
+        stats.add_text(posting)
+    criteria = "Team player with Kubernetes."
+    plain = ATSEvaluator("Kubernetes operator", criteria).evaluate()
+    weighted = ATSEvaluator("Kubernetes operator", criteria, corpus_stats=stats).evaluate()
+    assert weighted["ats_score"] > plain["ats_score"]
+    assert weighted["keywords_matched"] == plain["keywords_matched"]
+    
+    resumes = ["Kubernetes operator", "Team player", ""]
+    matrix = ATSEvaluator.evaluate_matrix(resumes, [criteria, "nothing"], corpus_stats=stats)
+    for i, resume in enumerate(resumes):
+        for j, job in enumerate([criteria, "nothing"]):
+            expected = ATSEvaluator(resume, job, corpus_stats=stats).evaluate()
+            result = matrix.result(i, j)
+            assert result["ats_score"] == expected["ats_score"]
+            assert result["keywords_matched"] == expected["keywords_matched"]
+
+def test_only_recent_documents_are_remembered(tmp_path):
+    stats = CorpusStats(max_seen=2)
+    for posting in POSTINGS:
+        stats.add_text(posting)
+    assert len(stats.seen) == 2
+    path = str(tmp_path / "stats.json.gz")
+    stats.save(path)
+    loaded = CorpusStats.load(path, max_seen=1)
+    assert len(loaded.seen) == 1 and not loaded.add_text(POSTINGS[3])
+    assert loaded.add_text(POSTINGS[0]) and loaded.document_count == 5
+
+def test_weighted_batch_scores_equal_single_scores():
+    import random
+    rng = random.Random(3)
+    words = [f"skill{i}" for i in range(60)]
+    stats = CorpusStats()
+    for _ in range(40):
+        stats.add_document(rng.sample(words, 8))
+    resumes = [" ".join(rng.sample(words, rng.randint(0, 30))) for _ in range(30)]
+    jobs = [" ".join(rng.sample(words, rng.randint(1, 20))) for _ in range(30)]
+    matrix = ATSEvaluator.evaluate_matrix(resumes, jobs, corpus_stats=stats)
+    for i, resume in enumerate(resumes):
+        for j, job in enumerate(jobs):
+            assert matrix.result(i, j)["ats_score"] == ATSEvaluator(resume, job, corpus_stats=stats).evaluate()["ats_score"]
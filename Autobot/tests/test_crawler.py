@@ -0,0 +1,72 @@
+import gzip
+import time
+import threading
+from src.crawler import Crawler
+
+def test_crawl_follows_redirects_and_decodes_gzip(stub_server):
+    def handler(request):
+        if request["path"] == "/old":
+            return 301, {"Location": "/job"}, ""
+        if request["path"] == "/job":
+            assert "gzip" in request["headers"]["Accept-Encoding"]
+            return 200, {"Content-Type": "text/html; charset=utf-8", "Content-Encoding": "gzip"}, \
+                gzip.compress("<h1>Ingénieur</h1>".encode("utf-8"))
+        return 404, {}, "missing"
+    server = stub_server(handler)
+    results = {result.url: result for result in Crawler().run([f"{server.url}/old", f"{server.url}/none"])}
+
+    moved = results[f"{server.url}/old"]
+    assert moved.ok and moved.html == "<h1>Ingénieur</h1>" and moved.final_url == f"{server.url}/job"
+    missing = results[f"{server.url}/none"]
+    assert missing.status == 404 and not missing.ok and missing.html == ""
+
+def test_per_host_and_global_limits(stub_server):
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    def handler(request):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return 200, {}, "ok"
+    server = stub_server(handler)
+    urls = [f"{server.url}/{i}" for i in range(40)] + [f"{server.url}/0"]
+    results = Crawler(concurrency=16, per_host=3).run(iter(urls))
+    assert len(results) == 40 and all(result.ok for result in results)
+    assert active["peak"] <= 3
+
+def test_unreachable_host_is_reported():
+    result = Crawler(connect_timeout=0.5).run(["http://127.0.0.1:9/job"])[0]
+    assert result.status == 0 and result.error
+
+def test_many_hosts(stub_server):
+    servers = [stub_server(lambda request: (200, {}, "<p>" + "posting text " * 200 + "</p>")) for _ in range(4)]
+    urls = [f"{server.url}/{i}" for i in range(150) for server in servers]
+    results = Crawler(concurrency=32, per_host=8).run(urls)
+    assert len(results) == 600 and all(result.ok for result in results)
+
+def test_stream_yields_pages_before_the_crawl_ends(stub_server):
+    release = threading.Event()
+    def handler(request):
+        if request["path"] == "/slow":
+            release.wait(5)
+        return 200, {}, request["path"]
+    server = stub_server(handler)
+    stream = Crawler().stream([f"{server.url}/slow", f"{server.url}/fast"])
+    assert next(stream).html == "/fast"
+    release.set()
+    assert [result.html for result in stream] == ["/slow"]
+
+def test_stream_stops_when_the_consumer_does(stub_server):
+    server = stub_server(lambda request: (200, {}, "ok"))
+    requested = []
+    def urls():
+        for i in range(1000):
+            requested.append(i)
+            yield f"{server.url}/{i}"
+    stream = Crawler(concurrency=2, per_host=2).stream(urls(), buffer=1)
+    assert next(stream).ok
+    stream.close()
+    assert len(requested) < 1000
@@ -0,0 +1,51 @@
+import re
+from src.field_extractor import FieldExtractor, FieldSpec, DEFAULT_FIELD_SPECS
+
+SAMPLE = """Name: Jane Roe
+Email: jane.roe@example.com
+Phone: +1 555 987 6543
+Location: Berlin, Germany
+Skills: Python, SQL, Kubernetes
+Master of Science in Computer Science, RWTH Aachen
+Experience: Jan 2020 - Mar 2023 at Example GmbH, 04/2019 internship
+Portfolio: https://janeroe.dev and www.github.com/janeroe
+"""
+
+def test_extraction_matches_individual_searches():
+    extractor = FieldExtractor()
+    data = extractor.extract(SAMPLE)
+    for spec in DEFAULT_FIELD_SPECS:
+        if spec.multiple:
+            continue
+        flags = re.IGNORECASE if spec.ignore_case else 0
+        expected = re.search(spec.pattern, SAMPLE, flags).group(1).strip()
+        assert data[spec.name] == expected
+    assert data["links"] == ["https://janeroe.dev", "www.github.com/janeroe"]
+    assert data["dates"] == ["Jan 2020", "Mar 2023", "04/2019"]
+
+def test_requested_fields_and_custom_specs():
+    extractor = FieldExtractor([FieldSpec("github", r"github\.com/(\w+)"), FieldSpec("name", r"Name:\s*(.+)")])
+    assert extractor.extract(SAMPLE, ["github"]) == {"github": "janeroe"}
+    assert extractor.extract("nothing here") == {"github": "Not found", "name": "Not found"}
+    
+    found = extractor.scan("Name: Jane Roe", ["name"])
+    assert not extractor.is_settled(found, len("Name: Jane Roe"))
+    assert extractor.is_settled(found, len("Name: Jane Roe") + 1)
+
+def test_fields_on_one_line_do_not_hide_each_other():
+    text = "Name: John Doe   Email: john@x.com   Phone: +1 555 123\nSummary"
+    data = FieldExtractor().extract(text, ["name", "email", "phone"])
+    assert data["email"] == "john@x.com"
+    assert data["phone"] == "+1 555 123"
+    assert data["name"] == re.search(r"Name:\s*(.+)", text).group(1).strip()
+
+def test_fields_starting_at_the_same_position_are_all_found():
+    extractor = FieldExtractor([
+        FieldSpec("site", r"(www\.\w+\.\w+)"),
+        FieldSpec("urls", r"((?:https?://|www\.)[^\s,;]+)", multiple=True, first_chars="hw"),
+    ])
+    text = "see https://www.janeroe.dev/cv and www.example.org/about"
+    assert extractor.scan(text) == {
+        "site": [("www.janeroe.dev", text.index(".dev") + 4)],
+        "urls": [("https://www.janeroe.dev/cv", text.index(" and")), ("www.example.org/about", len(text))],
+    }
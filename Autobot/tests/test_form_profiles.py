@@ -0,0 +1,127 @@
+import shutil
+from urllib.parse import parse_qs
+import pytest
+from src.form_profiles import load_profiles, parse_profiles, profile_for, resolve_value
+from src.job_automation import ApplicationNotSubmitted, JobAutomation
+
+GREENHOUSE_FORM = """<html><body><div id="app"><form id="application-form">
+<input id="first_name"><input id="last_name"><input id="email"><input id="phone">
+<input type="file" id="resume_file"><button type="submit">Submit application</button>
+</form></div></body></html>"""
+
+def make_automation(driver, profiles=None):
+    automation = JobAutomation(driver_factory=lambda: driver, profiles=profiles)
+    automation.setup_browser()
+    return automation
+
+def test_profiles_are_chosen_by_host():
+    profiles = load_profiles()
+    assert profile_for("https://boards.greenhouse.io/acme/jobs/1", profiles).name == "greenhouse"
+    assert profile_for("https://jobs.lever.co/acme/123/apply", profiles).name == "lever"
+    assert profile_for("https://careers.example.com/apply", profiles).name == "default"
+    assert profile_for("https://notgreenhouse.io/jobs/1", profiles).name == "default"
+
+def test_first_and_last_name_come_from_name():
+    resume_data = {"name": "Ada King Lovelace", "phone": "Not found", "skills": ["python", "sql"]}
+    assert resolve_value(resume_data, "first_name") == "Ada"
+    assert resolve_value(resume_data, "last_name") == "King Lovelace"
+    assert resolve_value(resume_data, "phone") == ""
+    assert resolve_value(resume_data, "skills") == "python, sql"
+
+def test_form_is_filled_in_one_script_call(stub_server, fake_driver):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, GREENHOUSE_FORM))
+    profiles = load_profiles()
+    driver = fake_driver()
+    automation = make_automation(driver, profiles)
+    resume_data = {"name": "Ada Lovelace", "email": "ada@example.com", "phone": "555-0100"}
+    automation.apply_for_job(f"{server.url}/acme/jobs/1", resume_data, "/tmp/resume.pdf", profiles["greenhouse"])
+
+    assert driver.submissions == [(f"{server.url}/acme/jobs/1", {
+        "first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com", "phone": "555-0100",
+        "resume_file": "/tmp/resume.pdf"})]
+    # get, script timeout, ready wait, fill, file lookup, file upload, submit, confirmation wait.
+    assert driver.calls == 8
+
+def test_missing_fields_are_skipped(stub_server, caplog, fake_driver):
+    form = '<form><input id="email_input"><button id="submit_btn">Apply</button></form>'
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, form))
+    driver = fake_driver()
+    automation = make_automation(driver)
+    automation.apply_for_job(f"{server.url}/apply", {"name": "Ada", "email": "ada@example.com"}, "/tmp/resume.pdf")
+
+    assert driver.submissions == [(f"{server.url}/apply", {"email_input": "ada@example.com"})]
+    assert "Form field not found: #name_input" in caplog.text
+
+def test_missing_submit_button_does_not_submit(stub_server, fake_driver):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, "<form><input id='x'></form>"))
+    profiles = parse_profiles({"default": {"fields": [{"selector": "#x", "key": "email"}], "submit": "#go"}})
+    driver = fake_driver()
+    with pytest.raises(ApplicationNotSubmitted):
+        make_automation(driver, profiles).apply_for_job(server.url, {"email": "ada@example.com"}, "/tmp/resume.pdf")
+    assert driver.submissions == [] and driver.values == {"x": "ada@example.com"}
+
+def test_fields_that_take_no_text_are_skipped(stub_server, caplog, fake_driver):
+    form = '<form><div id="name_input"></div><input id="email_input"><button id="submit_btn">Apply</button></form>'
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, form))
+    driver = fake_driver()
+    make_automation(driver).apply_for_job(f"{server.url}/apply", {"name": "Ada", "email": "ada@example.com"},
+                                          "/tmp/resume.pdf")
+    assert driver.submissions == [(f"{server.url}/apply", {"email_input": "ada@example.com"})]
+    assert "Form field cannot be filled (div): #name_input" in caplog.text
+
+def test_submission_is_awaited_by_its_confirmation(stub_server, caplog, fake_driver):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, GREENHOUSE_FORM))
+    profiles = load_profiles()
+    driver = fake_driver(confirmation_page="<p>Something went wrong</p>")
+    automation = make_automation(driver, profiles)
+    automation.apply_for_job(f"{server.url}/acme/jobs/1", {"email": "ada@example.com"}, "/tmp/resume.pdf",
+                             profiles["greenhouse"])
+    assert len(driver.submissions) == 1
+    assert f"No submission confirmation for {server.url}/acme/jobs/1" in caplog.text
+
+def test_waits_longer_than_the_default_script_timeout(stub_server, fake_driver):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"}, GREENHOUSE_FORM))
+    driver = fake_driver()
+    automation = JobAutomation(driver_factory=lambda: driver, ready_timeout=45)
+    automation.setup_browser()
+    automation.navigate_to_url(server.url, "#application-form")
+    assert driver.script_timeout >= 45
+
+@pytest.fixture
+def chrome():
+    """
+    A headless Chrome driver; the test is skipped when no browser is available.
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    if not any(shutil.which(name) for name in ("chromedriver", "google-chrome", "chromium", "chromium-browser")):
+        pytest.skip("Chrome is not installed")
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    try:
+        driver = webdriver.Chrome(options=options)
+    except WebDriverException as e:
+        pytest.skip(f"Chrome cannot be started: {e}")
+    yield driver
+    driver.quit()
+
+def test_scripts_fill_and_submit_a_real_form(stub_server, chrome, caplog):
+    form = """<html><body><form action="/submitted" method="post">
+    <input name="name" id="name"><textarea name="summary" id="summary"></textarea>
+    <select name="country" id="country"><option value="">-</option><option value="UK">UK</option></select>
+    <div id="note"></div><button id="go">Apply</button></form></body></html>"""
+    thanks = '<html><body><div class="application-confirmation">Thanks</div></body></html>'
+    server = stub_server(lambda request: (200, {"Content-Type": "text/html"},
+                                          thanks if request["method"] == "POST" else form))
+    profiles = parse_profiles({"default": {
+        "fields": [{"selector": "#name", "key": "name"}, {"selector": "#summary", "key": "summary"},
+                   {"selector": "#country", "key": "country"}, {"selector": "#note", "key": "name"}],
+        "ready": "form", "submit": "#go", "confirmation": ".application-confirmation"}})
+    automation = JobAutomation(driver_factory=lambda: chrome, profiles=profiles, ready_timeout=5)
+    automation.setup_browser()
+    automation.apply_for_job(f"{server.url}/apply", {"name": "Ada", "summary": "Maths", "country": "UK"}, "")
+
+    [post] = [request for request in server.requests if request["method"] == "POST"]
+    assert parse_qs(post["body"].decode()) == {"name": ["Ada"], "summary": ["Maths"], "country": ["UK"]}
+    assert "Form field cannot be filled (div): #note" in caplog.text
+    assert "No submission confirmation" not in caplog.text
@@ -0,0 +1,36 @@
+import random
+import pytest
+from benchmarks.bench_html_text import synthetic_page
+from src.html_text import html_to_text, soup_text, stream_text, stream_text_chunks
+from src.job_description_extractor import JobDescriptionExtractor
+
+EDGE_CASES = [
+    "<html><body><h1>Job Description</h1><p>Basic qualifications: Python, Django.</p></body></html>",
+    "a &amp; b &copy c &#169; &#x41; &bogus; &#128; <!-- c --> d<br/>e<pre>  \n  </pre><textarea>  </textarea>z",
+    "<!DOCTYPE html><p>x<script>if (a<b) {}</script>y<style>p{}</style></p><noscript><p>x</p></noscript>  \t ",
+    "<div>unclosed <b>bold <i>it</div> tail &lt;tag&gt; &nbsp; end",
+]
+
+@pytest.mark.parametrize("markup", EDGE_CASES + [synthetic_page(random.Random(seed)) for seed in range(3)])
+def test_stream_backend_matches_beautifulsoup(markup):
+    assert stream_text(markup) == soup_text(markup)
+
+def test_dropped_elements_and_chunked_input():
+    markup = synthetic_page(random.Random(1))
+    text = stream_text(markup)
+    assert "window.d0" not in text and "margin" not in text and "Enable JavaScript" not in text
+    chunks = [markup[i:i + 97] for i in range(0, len(markup), 97)]
+    assert stream_text_chunks(chunks) == text
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        html_to_text("<p>x</p>", backend="regex")
+
+def test_extract_text_backends_agree():
+    texts = []
+    for backend in ("stream", "bs4"):
+        extractor = JobDescriptionExtractor("http://example.com/job")
+        extractor.html = EDGE_CASES[0]
+        extractor.extract_text(backend=backend)
+        texts.append(extractor.text)
+    assert texts[0] == texts[1] and "Basic qualifications" in texts[0]
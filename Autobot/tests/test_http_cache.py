@@ -0,0 +1,92 @@
+import json
+import config.config
+from config.config import ModelConfig
+from src.http_cache import HTTPCache, freshness_lifetime
+from src.job_description_extractor import JobDescriptionExtractor
+
+PAGE = "<html><body><div class='job'><p>Backend engineer, Python, PostgreSQL and Kafka experience required.</p></div></body></html>"
+
+def revalidating_site(stub_server, page=PAGE, cache_control="no-cache"):
+    """
+    Serves one page with an ETag and answers matching conditional requests with 304.
+    """
+    state = {"body": page, "etag": '"v1"'}
+    def handler(request):
+        headers = {"ETag": state["etag"], "Cache-Control": cache_control, "Content-Type": "text/html"}
+        if request["headers"].get("If-None-Match") == state["etag"]:
+            return 304, headers, ""
+        return 200, headers, state["body"]
+    return stub_server(handler), state
+
+def test_conditional_get_reuses_the_stored_body(tmp_path, stub_server):
+    server, state = revalidating_site(stub_server)
+    cache = HTTPCache(str(tmp_path / "http.sqlite3"))
+    first = cache.fetch(f"{server.url}/job")
+    second = cache.fetch(f"{server.url}/job")
+    assert (first.status, first.from_cache) == (200, False)
+    assert (second.status, second.from_cache, second.html) == (304, True, PAGE)
+    assert server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+
+    state["body"], state["etag"] = "<p>changed</p>", '"v2"'
+    changed = cache.fetch(f"{server.url}/job")
+    assert (changed.status, changed.from_cache, changed.html) == (200, False, "<p>changed</p>")
+
+def test_fresh_pages_are_served_without_a_request(tmp_path, stub_server):
+    server, _ = revalidating_site(stub_server, cache_control="max-age=600")
+    cache = HTTPCache(str(tmp_path / "http.sqlite3"))
+    cache.fetch(server.url)
+    assert cache.fetch(server.url).from_cache
+    assert len(server.requests) == 1 and cache.fresh_hits == 1
+
+def test_no_store_is_not_cached(tmp_path, stub_server):
+    server, _ = revalidating_site(stub_server, cache_control="no-store")
+    cache = HTTPCache(str(tmp_path / "http.sqlite3"))
+    cache.fetch(server.url)
+    assert not cache.fetch(server.url).from_cache
+    assert "If-None-Match" not in server.requests[1]["headers"]
+
+def test_freshness_lifetime():
+    assert freshness_lifetime({"Cache-Control": "public, max-age=300"}) == 300
+    assert freshness_lifetime({"Cache-Control": "max-age=300, no-cache"}) == 0
+    assert freshness_lifetime({"Expires": "Thu, 01 Jan 1970 00:00:00 GMT"}) == 0
+    assert freshness_lifetime({}) == 0
+
+def test_unchanged_page_skips_parse_and_llm(tmp_path, monkeypatch, stub_server):
+    server, _ = revalidating_site(stub_server)
+    llm = stub_server(lambda request: (200, {}, json.dumps({"choices": [{"text": '{"Qualifications": "Python"}'}]})))
+    monkeypatch.setitem(config.config.MODEL_CONFIGS, "chatgpt", ModelConfig(name="HTTPCacheStub", api_url=llm.url, api_key="k"))
+    cache = HTTPCache(str(tmp_path / "http.sqlite3"))
+
+    def run():
+        extractor = JobDescriptionExtractor(f"{server.url}/job", model_type="chatgpt", http_cache=cache)
+        extractor.fetch_webpage()
+        extractor.extract_main_content()
+        return extractor, extractor.extract_key_job_details()
+
+    first, details = run()
+    assert details == {"Qualifications": "Python"} and first.text
+    second, cached = run()
+    assert cached == details
+    assert second.text == "" and second.content is None
+    assert len(llm.requests) == 1
+
+    results = JobDescriptionExtractor.extract_many([f"{server.url}/job"], model_type="chatgpt", http_cache=cache)
+    assert results == [details] and len(llm.requests) == 1
+
+def test_partial_job_details_are_not_cached(tmp_path, monkeypatch, stub_server):
+    server, _ = revalidating_site(stub_server)
+    llm = stub_server(lambda request: (200, {}, json.dumps({"choices": [{"text": '{"Qualifications": "Python", "Resp'}]})))
+    monkeypatch.setitem(config.config.MODEL_CONFIGS, "chatgpt", ModelConfig(name="HTTPCacheStub", api_url=llm.url, api_key="k"))
+    cache = HTTPCache(str(tmp_path / "http.sqlite3"))
+
+    def run():
+        extractor = JobDescriptionExtractor(f"{server.url}/job", model_type="chatgpt", http_cache=cache,
+                                            bypass_cache=True)
+        extractor.fetch_webpage()
+        extractor.extract_main_content()
+        return extractor.extract_key_job_details()
+
+    assert run() == {"Qualifications": "Python"}
+    assert run() == {"Qualifications": "Python"} and len(llm.requests) == 2
+    JobDescriptionExtractor.extract_many([f"{server.url}/job"], model_type="chatgpt", http_cache=cache, bypass_cache=True)
+    assert len(llm.requests) == 3
@@ -0,0 +1,78 @@
+import time
+import pytest
+import requests
+from src.http_transport import HTTPTransport, get_transport, transport_stats, close_transports
+
+def no_sleep(delays):
+    return delays.append
+
+def test_connections_are_kept_alive(stub_server):
+    server = stub_server(lambda request: (200, {}, "ok"))
+    transport = HTTPTransport("stub")
+    for _ in range(5):
+        assert transport.get(server.url).text == "ok"
+    assert len({request["port"] for request in server.requests}) == 1
+    assert transport.stats.requests == 5 and transport.stats.errors == 0
+
+def test_retry_after_is_honored_on_429(stub_server):
+    statuses = iter([429, 429, 200])
+    server = stub_server(lambda request: (next(statuses), {"Retry-After": "7"}, "body"))
+    delays = []
+    transport = HTTPTransport("stub", sleep=no_sleep(delays))
+    response = transport.post(server.url, json={"prompt": "x"})
+    assert response.status_code == 200
+    assert delays == [7.0, 7.0]
+    assert len(server.requests) == 3
+    assert transport.stats.retries == 2 and transport.stats.errors == 2
+
+def test_backoff_grows_and_gives_up(stub_server):
+    server = stub_server(lambda request: (503, {}, "unavailable"))
+    delays = []
+    transport = HTTPTransport("stub", max_retries=4, backoff_base=1.0, backoff_max=3.0, sleep=no_sleep(delays))
+    assert transport.get(server.url).status_code == 503
+    assert len(server.requests) == 5
+    assert all(0 <= delay <= cap for delay, cap in zip(delays, [1.0, 2.0, 3.0, 3.0]))
+
+def test_client_errors_are_not_retried(stub_server):
+    server = stub_server(lambda request: (400, {}, "bad request"))
+    transport = HTTPTransport("stub", sleep=no_sleep([]))
+    assert transport.get(server.url).status_code == 400
+    assert len(server.requests) == 1
+
+def test_read_timeout_is_retried_then_raised(stub_server):
+    def slow(request):
+        time.sleep(0.3)
+        return 200, {}, "late"
+    server = stub_server(slow)
+    transport = HTTPTransport("stub", read_timeout=0.05, max_retries=1, sleep=no_sleep([]))
+    with pytest.raises(requests.Timeout):
+        transport.get(server.url)
+    assert transport.stats.requests == 2 and transport.stats.errors == 2
+
+def test_registry_shares_transports_per_provider(stub_server):
+    server = stub_server(lambda request: (200, {}, "ok"))
+    try:
+        assert get_transport("ProviderA") is get_transport("ProviderA")
+        assert get_transport("ProviderA") is not get_transport("ProviderB")
+        get_transport("ProviderA").get(server.url)
+        stats = transport_stats()
+        assert stats["ProviderA"]["requests"] == 1
+        assert stats["ProviderB"]["requests"] == 0
+    finally:
+        close_transports()
+
+def test_post_is_not_retried_after_a_read_timeout(stub_server):
+    def slow(request):
+        time.sleep(0.3)
+        return 200, {}, "late"
+    server = stub_server(slow)
+    transport = HTTPTransport("stub", read_timeout=0.05, max_retries=2, sleep=no_sleep([]))
+    with pytest.raises(requests.Timeout):
+        transport.post(server.url, json={"prompt": "x"})
+    assert transport.stats.requests == 1 and transport.stats.retries == 0
+
+def test_post_is_retried_when_the_connection_is_refused():
+    transport = HTTPTransport("stub", max_retries=2, sleep=no_sleep([]))
+    with pytest.raises(requests.ConnectionError):
+        transport.post("http://127.0.0.1:9/complete", json={"prompt": "x"})
+    assert transport.stats.requests == 3 and transport.stats.retries == 2
@@ -0,0 +1,116 @@
+import time
+import multiprocessing
+from src.job_queue import (JobQueue, APPLIED, FAILED, FETCHED, PENDING, SCORED, idempotency_key,
+                           normalize_url)
+
+def test_urls_are_normalized_for_deduplication():
+    assert normalize_url("HTTPS://Jobs.Example.com/Job/42/?utm_source=x&b=2&a=1#apply") == \
+        "https://jobs.example.com/Job/42?a=1&b=2"
+    assert idempotency_key("https://example.com/job/1/") == idempotency_key("https://example.com/job/1?ref=feed")
+    assert idempotency_key("https://example.com/job/1") != idempotency_key("https://example.com/job/2")
+
+def test_enqueue_ignores_known_postings(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    assert queue.enqueue(["https://example.com/a", "https://example.com/a#x", "https://example.com/b"]) == 2
+    assert queue.enqueue(["https://example.com/b/", "https://example.com/c"]) == 1
+    assert len(queue) == 3 and queue.counts()[PENDING] == 3
+
+def test_steps_checkpoint_status_and_payload(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue(["https://example.com/a"])
+    [job] = queue.claim((PENDING,), "w1")
+    assert job.attempts == 1 and queue.claim((PENDING,), "w2") == []
+    assert queue.checkpoint(job.key, FETCHED, {"details": {"title": "Engineer"}}, "w1")
+
+    [job] = queue.claim((FETCHED,), "w1")
+    assert job.payload == {"details": {"title": "Engineer"}} and job.attempts == 1
+    assert not queue.checkpoint(job.key, SCORED, {"score": 0.8}, "intruder")
+    assert queue.checkpoint(job.key, SCORED, {"score": 0.8}, "w1")
+    job = queue.get("https://example.com/a")
+    assert job.status == SCORED and job.payload == {"details": {"title": "Engineer"}, "score": 0.8}
+
+def test_expired_lease_is_taken_over(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05)
+    queue.enqueue(["https://example.com/a"])
+    [job] = queue.claim((PENDING,), "crashed")
+    time.sleep(0.1)
+    [job] = queue.claim((PENDING,), "w2")
+    assert job.attempts == 2
+    assert not queue.checkpoint(job.key, FETCHED, worker="crashed")
+
+def test_started_step_is_not_repeated_after_a_crash(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05)
+    queue.enqueue(["https://example.com/a", "https://example.com/b"])
+    first, _ = queue.claim((PENDING,), "crashed")
+    assert queue.start(first.key, "crashed")
+    time.sleep(0.1)
+    [job] = queue.claim((PENDING,), "w2", at_most_once=True)
+    assert job.url == "https://example.com/b"
+    assert queue.get("https://example.com/a").status == FAILED
+
+def test_failures_are_retried_until_max_attempts(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"), max_attempts=2)
+    queue.enqueue(["https://example.com/a"])
+    [job] = queue.claim((PENDING,), "w1")
+    assert queue.fail(job.key, "timeout", "w1")
+    assert queue.get(job.url).status == PENDING
+    [job] = queue.claim((PENDING,), "w1")
+    assert queue.fail(job.key, "timeout", "w1")
+    job = queue.get(job.url)
+    assert job.status == FAILED and job.error == "timeout"
+    assert queue.claim((PENDING,), "w1") == []
+
+def claim_all(path, results):
+    queue = JobQueue(path)
+    claimed = []
+    while True:
+        jobs = queue.claim((PENDING,), limit=3)
+        if not jobs:
+            break
+        for job in jobs:
+            queue.checkpoint(job.key, APPLIED, {"by": multiprocessing.current_process().name})
+            claimed.append(job.key)
+    results.put(claimed)
+
+def test_processes_never_claim_the_same_posting(tmp_path):
+    path = str(tmp_path / "queue.sqlite3")
+    JobQueue(path).enqueue([f"https://example.com/job/{i}" for i in range(120)])
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    processes = [context.Process(target=claim_all, args=(path, results)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    claimed = [key for _ in processes for key in results.get(timeout=30)]
+    for process in processes:
+        process.join()
+    assert len(claimed) == len(set(claimed)) == 120
+    assert JobQueue(path).counts()[APPLIED] == 120
+
+def test_claims_can_be_limited_to_given_postings_and_start_only_once(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue(["https://example.com/stale", "https://example.com/a"])
+    assert queue.claim((PENDING,), "w1", keys=[]) == []
+    [job] = queue.claim((PENDING,), "w1", keys=[idempotency_key("https://example.com/a")])
+    assert job.url == "https://example.com/a"
+    assert queue.start(job.key, "w1")
+    assert not queue.start(job.key, "w1")
+    assert queue.get("https://example.com/stale").attempts == 0
+
+def test_failed_started_step_is_never_claimed_again(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue(["https://example.com/a"])
+    [job] = queue.claim((PENDING,), "w1", at_most_once=True)
+    assert queue.start(job.key, "w1")
+    assert queue.fail(job.key, "ScriptTimeout after submit", "w1")
+    assert queue.get(job.url).status == FAILED
+    assert queue.claim((PENDING, FAILED), "w2", at_most_once=True) == []
+
+def test_started_step_that_took_no_effect_can_be_retried(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue(["https://example.com/a"])
+    [job] = queue.claim((PENDING,), "w1", at_most_once=True)
+    assert queue.start(job.key, "w1")
+    assert queue.fail(job.key, "Submit button not found", "w1", took_effect=False)
+    assert queue.get(job.url).status == PENDING
+    [job] = queue.claim((PENDING,), "w2", at_most_once=True)
+    assert queue.start(job.key, "w2")
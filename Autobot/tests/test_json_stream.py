@@ -0,0 +1,55 @@
+import json
+import config.config
+from config.config import ModelConfig
+from src.json_stream import JSONObjectStream
+from src.llm_integration import LLMIntegration
+from src.job_description_extractor import JobDescriptionExtractor
+
+DETAILS = {"Job Requirements": ["Python", "SQL"], "Qualifications": {"degree": "BSc, CS", "years": 3},
+           "Responsibilities": "Build \"robust\" {services}", "Remote": True}
+
+def test_sections_are_emitted_as_soon_as_complete():
+    text = "```json\n" + json.dumps(DETAILS, indent=2) + "\n```"
+    parser = JSONObjectStream()
+    emitted_at = {}
+    for position, char in enumerate(text):
+        for key, value in parser.feed(char):
+            emitted_at[key] = position
+            assert value == DETAILS[key]
+    assert parser.complete and parser.close() == DETAILS
+    assert list(emitted_at) == list(DETAILS)
+    # Each section is available right after the separator that ends it.
+    assert text[emitted_at["Job Requirements"]] == ","
+
+def test_truncated_and_malformed_values_keep_the_rest():
+    parser = JSONObjectStream()
+    parser.feed('{"a": [1, 2], "b": nope, "c": "ok", "d": "cut off')
+    assert parser.close() == {"a": [1, 2], "c": "ok"}
+    assert parser.skipped == ["b"] and not parser.complete
+
+def sse_body(pieces, done=True):
+    events = [f"data: {json.dumps({'choices': [{'text': piece}]})}\n\n" for piece in pieces]
+    return "".join(events) + ("data: [DONE]\n\n" if done else "")
+
+def test_stream_text_decodes_server_sent_events(stub_server):
+    server = stub_server(lambda request: (200, {"Content-Type": "text/event-stream"}, sse_body(["Hel", "lo"])))
+    llm = LLMIntegration("chatgpt")
+    llm.model_config = ModelConfig(name="SSEStub", api_url=server.url, api_key="k")
+    assert list(llm.stream_text("Say hello")) == ["Hel", "lo"]
+    assert json.loads(server.requests[0]["body"])["stream"] is True
+
+def test_iter_key_job_details_survives_truncated_stream(monkeypatch, stub_server):
+    text = json.dumps(DETAILS)
+    pieces = [text[i:i + 7] for i in range(0, len(text) - 10, 7)]
+    server = stub_server(lambda request: (200, {"Content-Type": "text/event-stream"}, sse_body(pieces, done=False)))
+    monkeypatch.setitem(config.config.MODEL_CONFIGS, "chatgpt", ModelConfig(name="SSEStub", api_url=server.url, api_key="k"))
+
+    extractor = JobDescriptionExtractor("http://example.com/job", model_type="chatgpt")
+    extractor.text = "Python developer"
+    sections = list(extractor.iter_key_job_details())
+    assert [key for key, _ in sections] == ["Job Requirements", "Qualifications", "Responsibilities"]
+
+def test_invalid_json_response_keeps_intact_sections():
+    extractor = JobDescriptionExtractor("http://example.com/job")
+    assert extractor._parse_response('{"Qualifications": "BSc", "Responsibilities": "Code"}}x') == \
+        {"Qualifications": "BSc", "Responsibilities": "Code"}
@@ -0,0 +1,67 @@
+import json
+import time
+import asyncio
+import pytest
+import config.config
+from config.config import ModelConfig
+from src.llm_integration import LLMIntegration
+from src.rate_limiter import TokenBucket
+from src.job_description_extractor import JobDescriptionExtractor
+
+@pytest.fixture
+def slow_llm(stub_server):
+    """
+    A completion endpoint that takes 100 ms per request and echoes the prompt back.
+    """
+    def complete(request):
+        time.sleep(0.1)
+        prompt = json.loads(request["body"])["prompt"]
+        return 200, {"Content-Type": "application/json"}, json.dumps({"choices": [{"text": prompt}]})
+    return stub_server(complete)
+
+def make_llm(server, **config):
+    llm = LLMIntegration("chatgpt")
+    llm.model_config = ModelConfig(name=f"Batch{server.url}", api_url=server.url, api_key="test-key", **config)
+    return llm
+
+def test_generate_batch_runs_concurrently_in_order(slow_llm):
+    llm = make_llm(slow_llm)
+    prompts = [f"prompt {i}" for i in range(20)]
+    start = time.perf_counter()
+    assert llm.generate_batch(prompts, concurrency=10) == prompts
+    # 20 sequential calls would take at least 2 seconds.
+    assert time.perf_counter() - start < 1.0
+
+def test_generate_many_as_completed_yields_every_index(slow_llm):
+    llm = make_llm(slow_llm)
+
+    async def collect():
+        return [item async for item in llm.generate_many(["a", "b", "c"], concurrency=3, ordered=False)]
+
+    assert sorted(asyncio.run(collect())) == [(0, "a"), (1, "b"), (2, "c")]
+
+def test_rate_limit_spaces_out_requests(stub_server):
+    server = stub_server(lambda request: (200, {}, json.dumps({"choices": [{"text": "ok"}]})))
+    llm = make_llm(server, requests_per_second=20, burst=1)
+    start = time.perf_counter()
+    llm.generate_batch(["x"] * 6, concurrency=6)
+    # The first request uses the burst; the other five wait 50 ms each.
+    assert time.perf_counter() - start >= 0.24
+
+def test_token_bucket_reserves_in_order():
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+    assert TokenBucket(None).reserve() == 0.0
+
+def test_extract_many(monkeypatch, stub_server):
+    server = stub_server(lambda request: (200, {}, json.dumps({"choices": [{"text": '{"title": "Engineer"}'}]})))
+    monkeypatch.setitem(config.config.MODEL_CONFIGS, "chatgpt", ModelConfig(name="ExtractStub", api_url=server.url, api_key="k"))
+    pages = {"/a": (200, "<p>Python developer</p>"), "/b": (404, "gone")}
+    site = stub_server(lambda request: (pages[request["path"]][0], {"Content-Type": "text/html"}, pages[request["path"]][1]))
+
+    results = JobDescriptionExtractor.extract_many([f"{site.url}/a", f"{site.url}/b", f"{site.url}/a"], model_type="chatgpt")
+    assert results == [{"title": "Engineer"}, {}, {"title": "Engineer"}]
+    assert len(site.requests) == 2
@@ -0,0 +1,60 @@
+import json
+import pytest
+from config.config import ModelConfig
+from src.llm_cache import LLMCache
+from src.llm_integration import LLMIntegration
+
+@pytest.fixture
+def stub_llm(stub_server):
+    """
+    Serves a fake completion endpoint on localhost and records the payloads it receives.
+    """
+    requests_seen = []
+    def complete(request):
+        requests_seen.append(json.loads(request["body"]))
+        return 200, {"Content-Type": "application/json"}, json.dumps({"choices": [{"text": f"reply {len(requests_seen)}"}]})
+    server = stub_server(complete)
+    return f"{server.url}/v1/completions", requests_seen
+
+def make_llm(url, cache, bypass_cache=False):
+    llm = LLMIntegration("chatgpt", cache=cache, bypass_cache=bypass_cache)
+    llm.model_config = ModelConfig(name="Stub", api_url=url, api_key="test-key")
+    return llm
+
+def test_repeated_prompt_is_served_from_cache(tmp_path, stub_llm):
+    url, requests_seen = stub_llm
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"))
+    llm = make_llm(url, cache)
+
+    assert llm.generate_text("Summarize this posting", max_tokens=500) == "reply 1"
+    assert llm.generate_text("Summarize this posting", max_tokens=500) == "reply 1"
+    assert len(requests_seen) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # The cache persists across instances using the same file.
+    assert make_llm(url, LLMCache(str(tmp_path / "llm.sqlite3"))).generate_text("Summarize this posting", max_tokens=500) == "reply 1"
+    assert len(requests_seen) == 1
+
+def test_sampling_parameters_are_part_of_the_key(tmp_path, stub_llm):
+    url, requests_seen = stub_llm
+    llm = make_llm(url, LLMCache(str(tmp_path / "llm.sqlite3")))
+    llm.generate_text("Prompt", max_tokens=100)
+    llm.generate_text("Prompt", max_tokens=200)
+    llm.generate_text("Prompt", max_tokens=100, temperature=0.0)
+    assert len(requests_seen) == 3
+
+def test_bypass_refreshes_the_cached_response(tmp_path, stub_llm):
+    url, requests_seen = stub_llm
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"))
+    assert make_llm(url, cache).generate_text("Prompt") == "reply 1"
+    assert make_llm(url, cache, bypass_cache=True).generate_text("Prompt") == "reply 2"
+    assert make_llm(url, cache).generate_text("Prompt") == "reply 2"
+    assert len(requests_seen) == 2
+
+def test_expired_responses_are_refetched(tmp_path, stub_llm):
+    url, requests_seen = stub_llm
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"), ttl=-1)
+    llm = make_llm(url, cache)
+    llm.generate_text("Prompt")
+    llm.generate_text("Prompt")
+    assert len(requests_seen) == 2
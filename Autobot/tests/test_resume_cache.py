@@ -0,0 +1,107 @@
+from src.resume_cache import ResumeCache
+from src.resume_parser import ResumeParser
+from src.sqlite_cache import SQLiteCache
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+def fake_reader(calls):
+    class FakeReader:
+        def __init__(self, file):
+            calls.append(file.name)
+            self.pages = [FakePage("Name: John Doe\nEmail: john.doe@example.com\nPhone: +1 555 123 4567")]
+    return FakeReader
+
+def test_cached_text_and_fields_skip_pdf(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr("PyPDF2.PdfReader", fake_reader(calls))
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4 resume")
+    cache = ResumeCache(str(tmp_path / "cache.sqlite3"))
+    
+    first = ResumeParser(str(pdf), cache=cache)
+    text = first.extract_text()
+    fields = first.parse_text()
+    assert len(calls) == 1
+    
+    # A copy with the same content is a hit for both the text and the parsed fields.
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(pdf.read_bytes())
+    assert ResumeParser(str(copy), cache=cache).parse_text() == fields
+    assert ResumeParser(str(copy), cache=cache).extract_text() == text
+    assert len(calls) == 1
+    
+    cache.invalidate(str(pdf))
+    ResumeParser(str(pdf), cache=cache).extract_text()
+    assert len(calls) == 2
+
+def test_sqlite_cache_lru_eviction(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "lru.sqlite3"), max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234" and cache.get("c") == b"1234"
+    assert cache.size_bytes() <= 10
+    assert cache.hits == 3 and cache.misses == 1
+
+def test_sqlite_cache_keeps_a_running_total_and_evicts_to_the_low_water_mark(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "lru.sqlite3")
+    # A database written before the running total existed starts from the sum of its entries.
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+                 " created_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+    conn.execute("INSERT INTO entries VALUES ('old', x'00', 1, 0, 0)")
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path, max_bytes=100, low_water=0.5)
+    assert cache.size_bytes() == 1
+    for number in range(9):
+        cache.set(f"k{number}", b"x" * 10)
+    cache.set("k0", b"x" * 5)
+    cache.update("k1", lambda value: value + b"y")
+    assert cache.delete("k2")
+    assert cache.size_bytes() == 1 + 60 + 5 + 11
+
+    # Going over max_bytes evicts the least recently used entries down to half of it.
+    cache.set("big", b"x" * 30)
+    assert len(cache) == 3 and cache.size_bytes() == 5 + 11 + 30
+    assert all(cache.get(key) is not None for key in ["k0", "k1", "big"])
+    cache.clear()
+    assert cache.size_bytes() == 0 and len(cache) == 0
+
+def test_concurrent_updates_are_not_lost(tmp_path):
+    import threading
+    path = str(tmp_path / "cache.sqlite3")
+    def write(worker):
+        cache = ResumeCache(path)
+        for round_number in range(10):
+            cache.update("key", fields={f"field{worker}": round_number})
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ResumeCache(path).update("key", text="resume text")
+    assert ResumeCache(path).get("key") == {"text": "resume text", "fields": {f"field{worker}": 9 for worker in range(8)}}
+
+def test_parse_text_looks_the_entry_up_once(tmp_path, monkeypatch):
+    monkeypatch.setattr("PyPDF2.PdfReader", fake_reader([]))
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4 resume")
+    cache = ResumeCache(str(tmp_path / "cache.sqlite3"))
+    lookups = []
+    get = cache.get
+    monkeypatch.setattr(cache, "get", lambda key: lookups.append(key) or get(key))
+
+    fields = ResumeParser(str(pdf), cache=cache).parse_text(["name"])
+    assert len(lookups) == 1
+    ResumeParser(str(pdf), cache=cache).parse_text(["email"])
+    assert get(lookups[0])["fields"] == {**fields, "email": "john.doe@example.com"}
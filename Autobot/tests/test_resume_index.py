@@ -0,0 +1,43 @@
+from src.resume_index import ResumeIndex
+from src.resume_parser import ResumeParser
+
+def make_index():
+    index = ResumeIndex()
+    index.add_document("python.pdf", "Python developer with Django, Django REST framework and PostgreSQL.")
+    index.add_document("java.pdf", "Java engineer with Spring Boot and PostgreSQL experience.")
+    index.add_document("design.pdf", "Graphic designer skilled in Figma and Photoshop.")
+    return index
+
+def test_search_ranks_best_match_first():
+    index = make_index()
+    results = index.search("Looking for a Django and Python engineer", top_k=2)
+    assert [doc_id for doc_id, _ in results][0] == "python.pdf"
+    assert len(results) == 2
+    assert "design.pdf" not in [doc_id for doc_id, _ in results]
+
+def test_remove_and_persist(tmp_path):
+    index = make_index()
+    assert index.remove_document("python.pdf")
+    assert "python.pdf" not in index
+    assert "django" not in index.postings
+    
+    path = str(tmp_path / "index.json")
+    index.save(path)
+    loaded = ResumeIndex.load(path)
+    assert len(loaded) == 2
+    assert loaded.search("postgresql", top_k=5) == index.search("postgresql", top_k=5)
+
+def test_sync_directory(tmp_path, monkeypatch):
+    texts = {"a.pdf": "Kubernetes operator", "b.pdf": "Terraform modules"}
+    for name in texts:
+        (tmp_path / name).write_bytes(b"%PDF")
+    monkeypatch.setattr(ResumeParser, "extract_text", lambda self: texts[self.pdf_path.split("/")[-1]])
+    
+    index = ResumeIndex()
+    added, removed = index.sync_directory(str(tmp_path))
+    assert sorted(added) == ["a.pdf", "b.pdf"] and removed == []
+    assert index.sync_directory(str(tmp_path)) == ([], [])
+    
+    (tmp_path / "b.pdf").unlink()
+    assert index.sync_directory(str(tmp_path)) == ([], ["b.pdf"])
+    assert index.search("kubernetes")[0][0] == "a.pdf"
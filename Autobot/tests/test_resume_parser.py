@@ -18,3 +18,31 @@ def test_parse_text(monkeypatch):
     assert result.get("name") == "John Doe"
     assert result.get("email") == "john.doe@example.com"
     assert result.get("phone") == "+1 555 123 4567"
+
+def test_parse_text_stops_after_fields_found(make_pdf, monkeypatch):
+    pages = [["Name: Jane Roe", "Email: jane@example.com", "Phone: 555 1234", "Summary"]]
+    pages += [[f"Portfolio page {i}"] for i in range(20)]
+    pdf_path = make_pdf("long.pdf", pages)
+    
+    parser = ResumeParser(pdf_path)
+    read = []
+    original = parser.iter_pages
+    def counting_pages():
+        for page_text in original():
+            read.append(page_text)
+            yield page_text
+    monkeypatch.setattr(parser, "iter_pages", counting_pages)
+    
+    result = parser.parse_text()
+    assert result == {"name": "Jane Roe", "email": "jane@example.com", "phone": "555 1234"}
+    assert len(read) == 1
+    assert parser.text == ""
+
+def test_parse_text_reads_to_end_for_missing_fields(make_pdf):
+    pdf_path = make_pdf("resume.pdf", [["Name: Jane Roe"], ["Experience"], ["Phone: 555 1234"]])
+    parser = ResumeParser(pdf_path)
+    result = parser.parse_text()
+    assert result["phone"] == "555 1234"
+    assert result["email"] == "Not found"
+    assert parser.text == ResumeParser(pdf_path).extract_text()
+    assert parser.parse_text(["name"]) == {"name": "Jane Roe"}
@@ -0,0 +1,45 @@
+from src.skill_matcher import SkillMatcher, load_skill_matcher
+from src.ats_evaluator import ATSEvaluator
+
+TAXONOMY = {
+    "kubernetes": ["Kubernetes", "k8s"],
+    "postgresql": ["PostgreSQL", "postgres"],
+    "cpp": ["C++"],
+    "java": ["Java"],
+    "javascript": ["JavaScript"],
+    "machine_learning": ["machine learning", "ML"],
+}
+
+def test_finds_synonyms_on_word_boundaries():
+    matcher = SkillMatcher(TAXONOMY)
+    hits = matcher.find("Ran Postgres on K8s; wrote C++ and JavaScript,\nmachine   learning.")
+    assert [hit.skill_id for hit in hits] == ["postgresql", "kubernetes", "cpp", "javascript", "machine_learning"]
+    # "java" inside "javascript" and "ml" inside "html" are not whole words.
+    assert "java" not in matcher.skills("JavaScript and HTML")
+    assert "machine_learning" not in matcher.skills("JavaScript and HTML")
+
+def test_canonical_skills_feed_the_ats_score():
+    matcher = SkillMatcher(TAXONOMY)
+    resume = "Operated k8s clusters backed by postgres."
+    criteria = "Requirements: Kubernetes, PostgreSQL."
+    result = ATSEvaluator(resume, criteria, skill_matcher=matcher).evaluate()
+    assert sorted(result["keywords_matched"]) == ["kubernetes", "postgresql"]
+    assert result["keywords_missing"] == ["requirements"]
+    assert ATSEvaluator.evaluate_matrix([resume], [criteria], skill_matcher=matcher).result(0, 0) == result
+
+def test_default_taxonomy_loads_once():
+    assert load_skill_matcher() is load_skill_matcher()
+    assert "rest_api" in load_skill_matcher().skills("Designed RESTful APIs")
+
+def test_short_aliases_are_not_ordinary_words():
+    matcher = load_skill_matcher()
+    assert matcher.skills("we go to the node and ship containers, ts and tf files with hcl") == frozenset()
+    assert matcher.skills("Built services in Go and TS, trained models with TF and PyTorch") == {
+        "golang", "typescript", "tensorflow", "pytorch"
+    }
+
+def test_case_sensitive_forms_count_in_the_ats_score():
+    matcher = load_skill_matcher()
+    result = ATSEvaluator("Backend services in Go.", "Go developer; we go fast.", skill_matcher=matcher).evaluate()
+    assert "golang" in result["keywords_matched"]
+    assert "golang" not in ATSEvaluator("", "", skill_matcher=matcher).extract_keywords("we go to the node")
@@ -0,0 +1,75 @@
+import json
+import pstats
+import pytest
+from src import telemetry
+
+@pytest.fixture(autouse=True)
+def clean_telemetry():
+    telemetry.reset()
+    yield
+    telemetry.disable()
+    telemetry.reset()
+
+def test_disabled_telemetry_records_nothing():
+    assert telemetry.span("stage") is telemetry.NULL_SPAN
+    with telemetry.span("stage"):
+        telemetry.count("events")
+    assert telemetry.snapshot() == {"stages": [], "counters": []}
+
+def test_spans_and_counters_are_recorded():
+    telemetry.enable()
+
+    @telemetry.timed("decorated")
+    def work(value):
+        return value * 2
+
+    assert work(21) == 42 and work(1) == 2 and work.__name__ == "work"
+    for _ in range(3):
+        with telemetry.span("llm_request", provider="ChatGPT"):
+            pass
+    telemetry.count("http_fetch_bytes", 1500)
+    telemetry.count("http_fetch_bytes", 500)
+    telemetry.count("llm_cache_lookups", result="hit")
+
+    data = telemetry.snapshot()
+    stages = {(item["stage"], tuple(item["labels"].items())): item for item in data["stages"]}
+    assert stages[("llm_request", (("provider", "ChatGPT"),))]["count"] == 3
+    assert stages[("decorated", ())]["count"] == 2
+    counters = {(item["name"], tuple(item["labels"].items())): item["value"] for item in data["counters"]}
+    assert counters[("http_fetch_bytes", ())] == 2000
+    assert counters[("llm_cache_lookups", (("result", "hit"),))] == 1
+
+def test_prometheus_and_json_export(tmp_path):
+    telemetry.enable()
+    with telemetry.span("fetch_webpage"):
+        pass
+    telemetry.count("pages_parsed", backend='st"ream')
+    telemetry.write_prometheus(str(tmp_path / "autobot.prom"))
+    telemetry.write_json(str(tmp_path / "autobot.json"))
+
+    text = (tmp_path / "autobot.prom").read_text()
+    assert "# TYPE autobot_stage_duration_seconds histogram" in text
+    assert 'autobot_stage_duration_seconds_bucket{stage="fetch_webpage",le="+Inf"} 1' in text
+    assert 'autobot_stage_duration_seconds_count{stage="fetch_webpage"} 1' in text
+    assert 'autobot_pages_parsed_total{backend="st\\"ream"} 1' in text
+    assert json.loads((tmp_path / "autobot.json").read_text())["stages"][0]["stage"] == "fetch_webpage"
+
+def test_profiles_are_written_per_outer_stage(tmp_path):
+    telemetry.enable(profile_dir=str(tmp_path))
+    with telemetry.span("outer"):
+        with telemetry.span("inner"):
+            sum(range(1000))
+    paths = telemetry.dump_profiles()
+    assert [path.rsplit("/", 1)[1] for path in paths] == ["outer.prof"]
+    assert pstats.Stats(paths[0]).total_calls > 0
+
+def test_pipeline_stages_are_instrumented(make_pdf):
+    from src.resume_parser import ResumeParser
+    from src.ats_evaluator import ATSEvaluator
+    telemetry.enable()
+    parser = ResumeParser(make_pdf("resume.pdf", [["Name: Ada Lovelace", "Email: ada@example.com"], ["Python"]]))
+    ATSEvaluator(parser.extract_text(), "Python and SQL").evaluate()
+
+    data = telemetry.snapshot()
+    assert {item["stage"] for item in data["stages"]} >= {"pdf_extract_text", "ats_score"}
+    assert {item["name"]: item["value"] for item in data["counters"]}["pdf_pages_parsed"] == 2
@@ -0,0 +1,31 @@
+from src.text_pipeline import TextNormalizer, ENGLISH_STOPWORDS, singularize
+from src.ats_evaluator import ATSEvaluator
+
+def test_ngrams_and_plurals():
+    normalizer = TextNormalizer(stopwords=ENGLISH_STOPWORDS, ngram_range=(1, 2), singularize_plurals=True)
+    keywords = normalizer.keywords("Experience with REST APIs and machine learning on Kubernetes.")
+    assert {"rest api", "machine learning", "api", "kubernetes"} <= keywords
+    assert "api and" not in keywords and "with rest" not in keywords
+    assert singularize("technologies") == "technology"
+    assert singularize("analysis") == "analysis"
+
+def test_memoization_is_bounded():
+    normalizer = TextNormalizer(cache_size=2)
+    first = normalizer.keywords("python django")
+    assert normalizer.keywords("python django") is first
+    assert (normalizer.hits, normalizer.misses) == (1, 1)
+    normalizer.keywords("java")
+    normalizer.keywords("rust")
+    assert len(normalizer._cache) == 2
+    normalizer.keywords("python django")
+    assert normalizer.misses == 4
+
+def test_evaluator_with_phrase_matching():
+    normalizer = TextNormalizer(stopwords=ENGLISH_STOPWORDS, ngram_range=(1, 2), singularize_plurals=True)
+    resume = "Built REST APIs and machine learning pipelines."
+    criteria = "Requirements: REST API design, machine learning."
+    result = ATSEvaluator(resume, criteria, normalizer).evaluate()
+    assert "rest api" in result["keywords_matched"]
+    assert "machine learning" in result["keywords_matched"]
+    matrix = ATSEvaluator.evaluate_matrix([resume], [criteria], normalizer)
+    assert matrix.result(0, 0) == result
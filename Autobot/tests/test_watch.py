@@ -0,0 +1,126 @@
+import sys
+import time
+import threading
+import pytest
+from src.ats_evaluator import ATSEvaluator
+from src.watch import IncrementalRanker, InotifyWatcher, PollingWatcher, ScoreTable, watch
+
+def tokens(text):
+    return ATSEvaluator("", "").extract_keywords(text.lower())
+
+def test_a_resume_edit_only_rescores_jobs_sharing_the_changed_keywords():
+    table = ScoreTable()
+    table.set_job("backend", tokens("python docker kubernetes"))
+    table.set_job("frontend", tokens("react typescript css"))
+    assert [update.job for update in table.set_resume("alice", tokens("python react"))] == ["backend", "frontend"]
+
+    updates = table.set_resume("alice", tokens("python react docker"))
+    assert [update.job for update in updates] == ["backend"]
+    assert table.set_resume("alice", tokens("docker python react")) == []
+
+    expected = ATSEvaluator("python react docker", "python docker kubernetes").evaluate()
+    assert table.scores[("alice", "backend")]["ats_score"] == expected["ats_score"]
+    assert table.scores[("alice", "frontend")] == ATSEvaluator("python react", "react typescript css").evaluate()
+
+def test_job_changes_rescore_their_column_and_removals_drop_pairs():
+    table = ScoreTable()
+    table.set_resume("alice", tokens("python docker"))
+    table.set_resume("bob", tokens("react css"))
+    table.set_job("backend", tokens("python"))
+    assert table.set_job("backend", tokens("python")) == []
+
+    updates = table.set_job("backend", tokens("python react"))
+    assert {(update.resume, update.result["ats_score"]) for update in updates} == {("alice", 50.0), ("bob", 50.0)}
+    assert table.ranking("backend") == [("alice", 50.0), ("bob", 50.0)]
+    # "python" is no longer indexed for the removed job, so editing it in a resume touches nothing.
+    assert [update.result for update in table.remove_job("backend")] == [None, None]
+    assert table.set_resume("alice", tokens("docker")) == [] and table.scores == {}
+
+def test_scores_are_weighted_with_corpus_statistics():
+    from src.corpus_stats import CorpusStats
+    stats = CorpusStats()
+    for posting in ["Team player with Kubernetes.", "Team player, Python.", "Team player, Java."]:
+        stats.add_text(posting)
+    table = ScoreTable(stats)
+    table.set_job("ops", tokens("Team player, Kubernetes."))
+    table.set_resume("alice", tokens("Kubernetes"))
+    expected = ATSEvaluator("Kubernetes", "Team player, Kubernetes.", corpus_stats=stats).evaluate()
+    assert table.scores[("alice", "ops")] == expected
+
+def test_ranker_maps_file_changes_to_table_updates(tmp_path):
+    resumes, jobs = tmp_path / "resumes", tmp_path / "jobs"
+    resumes.mkdir()
+    jobs.mkdir()
+    (resumes / "alice.txt").write_text("Python and Docker")
+    (resumes / "bob.txt").write_text("React and CSS")
+    (jobs / "backend.txt").write_text("Python, Docker, Kubernetes")
+    (jobs / "frontend.txt").write_text("React, TypeScript")
+    ranker = IncrementalRanker(str(resumes), str(jobs), use_cache=False)
+    assert len(ranker.load()) == 4
+
+    alice = str(resumes / "alice.txt")
+    (resumes / "alice.txt").write_text("Python, Docker and Kubernetes")
+    assert [(update.resume, update.job, update.result["ats_score"]) for update in ranker.refresh([alice])] == \
+        [(alice, "backend.txt", 100.0)]
+
+    (jobs / "data.txt").write_text("Python and SQL")
+    assert {update.resume for update in ranker.refresh([str(jobs / "data.txt")])} == {alice, str(resumes / "bob.txt")}
+
+    (resumes / "bob.txt").unlink()
+    removed = ranker.refresh([str(resumes / "bob.txt")])
+    assert {update.job for update in removed} == {"backend.txt", "frontend.txt", "data.txt"}
+    assert all(update.result is None for update in removed)
+    assert set(ranker.table.resumes) == {alice}
+
+def test_ranker_counts_skill_synonyms_with_the_taxonomy(tmp_path):
+    from src.skill_matcher import load_skill_matcher
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "alice.txt").write_text("Ran k8s clusters.")
+    (tmp_path / "job.txt").write_text("Kubernetes")
+    ranker = IncrementalRanker(str(resumes), str(tmp_path / "job.txt"), use_cache=False, skill_matcher=load_skill_matcher())
+    assert [update.result["keywords_matched"] for update in ranker.load()] == [["kubernetes"]]
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def watcher_types():
+    types = [PollingWatcher]
+    if sys.platform.startswith("linux"):
+        types.append(InotifyWatcher)
+    return types
+
+@pytest.mark.parametrize("watcher_type", watcher_types())
+def test_watch_loop_reports_edits(tmp_path, watcher_type):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    job = tmp_path / "job.txt"
+    job.write_text("Python, Docker")
+    (resumes / "alice.txt").write_text("Python")
+    ranker = IncrementalRanker(str(resumes), str(job), use_cache=False)
+    arguments = ([str(resumes), str(job)], 0.02) if watcher_type is PollingWatcher else ([str(resumes), str(job)],)
+    watcher = watcher_type(*arguments)
+
+    updates, stop = [], threading.Event()
+    thread = threading.Thread(target=watch, args=(ranker, updates.extend, watcher, stop, 0.05, 0.02))
+    alice, bob = str(resumes / "alice.txt"), str(resumes / "new" / "bob.txt")
+    thread.start()
+    try:
+        assert wait_until(lambda: len(updates) == 1)
+        (resumes / "alice.txt").write_text("Python and Docker")
+        assert wait_until(lambda: len(updates) == 2)
+        assert (updates[1].resume, updates[1].result["ats_score"], updates[1].result["keywords_missing"]) == (alice, 100.0, [])
+        # A file in a new directory may be read before it is written; its write is reported as well.
+        (resumes / "new").mkdir()
+        (resumes / "new" / "bob.txt").write_text("Docker")
+        assert wait_until(lambda: updates[-1].resume == bob and updates[-1].result["ats_score"] == 50.0)
+    finally:
+        stop.set()
+        thread.join(5)
+        watcher.close()
+    assert ranker.table.scores[(bob, "job.txt")] == updates[-1].result